@@ -33,6 +33,11 @@ def _create_parser():
                         const=_print_version, dest="func")
     parser.add_argument("--configuration", type=Path,
                         help="Use the given configuration path instead of the included one.")
+    parser.add_argument("--game-description-cache", type=Path,
+                        help="Cache the decoded game databases in the given folder. "
+                             "Defaults to a folder in the user's cache dir.")
+    parser.add_argument("--no-game-description-cache", action="store_true",
+                        help="Always decode the game databases, without caching them on disk.")
 
     return parser
 
@@ -41,6 +46,14 @@ def _run_args(parser, args):
     if args.configuration is not None:
         randovania.CONFIGURATION_FILE_PATH = args.configuration.absolute()
 
+    from randovania.game_description import default_database
+    if args.no_game_description_cache:
+        default_database.set_cache_dir(None)
+    elif args.game_description_cache is not None:
+        default_database.set_cache_dir(args.game_description_cache.absolute())
+    elif default_database.CACHE_DIR_ENV_VAR not in os.environ:
+        default_database.set_cache_dir(default_database.default_cache_dir())
+
     if args.func is None:
         parser.print_help()
         raise SystemExit(1)
@@ -1,5 +1,9 @@
+import contextlib
 import statistics
 from argparse import ArgumentParser
+from pathlib import Path
+
+from randovania.lib import instrumentation_lib
 
 
 def add_debug_argument(parser: ArgumentParser):
@@ -19,6 +23,32 @@ def add_validate_argument(parser: ArgumentParser):
                        help="After generating a layout, don't validate if it's possible.")
 
 
+def add_instrumentation_arguments(parser: ArgumentParser):
+    parser.add_argument("--instrumentation-output", type=Path,
+                        help="Record how long each phase took and how often it happened, writing it to this file.")
+    parser.add_argument("--instrumentation-format", choices=instrumentation_lib.OUTPUT_FORMATS, default="json",
+                        help="The format of the instrumentation output. "
+                             "'speedscope' can be opened in https://www.speedscope.app")
+
+
+@contextlib.contextmanager
+def instrumentation_from_args(args, name: str):
+    """
+    Collects instrumentation while inside the context, if requested via the arguments.
+    :param args: Arguments of a parser that used `add_instrumentation_arguments`.
+    :param name: Name used for the collected profile.
+    :return:
+    """
+    if args.instrumentation_output is None:
+        yield
+        return
+
+    with instrumentation_lib.collecting() as collector:
+        yield
+
+    collector.write(args.instrumentation_output, args.instrumentation_format, name)
+
+
 def print_report_multiple_times(total_times: list[float]):
     print(
         "Result after doing {repeat} times:\n"
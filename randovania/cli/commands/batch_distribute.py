@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import functools
+import gzip
+import json
 import math
+import os
 import time
 import typing
 from argparse import ArgumentParser
-from concurrent.futures import ProcessPoolExecutor, Future, CancelledError
+from concurrent.futures import Future, FIRST_COMPLETED, wait
 from pathlib import Path
 
 from randovania.cli import cli_lib
-from randovania.interface_common import sleep_inhibitor
+from randovania.interface_common import generation_pool, sleep_inhibitor
+from randovania.interface_common.generation_pool import GenerationPool, GenerationRequest
 from randovania.resolver.exceptions import GenerationFailure
 
 if typing.TYPE_CHECKING:
@@ -33,6 +36,7 @@ def batch_distribute_helper(base_params: GeneratorParameters,
                             timeout: int,
                             validate: bool,
                             output_dir: Path,
+                            compress: bool = False,
                             ) -> float:
     from randovania.generator import generator
     permalink = get_generator_params(base_params, seed_number)
@@ -45,10 +49,76 @@ def batch_distribute_helper(base_params: GeneratorParameters,
     ))
     delta_time = time.perf_counter() - start_time
 
-    description.save_to_file(output_dir.joinpath(f"{seed_number}.{description.file_extension()}"))
+    output_file = output_dir.joinpath(f"{seed_number}.{description.file_extension()}")
+    if compress:
+        with gzip.open(output_file.with_name(f"{output_file.name}.gz"), "wt") as open_file:
+            json.dump(description.as_json(), open_file)
+    else:
+        description.save_to_file(output_file)
     return delta_time
 
 
+def batch_distribute_record(request: GenerationRequest, output_dir: Path, compress: bool) -> dict:
+    """
+    Runs `batch_distribute_helper`, in a worker process of a GenerationPool, and describes how it went.
+    :return: The manifest record for the seed, without the permalink.
+    """
+    from randovania.resolver import resolver
+
+    record = {
+        "seed": request.seed_number,
+        "status": "success",
+        "time": None,
+        "attempts": 0,
+        "reason": None,
+    }
+    # The counter is shared by everything in this worker, so don't count the previous seeds
+    resolver.set_attempts(0)
+    start_time = time.perf_counter()
+    try:
+        record["time"] = batch_distribute_helper(
+            generation_pool.worker_generator_params(request), request.seed_number,
+            request.timeout, request.validate_after_generation, output_dir, compress,
+        )
+    except GenerationFailure as e:
+        record["status"] = "failed"
+        record["reason"] = f"{e}: {e.source}"
+    except Exception as e:
+        record["status"] = "error"
+        record["reason"] = f"{e} ({type(e).__name__})"
+
+    if record["time"] is None:
+        record["time"] = time.perf_counter() - start_time
+    record["attempts"] = resolver.get_attempts()
+    return record
+
+
+def read_manifest_seeds(manifest: Path, retry_errors: bool = False) -> set[int]:
+    """
+    Reads which seeds are already in the given manifest. A line that was only partially written is ignored.
+    :param manifest: A JSONL file, as written by batch-distribute.
+    :param retry_errors: If set, seeds whose last record is an unexpected error aren't included.
+    :return:
+    """
+    statuses = {}
+    if not manifest.is_file():
+        return set()
+
+    with manifest.open() as manifest_file:
+        for line in manifest_file:
+            try:
+                record = json.loads(line)
+                statuses[record["seed"]] = record.get("status")
+            except (ValueError, KeyError):
+                continue
+
+    return {
+        seed
+        for seed, status in statuses.items()
+        if not (retry_errors and status == "error")
+    }
+
+
 def batch_distribute_command_logic(args):
     from randovania.layout.permalink import Permalink
 
@@ -56,16 +126,28 @@ def batch_distribute_command_logic(args):
 
     timeout: int = args.timeout
     validate: bool = args.validate
+    compress: bool = args.compress
 
     output_dir: Path = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    seed_count = args.seed_count
-    num_digits = math.ceil(math.log10(seed_count + 1))
-    number_format = "[{0:" + str(num_digits) + "d}/{1}] "
     base_permalink = Permalink.from_str(args.permalink)
     base_params = base_permalink.parameters
 
+    manifest: Path | None = args.manifest
+    all_seeds = range(base_params.seed_number, base_params.seed_number + args.seed_count)
+    if manifest is not None:
+        done_seeds = read_manifest_seeds(manifest, args.retry_errors)
+        seeds_to_run = [seed for seed in all_seeds if seed not in done_seeds]
+        if len(seeds_to_run) != len(all_seeds):
+            print(f"Skipping {len(all_seeds) - len(seeds_to_run)} seeds already in {manifest}.")
+    else:
+        seeds_to_run = list(all_seeds)
+
+    seed_count = len(seeds_to_run)
+    num_digits = math.ceil(math.log10(seed_count + 1))
+    number_format = "[{0:" + str(num_digits) + "d}/{1}] "
+
     def get_permalink_text(seed: int) -> str:
         return Permalink.from_parameters(get_generator_params(base_params, seed)).as_base64_str
 
@@ -75,34 +157,59 @@ def batch_distribute_command_logic(args):
         front = number_format.format(finished_count, seed_count)
         print(f"{front} [ {get_permalink_text(seed)} ] {msg}")
 
-    all_futures: list[Future] = []
-
-    def with_result(seed: int, r: Future):
-        try:
-            report_update(seed, f"Finished seed in {r.result()} seconds.")
-        except GenerationFailure as e:
-            report_update(seed, f"Failed to generate seed: {e}\nReason: {e.source}")
-        except CancelledError:
-            nonlocal finished_count
-            finished_count += 1
-        except Exception as e:
-            report_update(seed, f"Failed to generate seed: {e} ({type(e)})")
-        except KeyboardInterrupt:
-            report_update(seed, f"Interrupt requested.")
-            for f in all_futures:
-                f.cancel()
+    manifest_file = None
+    if manifest is not None:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest_file = manifest.open("a")
+
+    def with_record(record: dict):
+        if record["status"] == "success":
+            report_update(record["seed"], f"Finished seed in {record['time']} seconds.")
+        else:
+            report_update(record["seed"], f"Failed to generate seed: {record['reason']}")
+
+        if manifest_file is not None:
+            record = {"seed": record["seed"], "permalink": get_permalink_text(record["seed"]), **record}
+            manifest_file.write(json.dumps(record) + "\n")
+            manifest_file.flush()
+
+    # Only keep a few seeds submitted at once, so the number of seeds doesn't affect memory usage
+    process_count: int = args.process_count or os.cpu_count() or 1
+    max_in_flight: int = args.max_in_flight or 2 * process_count
+    pending_seeds = iter(seeds_to_run)
+    in_flight: dict[Future, int] = {}
 
     try:
-        with ProcessPoolExecutor(max_workers=args.process_count) as pool, sleep_inhibitor.get_inhibitor():
-            for seed_number in range(base_params.seed_number, base_params.seed_number + args.seed_count):
-                result = pool.submit(
-                    batch_distribute_helper,
-                    base_params, seed_number, timeout, validate, output_dir,
-                )
-                result.add_done_callback(functools.partial(with_result, seed_number))
-                all_futures.append(result)
-    except KeyboardInterrupt:
-        pass
+        with GenerationPool(process_count, presets=base_params.presets) as pool, sleep_inhibitor.get_inhibitor():
+            try:
+                while True:
+                    for seed_number in pending_seeds:
+                        request = pool.request_for(get_generator_params(base_params, seed_number),
+                                                   validate_after_generation=validate, timeout=timeout)
+                        future = pool.submit_call(batch_distribute_record, request, output_dir, compress)
+                        in_flight[future] = seed_number
+                        if len(in_flight) >= max_in_flight:
+                            break
+
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        seed_number = in_flight.pop(future)
+                        try:
+                            with_record(future.result())
+                        except Exception as e:
+                            with_record({"seed": seed_number, "status": "error", "time": None, "attempts": 0,
+                                         "reason": f"{e} ({type(e).__name__})"})
+
+            except KeyboardInterrupt:
+                print("Interrupt requested.")
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    finally:
+        if manifest_file is not None:
+            manifest_file.close()
 
 
 def add_batch_distribute_command(sub_parsers):
@@ -118,6 +225,23 @@ def add_batch_distribute_command(sub_parsers):
         type=int,
         default=90,
         help="How many seconds to wait before timing out a generation/validation.")
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Append a JSON line with the result of each seed to this file. "
+             "Seeds already in the file are skipped, so an interrupted run can be resumed.")
+    parser.add_argument(
+        "--retry-errors",
+        action="store_true",
+        help="When resuming from a manifest, run again the seeds that failed with an unexpected error.")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="How many seeds to submit to the processes at once. Defaults to twice the process count.")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Save the layouts compressed with gzip, as .rdvgame.gz files.")
     cli_lib.add_validate_argument(parser)
     parser.add_argument(
         "seed_count",
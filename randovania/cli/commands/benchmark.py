@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+from randovania.games.game import RandovaniaGame
+from randovania.lib import enum_lib, json_lib
+
+# Metrics where a higher value means a performance regression
+_COMPARED_METRICS = (
+    "generation_time", "dock_weakness_time", "resolve_time", "serialization_time", "peak_rss_mib",
+    "resolver_attempts", "generator_reach_expansions", "resolver_reaches",
+)
+# Ignore differences smaller than this, for each metric, as these are just noise
+_MINIMUM_DIFFERENCE = {
+    "generation_time": 0.1,
+    "dock_weakness_time": 0.1,
+    "resolve_time": 0.1,
+    "serialization_time": 0.01,
+    "peak_rss_mib": 5.0,
+}
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports it in kilobytes, macOS in bytes
+    if sys.platform == "darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+def case_key(case: dict) -> str:
+    return f"{case['game']}/{case['preset']}/{case['seed']}"
+
+
+def all_cases(games: list[RandovaniaGame], seeds: list[int]) -> list[dict]:
+    """
+    The matrix of seeds and bundled presets of the given games.
+    :param games:
+    :param seeds:
+    :return:
+    """
+    return [
+        {"game": game.value, "preset": preset["path"], "seed": seed}
+        for game in games
+        for preset in game.data.presets
+        for seed in seeds
+    ]
+
+
+def benchmark_case(case: dict, timeout: int | None) -> dict:
+    """
+    Generates, validates and serializes the given case, measuring each step.
+    Meant to be run in a fresh process, so the peak memory usage is only of this case.
+    :param case: A dict with game, preset and seed.
+    :param timeout: Abort validation after this many seconds.
+    :return: The case, with the measurements or the error that happened.
+    """
+    from randovania.game_description import default_database
+    from randovania.generator import generator
+    from randovania.layout.generator_parameters import GeneratorParameters
+    from randovania.layout.layout_description import LayoutDescription
+    from randovania.layout.versioned_preset import VersionedPreset
+    from randovania.lib import instrumentation_lib
+    from randovania.resolver import resolver
+
+    result = dict(case)
+    game = RandovaniaGame(case["game"])
+    preset = VersionedPreset.from_file_sync(game.data_path.joinpath("presets", case["preset"])).get_preset()
+
+    # Reading the database isn't what's being measured
+    default_database.game_description_for(game)
+
+    try:
+        with instrumentation_lib.collecting() as collector:
+            start_time = time.perf_counter()
+            description = asyncio.run(generator.generate_and_validate_description(
+                generator_params=GeneratorParameters(case["seed"], True, [preset]),
+                status_update=None,
+                validate_after_generation=False,
+                timeout=None,
+            ))
+            result["generation_time"] = time.perf_counter() - start_time
+
+        phases = collector.phase_summary()
+        result["dock_weakness_time"] = phases.get("distribute_post_fill_weaknesses", {}).get("total", 0.0)
+        result["generator_reach_expansions"] = phases.get("generator_reach_expansion", {}).get("count", 0)
+
+        start_time = time.perf_counter()
+        data = json.dumps(description.as_json())
+        LayoutDescription.from_json_dict(json.loads(data))
+        result["serialization_time"] = time.perf_counter() - start_time
+        result["hash"] = description.shareable_hash
+
+        with instrumentation_lib.collecting() as collector:
+            start_time = time.perf_counter()
+            final_state = asyncio.run(asyncio.wait_for(
+                resolver.resolve(
+                    configuration=preset.configuration,
+                    patches=description.all_patches[0],
+                ),
+                timeout,
+            ))
+            result["resolve_time"] = time.perf_counter() - start_time
+
+        result["possible"] = final_state is not None
+        result["resolver_attempts"] = collector.counters.get("resolver_attempts", 0)
+        result["resolver_reaches"] = collector.phase_summary().get("resolver_reach", {}).get("count", 0)
+
+    except asyncio.TimeoutError:
+        result["error"] = f"Validation timed out after {timeout} seconds"
+
+    except Exception as e:
+        result["error"] = f"{e} ({type(e).__name__})"
+
+    result["peak_rss_mib"] = _peak_rss_mib()
+    return result
+
+
+def _benchmark_case_star(arguments: tuple[dict, int | None]) -> dict:
+    return benchmark_case(*arguments)
+
+
+def _format_value(value: float | int) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
+
+
+def compare_with_baseline(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Checks which results got worse than the baseline by more than the given threshold.
+    :param results:
+    :param baseline:
+    :param threshold: The accepted relative increase, with 0.2 meaning 20%.
+    :return: A description of each regression.
+    """
+    baseline_by_key = {case_key(case): case for case in baseline}
+    regressions = []
+
+    for case in results:
+        key = case_key(case)
+        old_case = baseline_by_key.get(key)
+        if old_case is None:
+            continue
+
+        if "error" in case and "error" not in old_case:
+            regressions.append(f"{key}: failed with {case['error']}")
+            continue
+
+        if "hash" in old_case and "hash" in case and old_case["hash"] != case["hash"]:
+            regressions.append(f"{key}: generated a different game ({old_case['hash']} -> {case['hash']})")
+
+        for metric in _COMPARED_METRICS:
+            old_value, new_value = old_case.get(metric), case.get(metric)
+            if old_value is None or new_value is None:
+                continue
+
+            if (new_value > old_value * (1 + threshold)
+                    and new_value - old_value > _MINIMUM_DIFFERENCE.get(metric, 0)):
+                regressions.append(f"{key}: {metric} went from {_format_value(old_value)} "
+                                   f"to {_format_value(new_value)}")
+
+    return regressions
+
+
+def _format_result(case: dict) -> str:
+    if "error" in case:
+        return f"{case_key(case)}: {case['error']}"
+
+    return (f"{case_key(case)}: {case['hash']}, generation {case['generation_time']:.3f}s "
+            f"(docks {case['dock_weakness_time']:.3f}s), resolve {case['resolve_time']:.3f}s "
+            f"with {case['resolver_attempts']} attempts, serialization {case['serialization_time']:.3f}s")
+
+
+def benchmark_command_logic(args):
+    games = args.game or list(enum_lib.iterate_enum(RandovaniaGame))
+    seeds = list(range(args.seed_number, args.seed_number + args.seed_count))
+    cases = all_cases(games, seeds)
+
+    results = []
+    number_format = "[{0:" + str(len(str(len(cases)))) + "d}/{1}] "
+
+    # A new process for each case, so the peak memory usage of one doesn't hide the others
+    with multiprocessing.Pool(args.process_count, maxtasksperchild=1) as pool:
+        for result in pool.imap_unordered(_benchmark_case_star, [(case, args.timeout) for case in cases]):
+            results.append(result)
+            print(number_format.format(len(results), len(cases)) + _format_result(result))
+
+    results.sort(key=lambda it: (it["game"], it["preset"], it["seed"]))
+    if args.output is not None:
+        json_lib.write_path(args.output, results)
+
+    if args.baseline is not None:
+        regressions = compare_with_baseline(results, json_lib.read_path(args.baseline), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions compared to {args.baseline}:")
+            for regression in regressions:
+                print(f"* {regression}")
+            return 1
+        print(f"No regressions compared to {args.baseline}.")
+
+    return 1 if any("error" in result for result in results) else 0
+
+
+def add_benchmark_command(sub_parsers):
+    parser: ArgumentParser = sub_parsers.add_parser(
+        "benchmark",
+        help="Generates and validates seeds with all bundled presets, measuring how long each step takes"
+    )
+    parser.add_argument("--game", type=RandovaniaGame, choices=list(RandovaniaGame), nargs="*",
+                        help="Only use the presets of these games. Defaults to all.")
+    parser.add_argument("--seed-number", type=int, default=1000, help="The first seed number.")
+    parser.add_argument("--seed-count", type=int, default=3, help="How many seeds to use for each preset.")
+    parser.add_argument("--process-count", type=int, default=1,
+                        help="How many processes to use. More than one makes the timings less reliable.")
+    parser.add_argument("--timeout", type=int, default=600, help="How many seconds to wait for each validation.")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file, to use as a baseline.")
+    parser.add_argument("--baseline", type=Path, help="Compare the results with the ones in this JSON file.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="How much worse than the baseline is considered a regression. Defaults to 0.2 (20%%).")
+    parser.set_defaults(func=benchmark_command_logic)
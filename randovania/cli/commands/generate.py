@@ -33,17 +33,18 @@ def common_generate_logic(args, permalink: Permalink):
     total_times = []
 
     layout_description: LayoutDescription | None = None
-    for _ in range(args.repeat):
-        before = time.perf_counter()
-        layout_description = asyncio.run(
-            generator.generate_and_validate_description(generator_params=permalink.parameters,
-                                                        status_update=status_update,
-                                                        validate_after_generation=args.validate,
-                                                        timeout=None, **extra_args))
-        after = time.perf_counter()
-        total_times.append(after - before)
-        shareable_hashes.append(layout_description.shareable_hash)
-        print(f"Took {total_times[-1]:.3f} seconds. Hash: {shareable_hashes[-1]}")
+    with cli_lib.instrumentation_from_args(args, f"Generate {permalink.as_base64_str}"):
+        for _ in range(args.repeat):
+            before = time.perf_counter()
+            layout_description = asyncio.run(
+                generator.generate_and_validate_description(generator_params=permalink.parameters,
+                                                            status_update=status_update,
+                                                            validate_after_generation=args.validate,
+                                                            timeout=None, **extra_args))
+            after = time.perf_counter()
+            total_times.append(after - before)
+            shareable_hashes.append(layout_description.shareable_hash)
+            print(f"Took {total_times[-1]:.3f} seconds. Hash: {shareable_hashes[-1]}")
 
     assert layout_description is not None
     layout_description.save_to_file(args.output_file)
@@ -72,6 +73,7 @@ def generate_from_preset_logic(args):
 def common_generate_arguments(parser: ArgumentParser):
     cli_lib.add_debug_argument(parser)
     cli_lib.add_validate_argument(parser)
+    cli_lib.add_instrumentation_arguments(parser)
     parser.add_argument("--repeat", default=1, type=int, help="Generate multiple times. Used for benchmarking.")
     parser.add_argument("--no-retry", default=False, action="store_true", help="Disable retries in the generation.")
     parser.add_argument("--status-update", default=False, action="store_true", help="Print the status updates.")
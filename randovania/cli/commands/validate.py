@@ -31,18 +31,19 @@ def validate_command_logic(args):
     total_times = []
 
     final_state_by_resolve = None
-    for _ in range(args.repeat):
-        before = time.perf_counter()
-        final_state_by_resolve = asyncio.run(resolver.resolve(
-            configuration=configuration,
-            patches=patches
-        ))
-        after = time.perf_counter()
-        total_times.append(after - before)
-        print("Took {:.3f} seconds. Game is {}.".format(
-            total_times[-1],
-            "possible" if final_state_by_resolve is not None else "impossible")
-        )
+    with cli_lib.instrumentation_from_args(args, f"Validate {args.layout_file.name}"):
+        for _ in range(args.repeat):
+            before = time.perf_counter()
+            final_state_by_resolve = asyncio.run(resolver.resolve(
+                configuration=configuration,
+                patches=patches
+            ))
+            after = time.perf_counter()
+            total_times.append(after - before)
+            print("Took {:.3f} seconds. Game is {}.".format(
+                total_times[-1],
+                "possible" if final_state_by_resolve is not None else "impossible")
+            )
     if args.repeat > 1:
         cli_lib.print_report_multiple_times(total_times)
 
@@ -59,6 +60,7 @@ def add_validate_command(sub_parsers):
         help="Validate a rdvgame file."
     )
     add_debug_argument(parser)
+    cli_lib.add_instrumentation_arguments(parser)
     parser.add_argument("--repeat", default=1, type=int, help="Validate multiple times. Used for benchmarking.")
     parser.add_argument(
         "layout_file",
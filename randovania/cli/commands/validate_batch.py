@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from randovania.interface_common import sleep_inhibitor
+
+_SUMMARY_FIELDS = ("layout", "result", "time", "attempts", "reason")
+
+
+def validate_batch_helper(layout_file: Path, timeout: int | None) -> dict:
+    """
+    Validates the given rdvgame, in a worker process.
+    The filtered game descriptions are cached per process, so each worker only creates them once for each preset.
+    :param layout_file:
+    :param timeout: Abort the validation after this many seconds.
+    :return: The summary entry for this layout.
+    """
+    from randovania.layout.layout_description import LayoutDescription
+    from randovania.resolver import resolver
+
+    entry = {
+        "layout": layout_file.name,
+        "result": "error",
+        "time": 0.0,
+        "attempts": 0,
+        "reason": None,
+    }
+
+    resolver.set_attempts(0)
+    start_time = time.perf_counter()
+    try:
+        description = LayoutDescription.from_file(layout_file)
+        if description.player_count != 1:
+            entry["result"] = "unsupported"
+            entry["reason"] = f"Layout has {description.player_count} players"
+            return entry
+
+        final_state_by_resolve = asyncio.run(asyncio.wait_for(
+            resolver.resolve(
+                configuration=description.get_preset(0).configuration,
+                patches=description.all_patches[0],
+            ),
+            timeout,
+        ))
+        entry["result"] = "possible" if final_state_by_resolve is not None else "impossible"
+
+    except asyncio.TimeoutError:
+        entry["result"] = "timeout"
+        entry["reason"] = f"Timed out after {timeout} seconds"
+
+    except Exception as e:
+        entry["reason"] = f"{e} ({type(e).__name__})"
+
+    finally:
+        entry["time"] = time.perf_counter() - start_time
+        entry["attempts"] = resolver.get_attempts()
+
+    return entry
+
+
+def write_summary(summary: list[dict], output_file: Path):
+    if output_file.suffix == ".csv":
+        with output_file.open("w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(summary)
+    else:
+        with output_file.open("w") as f:
+            json.dump(summary, f, indent=4)
+
+
+def validate_batch_command_logic(args):
+    from randovania.layout.layout_description import LayoutDescription
+
+    layout_dir: Path = args.layout_dir
+    extension = LayoutDescription.file_extension()
+    # Also include the layouts saved by batch-distribute --compress
+    all_layouts = sorted([*layout_dir.glob(f"*.{extension}"), *layout_dir.glob(f"*.{extension}.gz")])
+    if not all_layouts:
+        raise ValueError(f"No layouts found in {layout_dir}")
+
+    summary = []
+    number_format = "[{0:" + str(len(str(len(all_layouts)))) + "d}/{1}] "
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.process_count) as pool, sleep_inhibitor.get_inhibitor():
+            futures = [
+                pool.submit(validate_batch_helper, layout_file, args.timeout)
+                for layout_file in all_layouts
+            ]
+            for future in as_completed(futures):
+                entry = future.result()
+                summary.append(entry)
+                front = number_format.format(len(summary), len(all_layouts))
+                reason = f" ({entry['reason']})" if entry["reason"] is not None else ""
+                print(f"{front} {entry['layout']}: {entry['result']}{reason}, took {entry['time']:.3f} seconds "
+                      f"and {entry['attempts']} attempts.")
+
+    except KeyboardInterrupt:
+        print("Interrupt requested.")
+
+    summary.sort(key=lambda it: it["layout"])
+    if args.output is not None:
+        write_summary(summary, args.output)
+
+    possible_count = sum(1 for entry in summary if entry["result"] == "possible")
+    print(f"{possible_count} of {len(all_layouts)} layouts are possible.")
+    return 0 if possible_count == len(all_layouts) else 1
+
+
+def add_validate_batch_command(sub_parsers):
+    parser: ArgumentParser = sub_parsers.add_parser(
+        "validate-batch",
+        help="Validate all rdvgame files in a directory in parallel"
+    )
+    parser.add_argument("--process-count", type=int, help="How many processes to use. Defaults to CPU count.")
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=90,
+        help="How many seconds to wait before timing out a validation.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write a summary with the result, time and attempts for each layout. "
+             "Uses CSV if the file ends with .csv, JSON otherwise.")
+    parser.add_argument(
+        "layout_dir",
+        type=Path,
+        help="The directory with the rdvgame files to validate.")
+    parser.set_defaults(func=validate_batch_command_logic)
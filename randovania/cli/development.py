@@ -1,5 +1,6 @@
 from argparse import ArgumentParser
 
+from randovania.cli.commands.benchmark import add_benchmark_command
 from randovania.cli.commands.refresh_presets import add_refresh_presets_command
 
 __all__ = ["create_subparsers"]
@@ -12,6 +13,7 @@ def create_subparsers(sub_parsers):
     )
     sub_parsers = parser.add_subparsers(dest="command")
     add_refresh_presets_command(sub_parsers)
+    add_benchmark_command(sub_parsers)
 
     def check_command(args):
         if args.command is None:
@@ -5,6 +5,7 @@ from randovania.cli.commands.generate import add_generate_commands
 from randovania.cli.commands.patcher_data import add_patcher_data_command
 from randovania.cli.commands.permalink import add_permalink_command
 from randovania.cli.commands.validate import add_validate_command
+from randovania.cli.commands.validate_batch import add_validate_batch_command
 
 __all__ = ["create_subparsers"]
 
@@ -16,6 +17,7 @@ def create_subparsers(sub_parsers):
     )
     sub_parsers = parser.add_subparsers(dest="command")
     add_validate_command(sub_parsers)
+    add_validate_batch_command(sub_parsers)
     add_generate_commands(sub_parsers)
     add_patcher_data_command(sub_parsers)
     add_batch_distribute_command(sub_parsers)
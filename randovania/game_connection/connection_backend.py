@@ -18,6 +18,15 @@ from randovania.games.prime3.patcher import corruption_dol_versions
 
 PermanentPickups = tuple[tuple[str, PickupEntry], ...]
 
+# How long to wait between updates. Right after something happens the game is checked again quickly,
+# backing off to the maximum while nothing changes.
+MINIMUM_UPDATE_INTERVAL = 0.5
+MAXIMUM_UPDATE_INTERVAL = 2.5
+
+# While the inventory change probe is unchanged, the full inventory is still read once in this many seconds,
+# for changes the probe doesn't see such as ammo being used.
+INVENTORY_MAX_AGE = 10.0
+
 
 class ConnectionBackend(ConnectionBase):
     executor: MemoryOperationExecutor
@@ -34,6 +43,12 @@ class ConnectionBackend(ConnectionBase):
     # Messages
     message_cooldown: float = 0.0
 
+    # Polling
+    update_interval: float = MAXIMUM_UPDATE_INTERVAL
+    _had_activity: bool = False
+    _inventory_probe: bytes | None = None
+    _inventory_age: float = 0.0
+
     # Multiworld
     _expected_game: RandovaniaGame | None
     _permanent_pickups: PermanentPickups
@@ -122,13 +137,24 @@ class ConnectionBackend(ConnectionBase):
             if first_ops_result.get(read_op) == connectors.version.build_string[:4]
         ]
 
-        for connector in possible_connectors:
-            try:
-                is_version = await connector.is_this_version(self.executor)
-            except (RuntimeError, MemoryOperationException) as e:
-                return None
+        if not possible_connectors:
+            return None
 
-            if is_version:
+        # Check the full build string of all candidates at once, instead of one round-trip for each
+        build_string_ops = {
+            connector: MemoryOperation(connector.version.build_string_address,
+                                       read_byte_count=len(connector.version.build_string))
+            for connector in possible_connectors
+        }
+        try:
+            build_strings = await self.executor.perform_memory_operations(
+                list(dict.fromkeys(build_string_ops.values()))
+            )
+        except (RuntimeError, MemoryOperationException) as e:
+            return None
+
+        for connector, op in build_string_ops.items():
+            if build_strings.get(op) == connector.version.build_string:
                 self.logger.info(f"identified game as {connector.description()}")
                 return connector
 
@@ -142,8 +168,27 @@ class ConnectionBackend(ConnectionBase):
         self.logger.info("num permanent pickups: %d", len(pickups))
         self._permanent_pickups = pickups
 
-    async def update_current_inventory(self):
-        self._inventory = await self.connector.get_inventory(self.executor)
+    async def update_current_inventory(self, dt: float = 0.0):
+        """
+        Reads the inventory from the game. During multiworld sessions the full read is skipped while the
+        connector's inventory change probe is the same as the last time, for up to `INVENTORY_MAX_AGE` seconds.
+        :param dt: How many seconds since the last call.
+        """
+        self._inventory_age += dt
+
+        probe = None
+        if self._expected_game is not None:
+            probe = await self.connector.inventory_change_probe(self.executor)
+            if probe is not None and probe == self._inventory_probe and self._inventory_age < INVENTORY_MAX_AGE:
+                return
+
+        inventory = await self.connector.get_inventory(self.executor)
+        if inventory != self._inventory:
+            self._had_activity = True
+
+        self._inventory = inventory
+        self._inventory_probe = probe
+        self._inventory_age = 0.0
 
     async def _multiworld_interaction(self):
         if self._expected_game is None:
@@ -154,11 +199,14 @@ class ConnectionBackend(ConnectionBase):
             await self._emit_location_collected(self.connector.game_enum, location)
 
         if patches:
+            self._had_activity = True
             await self.connector.execute_remote_patches(self.executor, patches)
         else:
             patches, has_message = await self.connector.find_missing_remote_pickups(
                 self.executor, self._inventory, self._permanent_pickups, self.message_cooldown > 0.0,
             )
+            if patches:
+                self._had_activity = True
             if patches and (self.message_cooldown <= 0.0 or not has_message):
                 await self.connector.execute_remote_patches(self.executor, patches)
                 if has_message:
@@ -166,9 +214,11 @@ class ConnectionBackend(ConnectionBase):
 
     async def _interact_with_game(self, dt):
         has_pending_op, world = await self.connector.current_game_status(self.executor)
+        if has_pending_op or world != self._world:
+            self._had_activity = True
         self._world = world
         if world is not None:
-            await self.update_current_inventory()
+            await self.update_current_inventory(dt)
             if not has_pending_op:
                 self.message_cooldown = max(self.message_cooldown - dt, 0.0)
                 await self._multiworld_interaction()
@@ -183,7 +233,24 @@ class ConnectionBackend(ConnectionBase):
             return self._expected_game != self.connector.game_enum
         return False
 
+    def _update_interval_after_update(self):
+        if self._had_activity:
+            self.update_interval = MINIMUM_UPDATE_INTERVAL
+        else:
+            self.update_interval = min(self.update_interval * 2, MAXIMUM_UPDATE_INTERVAL)
+
     async def update(self, dt: float):
+        """
+        Interacts with the game, if connected. Afterwards, `update_interval` says how long until the next update.
+        :param dt: How many seconds since the last update.
+        """
+        self._had_activity = False
+        try:
+            return await self._update(dt)
+        finally:
+            self._update_interval_after_update()
+
+    async def _update(self, dt: float):
         if not self._enabled:
             return
 
@@ -192,6 +259,7 @@ class ConnectionBackend(ConnectionBase):
 
         if self.connector is None or self._is_unexpected_game() or self._world is None:
             self.connector = await self._identify_game()
+            self._inventory_probe = None
 
         try:
             if self.connector is not None and not self._is_unexpected_game():
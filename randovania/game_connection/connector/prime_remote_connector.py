@@ -21,6 +21,14 @@ from randovania.games.game import RandovaniaGame
 from randovania.patching.prime import (all_prime_dol_patches)
 
 
+def format_received_items_summary(provider_names: list[str]) -> str:
+    providers = sorted(set(provider_names))
+    if len(providers) == 1:
+        return f"Received {len(provider_names)} items from {providers[0]}."
+    else:
+        return f"Received {len(provider_names)} items from {len(providers)} players."
+
+
 @dataclasses.dataclass(frozen=True)
 class DolRemotePatch(RemotePatch):
     instructions: list[assembler.BaseInstruction]
@@ -109,6 +117,18 @@ class PrimeRemoteConnector(RemoteConnector):
 
         return inventory
 
+    async def inventory_change_probe(self, executor: MemoryOperationExecutor) -> bytes | None:
+        """
+        Reads the multiworld magic item, which has its amount set when a location is collected and its capacity
+        increased when a remote pickup is received.
+        """
+        multiworld_magic_item = self.game.resource_database.multiworld_magic_item
+        if multiworld_magic_item is None:
+            return None
+
+        memory_ops = await self._memory_op_for_items(executor, [multiworld_magic_item])
+        return await executor.perform_single_memory_operation(*memory_ops)
+
     async def known_collected_locations(self, executor: MemoryOperationExecutor,
                                         ) -> tuple[set[PickupIndex], list[DolRemotePatch]]:
         """Fetches pickup indices that have been collected.
@@ -146,28 +166,79 @@ class PrimeRemoteConnector(RemoteConnector):
         :param inventory: The player's inventory, as given by `get_inventory`.
         :param remote_pickups: Ordered list of pickups sent from other players, with the name of the player.
         :param in_cooldown: If sending new pickups is on cooldown.
-        :return: List of patches to give one missing pickup. A bool indicating that a message will be displayed.
+        :return: List of patches to give the missing pickups. A bool indicating that a message will be displayed.
         """
         multiworld_magic_item = self.game.resource_database.multiworld_magic_item
         magic_inv = inventory.get(multiworld_magic_item)
         if magic_inv is None or magic_inv.amount > 0 or magic_inv.capacity >= len(remote_pickups) or in_cooldown:
             return [], False
 
-        provider_name, pickup = remote_pickups[magic_inv.capacity]
-        item_patches, message = await self._patches_for_pickup(provider_name, pickup, inventory)
+        # Deliver as many of the pending pickups as fits in a single remote execution, so catching up with a
+        # long list of pickups doesn't take one update cycle (and message cooldown) for each of them.
+        item_patches: list[list[assembler.BaseInstruction]] = []
+        delivered: list[tuple[str, str]] = []
+        previous_pickup = None
+
+        for provider_name, pickup in remote_pickups[magic_inv.capacity:]:
+            if previous_pickup is not None:
+                inventory = self._inventory_after_pickup(previous_pickup, inventory)
+
+            pickup_patches, message = await self._patches_for_pickup(provider_name, pickup, inventory)
+            if delivered and not self._fits_in_single_delivery([*item_patches, *pickup_patches], len(delivered) + 1):
+                break
+
+            item_patches.extend(pickup_patches)
+            delivered.append((provider_name, message))
+            previous_pickup = pickup
+
+        if len(delivered) == 1:
+            message = delivered[0][1]
+        else:
+            message = format_received_items_summary([provider_name for provider_name, _ in delivered])
+
         self.logger.info(f"{len(remote_pickups)} permanent pickups, magic {magic_inv.capacity}. "
-                         f"Next pickup: {message}")
+                         f"Next {len(delivered)} pickups: {message}")
 
         patches = [DolRemotePatch([], item_patch) for item_patch in item_patches]
-        patches.append(DolRemotePatch([], all_prime_dol_patches.increment_item_capacity_patch(
-            self.version.powerup_functions,
-            self.game.game,
-            multiworld_magic_item.extra["item_id"],
-        )))
+        patches.append(DolRemotePatch([], self._increment_magic_item_patch(len(delivered))))
         patches.append(self._dol_patch_for_hud_message(message))
 
         return patches, True
 
+    def _increment_magic_item_patch(self, delta: int) -> list[assembler.BaseInstruction]:
+        return all_prime_dol_patches.increment_item_capacity_patch(
+            self.version.powerup_functions,
+            self.game.game,
+            self.game.resource_database.multiworld_magic_item.extra["item_id"],
+            delta,
+        )
+
+    def _fits_in_single_delivery(self, item_patches: list[list[assembler.BaseInstruction]], count: int) -> bool:
+        """
+        Checks if the given item patches, along with the magic item and HUD message patches, fit in the
+        remote execution body. The message's text is written separately, so it isn't included.
+        """
+        return all_prime_dol_patches.fits_in_remote_execution_body([
+            *(instruction for item_patch in item_patches for instruction in item_patch),
+            *self._increment_magic_item_patch(count),
+            *all_prime_dol_patches.call_display_hud_patch(self.version.string_display),
+        ])
+
+    def _inventory_after_pickup(self, pickup: PickupEntry, inventory: Inventory) -> Inventory:
+        """
+        Calculates the inventory the game will have after receiving the given pickup.
+        Used for deciding conditional resources and locks of further pickups given in the same delivery.
+        """
+        _, resources_to_give = self._resources_to_give_for_pickup(pickup, inventory)
+
+        new_inventory = dict(inventory)
+        for item, delta in resources_to_give.as_resource_gain():
+            old = new_inventory.get(item, InventoryItem(0, 0))
+            capacity = min(max(old.capacity + delta, 0), item.max_capacity)
+            new_inventory[item] = InventoryItem(min(max(old.amount + delta, 0), capacity), capacity)
+
+        return new_inventory
+
     async def execute_remote_patches(self, executor: MemoryOperationExecutor, patches: list[DolRemotePatch]) -> None:
         """
         Executes a given set of patches on the given memory operator. Should only be called if the bool returned by
@@ -38,6 +38,13 @@ class RemoteConnector:
         """Fetches the inventory represented by the given game memory."""
         raise NotImplementedError()
 
+    async def inventory_change_probe(self, executor: MemoryOperationExecutor) -> bytes | None:
+        """
+        Reads a small value that changes whenever a location is collected or a remote pickup is received,
+        so reading the full inventory can be skipped when it's unchanged. None if not supported.
+        """
+        return None
+
     async def known_collected_locations(self, executor: MemoryOperationExecutor,
                                         ) -> tuple[set[PickupIndex], list[RemotePatch]]:
         """Fetches pickup indices that have been collected.
@@ -56,7 +63,7 @@ class RemoteConnector:
         :param inventory: The player's inventory, as given by `get_inventory`.
         :param remote_pickups: Ordered list of pickups sent from other players, with the name of the player.
         :param in_cooldown: If sending new pickups is on cooldown.
-        :return: List of patches to give one missing pickup. A bool indicating that a message will be displayed.
+        :return: List of patches to give the missing pickups. A bool indicating that a message will be displayed.
         """
         raise NotImplementedError()
 
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import dataclasses
 import struct
 from asyncio import StreamReader, StreamWriter
@@ -82,6 +83,86 @@ class RequestBatch:
         self.ops.append(op)
 
 
+# The byte count of each operation is sent as a single byte
+_MAX_OP_BYTE_COUNT = 255
+
+# Reads this close to each other are merged, as it's cheaper to read these extra bytes than to send another operation
+_MAX_MERGE_GAP = 4
+
+
+def _read_region(op: MemoryOperation) -> tuple[int | None, int]:
+    """
+    Returns the pointer used by the given operation, if any, and where it starts reading.
+    """
+    if op.offset is None:
+        return None, op.address
+    else:
+        return op.address, op.offset
+
+
+def merge_adjacent_reads(ops: list[MemoryOperation], max_read_size: int = _MAX_OP_BYTE_COUNT,
+                         ) -> tuple[list[MemoryOperation], dict[MemoryOperation, tuple[MemoryOperation, int]]]:
+    """
+    Merges read-only operations of nearby addresses, or nearby offsets of the same pointer, into a single operation.
+    Only consecutive read-only operations are merged, so the order of reads and writes is kept.
+    :param ops:
+    :param max_read_size: Merged operations don't read more than this many bytes.
+    :return: The operations to perform, and for each read operation given, which operation to perform
+    reads its bytes and at which position.
+    """
+    result: list[MemoryOperation] = []
+    sources: dict[MemoryOperation, tuple[MemoryOperation, int]] = {}
+    pending_reads: list[MemoryOperation] = []
+
+    def _finish_merge(merged: list[MemoryOperation], start: int, end: int):
+        if len(merged) == 1:
+            new_op = merged[0]
+        else:
+            pointer = _read_region(merged[0])[0]
+            if pointer is None:
+                new_op = MemoryOperation(address=start, read_byte_count=end - start)
+            else:
+                new_op = MemoryOperation(address=pointer, offset=start, read_byte_count=end - start)
+
+        result.append(new_op)
+        for op in merged:
+            sources[op] = new_op, _read_region(op)[1] - start
+
+    def _flush_reads():
+        merged: list[MemoryOperation] = []
+        start = end = 0
+        for op in sorted(set(pending_reads), key=lambda it: (it.offset is not None, it.address, it.offset or 0,
+                                                              it.read_byte_count)):
+            pointer, op_start = _read_region(op)
+            op_end = op_start + op.read_byte_count
+            if merged and (pointer == _read_region(merged[0])[0]
+                           and op_start <= end + _MAX_MERGE_GAP
+                           and max(end, op_end) - start <= max_read_size):
+                merged.append(op)
+                end = max(end, op_end)
+            else:
+                if merged:
+                    _finish_merge(merged, start, end)
+                merged = [op]
+                start, end = op_start, op_end
+
+        if merged:
+            _finish_merge(merged, start, end)
+        pending_reads.clear()
+
+    for op in ops:
+        if op.read_byte_count is not None and op.write_bytes is None:
+            pending_reads.append(op)
+        else:
+            _flush_reads()
+            result.append(op)
+            if op.read_byte_count is not None:
+                sources[op] = op, 0
+
+    _flush_reads()
+    return result, sources
+
+
 def _was_invalid_address(response: bytes, i: int) -> bool:
     try:
         return not response[i // 8] & (1 << (i % 8))
@@ -91,6 +172,9 @@ def _was_invalid_address(response: bytes, i: int) -> bool:
 
 class NintendontExecutor(MemoryOperationExecutor):
     _port = 43673
+    # How many requests are sent before waiting for their responses. As each request respects the server's
+    # max_input and max_output, this also limits how much the server has to buffer.
+    _max_in_flight_requests = 4
     _socket: SocketHolder | None = None
     _socket_error: Exception | None = None
 
@@ -200,20 +284,33 @@ class NintendontExecutor(MemoryOperationExecutor):
 
         return requests
 
+    async def _read_response(self, request: RequestBatch) -> bytes:
+        if request.output_bytes > 0:
+            return await asyncio.wait_for(self._socket.reader.readexactly(request.output_bytes), timeout=15)
+        else:
+            return b""
+
     async def _send_requests_to_socket(self, requests: list[RequestBatch]) -> list[bytes]:
+        """
+        Sends the given requests, without waiting for the responses of the previous ones unless there's already
+        `_max_in_flight_requests` pending. The server answers in order, so the responses are matched by position.
+        """
         all_responses = []
+        in_flight: collections.deque[RequestBatch] = collections.deque()
         try:
             for request in requests:
+                if len(in_flight) >= self._max_in_flight_requests:
+                    all_responses.append(await self._read_response(in_flight.popleft()))
+
                 data = request.build_request_data()
                 self._socket.writer.write(data)
                 await self._socket.writer.drain()
-                if request.output_bytes > 0:
-                    response = await asyncio.wait_for(self._socket.reader.read(1024), timeout=15)
-                    all_responses.append(response)
-                else:
-                    all_responses.append(b"")
+                in_flight.append(request)
+
+            while in_flight:
+                all_responses.append(await self._read_response(in_flight.popleft()))
 
-        except (OSError, asyncio.TimeoutError) as e:
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
             if isinstance(e, asyncio.TimeoutError):
                 self.logger.warning(f"Timeout when reading response from {self._ip}")
                 self._socket_error = MemoryOperationException(f"Timeout when reading response")
@@ -221,7 +318,7 @@ class NintendontExecutor(MemoryOperationExecutor):
                 self.logger.warning(f"Unable to send {len(requests)} requests to {self._ip}:{self._port}: {e}")
                 self._socket_error = MemoryOperationException(f"Unable to send {len(requests)} requests: {e}")
 
-            await self.disconnect()
+            self.disconnect()
             raise self._socket_error from e
 
         return all_responses
@@ -230,7 +327,10 @@ class NintendontExecutor(MemoryOperationExecutor):
         if self._socket is None:
             raise MemoryOperationException("Not connected")
 
-        requests = self._prepare_requests_for(ops)
+        # One byte of the output is needed for the validator
+        max_read_size = min(_MAX_OP_BYTE_COUNT, self._socket.max_output - 1)
+        merged_ops, sources = merge_adjacent_reads(ops, max_read_size)
+        requests = self._prepare_requests_for(merged_ops)
         all_responses = await self._send_requests_to_socket(requests)
 
         result = {}
@@ -253,4 +353,7 @@ class NintendontExecutor(MemoryOperationExecutor):
 
                 read_index += op.read_byte_count
 
-        return result
+        return {
+            op: result[merged_op][start:start + op.read_byte_count]
+            for op, (merged_op, start) in sources.items()
+        }
@@ -45,6 +45,8 @@ class GameConnection(QObject, ConnectionBackend):
             await self.update(self._dt)
             self._notify_status()
         finally:
+            self._dt = self.update_interval
+            self._timer.setInterval(int(self._dt * 1000))
             self._timer.start()
 
     def _notify_status(self):
@@ -1,7 +1,12 @@
 import functools
 import json
+import logging
+import os
+import pickle
+import sys
 from pathlib import Path
 
+import randovania
 from randovania.game_description import data_reader
 from randovania.game_description.game_description import GameDescription
 from randovania.game_description.item import item_database
@@ -9,14 +14,104 @@ from randovania.game_description.resources.resource_database import ResourceData
 from randovania.games import default_data
 from randovania.games.game import RandovaniaGame
 
+# Increase whenever the pickled GameDescription changes in a way the version doesn't catch
+_CACHE_FORMAT_VERSION = 2
+
+# Folder where decoded game descriptions are cached. When unset or empty, there's no cache on disk.
+# It's an environment variable so that processes started by this one use the same cache.
+CACHE_DIR_ENV_VAR = "RANDOVANIA_GAME_DESCRIPTION_CACHE"
+
 
 def resource_database_for(game: RandovaniaGame) -> ResourceDatabase:
     return game_description_for(game).resource_database
 
 
+def default_cache_dir() -> Path:
+    """
+    The per-user cache folder of the platform, used by the command line unless told otherwise.
+    """
+    if sys.platform == "win32" and "LOCALAPPDATA" in os.environ:
+        base = Path(os.environ["LOCALAPPDATA"], "Randovania", "Cache")
+    elif sys.platform == "darwin":
+        base = Path.home().joinpath("Library", "Caches", "Randovania")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache"), "randovania")
+    return base.joinpath("game_description_cache")
+
+
+def set_cache_dir(path: Path | None):
+    """
+    Configures where game_description_for caches the decoded databases. None disables the cache.
+    """
+    if path is None:
+        os.environ.pop(CACHE_DIR_ENV_VAR, None)
+    else:
+        os.environ[CACHE_DIR_ENV_VAR] = os.fspath(path)
+
+
+def _cache_path(game: RandovaniaGame) -> Path | None:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    return Path(cache_dir).joinpath(f"{game.value}.pickle")
+
+
+def _cache_key(game: RandovaniaGame) -> str:
+    return f"{_CACHE_FORMAT_VERSION}-{randovania.VERSION}-{default_data.content_hash(game)}"
+
+
+def _read_cached_game_description(path: Path, key: str) -> GameDescription | None:
+    try:
+        with path.open("rb") as cache_file:
+            # The key is pickled separately, so an outdated cache is rejected without loading everything
+            if pickle.load(cache_file) != key:
+                return None
+            return pickle.load(cache_file)
+
+    except FileNotFoundError:
+        return None
+
+    except Exception as e:
+        logging.warning("Unable to read game description cache at %s: %s", path, e)
+        return None
+
+
+def _write_cached_game_description(path: Path, key: str, game: GameDescription):
+    # Write to a temporary file first, so other processes never see a partial file
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as cache_file:
+            pickle.dump(key, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(game, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(path)
+
+    except OSError as e:
+        logging.warning("Unable to write game description cache at %s: %s", path, e)
+        temp_path.unlink(missing_ok=True)
+
+
 @functools.lru_cache
 def game_description_for(game: RandovaniaGame) -> GameDescription:
-    result = data_reader.decode_data(default_data.read_json_then_binary(game)[1])
+    """
+    Decodes the database for the given game.
+    When a cache dir is configured, the result is also stored there and used while the data files are unchanged.
+    :param game:
+    :return:
+    """
+    path = _cache_path(game)
+    key = None
+
+    result = None
+    if path is not None:
+        key = _cache_key(game)
+        result = _read_cached_game_description(path, key)
+
+    if result is None:
+        result = data_reader.decode_data(default_data.read_json_then_binary(game)[1])
+        if path is not None:
+            _write_cached_game_description(path, key, result)
+
     if result.game != game:
         raise ValueError(f"Game Description for {game} has game field {result.game}")
     return result
@@ -132,6 +132,11 @@ class GameDescription:
         return self._dangerous_resources
 
     def get_mutable(self) -> "GameDescription":
+        """
+        Returns a GameDescription that can have its requirements patched.
+        The worlds, areas and nodes are shared with self, as patching never modifies them.
+        :return:
+        """
         if self.mutable:
             return self
         else:
@@ -140,10 +145,7 @@ class GameDescription:
                 resource_database=self.resource_database,
                 layers=self.layers,
                 dock_weakness_database=self.dock_weakness_database,
-                world_list=WorldList([
-                    world.duplicate()
-                    for world in self.world_list.worlds
-                ]),
+                world_list=self.world_list.copy_sharing_worlds(),
                 victory_condition=self.victory_condition,
                 starting_location=self.starting_location,
                 initial_states=copy.copy(self.initial_states),
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    from randovania.game_description.requirements.base import Requirement
+    from randovania.game_description.requirements.requirement_set import RequirementSet
+    from randovania.game_description.resources.resource_database import ResourceDatabase
+
+# How many requirements are kept for each database
+MAX_ENTRIES = 50_000
+
+# How many databases have a cache at the same time
+MAX_DATABASES = 16
+
+
+class AsSetCache:
+    """
+    Cache of Requirement.as_set results for a single ResourceDatabase, keyed by the identity of the requirement.
+    The requirement is kept alongside the result, so that an id is never reused while in the cache.
+    When full, the least recently used entries are discarded first.
+    """
+    __slots__ = ("_entries", "hits", "misses")
+    _entries: dict[int, tuple[Requirement, RequirementSet]]
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, requirement: Requirement) -> RequirementSet | None:
+        key = id(requirement)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is requirement:
+            self.hits += 1
+            # Move to the end, so it's the last to be discarded
+            del self._entries[key]
+            self._entries[key] = entry
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def store(self, requirement: Requirement, result: RequirementSet):
+        if len(self._entries) >= MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._entries[id(requirement)] = (requirement, result)
+
+
+_caches: dict[int, tuple[ResourceDatabase, AsSetCache]] = {}
+
+
+def cache_for(database: ResourceDatabase) -> AsSetCache:
+    entry = _caches.get(id(database))
+    if entry is not None and entry[0] is database:
+        return entry[1]
+
+    if len(_caches) >= MAX_DATABASES:
+        del _caches[next(iter(_caches))]
+
+    cache = AsSetCache()
+    _caches[id(database)] = (database, cache)
+    return cache
+
+
+def invalidate(database: ResourceDatabase):
+    """
+    Discards all cached results for the given database.
+    Should be used when the requirements are replaced, like in `WorldList.patch_requirements`, or when the
+    database's templates are modified.
+    """
+    entry = _caches.get(id(database))
+    if entry is not None and entry[0] is database:
+        del _caches[id(database)]
+
+
+def cached(method: typing.Callable[[Requirement, ResourceDatabase], RequirementSet]):
+    """Decorator for `Requirement.as_set` implementations, using the cache of the given database."""
+
+    @functools.wraps(method)
+    def wrapper(self: Requirement, database: ResourceDatabase) -> RequirementSet:
+        cache = cache_for(database)
+        result = cache.get(self)
+        if result is None:
+            result = method(self, database)
+            cache.store(self, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import typing
+
+from randovania.game_description.requirements.base import MAX_DAMAGE, Requirement
+from randovania.game_description.requirements.requirement_and import RequirementAnd
+from randovania.game_description.requirements.requirement_or import RequirementOr
+from randovania.game_description.requirements.requirement_template import RequirementTemplate
+from randovania.game_description.requirements.resource_requirement import ResourceRequirement
+from randovania.game_description.resources.resource_database import ResourceDatabase
+from randovania.game_description.resources.resource_info import ResourceCollection, ResourceInfo
+
+if typing.TYPE_CHECKING:
+    from randovania.game_description.requirements.requirement_set import RequirementSet
+
+# Requirements that expand to more alternatives than this are checked with the original tree instead.
+MAX_ALTERNATIVES = 64
+
+# A bitmask of resources with at least 1, a tuple of (resource, amount, negate) checks and the damage requirements
+CompiledAlternative = tuple[int, tuple[tuple[ResourceInfo, int, bool], ...], tuple[ResourceRequirement, ...]]
+
+_TRIVIAL_ALTERNATIVE: CompiledAlternative = (0, (), ())
+
+
+def _expand(requirement: Requirement, database: ResourceDatabase) -> list[CompiledAlternative] | None:
+    """
+    Expands the given requirement into alternatives, where at least one must be satisfied.
+    Unlike `as_set`, repeated damage requirements are kept, since each one counts towards `damage`.
+    :return: The alternatives, or None if the requirement can't be expanded.
+    """
+    if isinstance(requirement, ResourceRequirement):
+        if requirement.is_damage:
+            return [(0, (), (requirement,))]
+        elif requirement.amount == 1 and not requirement.negate:
+            return [(1 << requirement.resource.resource_index, (), ())]
+        else:
+            return [(0, ((requirement.resource, requirement.amount, requirement.negate),), ())]
+
+    elif isinstance(requirement, RequirementTemplate):
+        return _expand(requirement.template_requirement(database), database)
+
+    elif isinstance(requirement, CompiledRequirement):
+        return _expand(requirement.original, database)
+
+    elif isinstance(requirement, RequirementOr):
+        result = []
+        for item in requirement.items:
+            expanded = _expand(item, database)
+            if expanded is None:
+                return None
+            result.extend(expanded)
+
+    elif isinstance(requirement, RequirementAnd):
+        result = [_TRIVIAL_ALTERNATIVE]
+        for item in requirement.items:
+            expanded = _expand(item, database)
+            if expanded is None or len(result) * len(expanded) > MAX_ALTERNATIVES:
+                return None
+            result = [
+                (a_mask | b_mask, a_extra + b_extra, a_damage + b_damage)
+                for a_mask, a_extra, a_damage in result
+                for b_mask, b_extra, b_damage in expanded
+            ]
+
+    else:
+        return None
+
+    result = list(dict.fromkeys(result))
+    if len(result) > MAX_ALTERNATIVES:
+        return None
+    return result
+
+
+class CompiledRequirement(Requirement):
+    """
+    Wraps a Requirement, checking it with a flat list of alternatives instead of walking the tree.
+    Similar to RequirementList, each alternative is a bitmask of resources that need to be present, plus a few extra
+    checks for amounts, negated resources and damage.
+
+    Expanding happens when first checked, as the templates in the database are needed.
+    """
+    __slots__ = ("original", "_database", "_alternatives")
+    original: Requirement
+    _database: ResourceDatabase | None
+    _alternatives: tuple[CompiledAlternative, ...] | None
+
+    def __init__(self, original: Requirement):
+        assert not isinstance(original, CompiledRequirement)
+        self.original = original
+        self._database = None
+        self._alternatives = None
+
+    @classmethod
+    def compile(cls, requirement: Requirement) -> Requirement:
+        """
+        Wraps the given requirement with a CompiledRequirement, unless it's one that can't be made faster.
+        :param requirement:
+        :return:
+        """
+        if (isinstance(requirement, (CompiledRequirement, ResourceRequirement))
+                or requirement == Requirement.trivial() or requirement == Requirement.impossible()):
+            return requirement
+        return cls(requirement)
+
+    def __deepcopy__(self, memodict):
+        return self
+
+    def _compile(self, database: ResourceDatabase):
+        self._database = database
+        expanded = _expand(self.original, database)
+        self._alternatives = tuple(expanded) if expanded is not None else None
+
+    def is_compiled(self, database: ResourceDatabase) -> bool:
+        if self._database is not database:
+            self._compile(database)
+        return self._alternatives is not None
+
+    def damage(self, current_resources: ResourceCollection, database: ResourceDatabase) -> int:
+        if self._database is not database:
+            self._compile(database)
+
+        if self._alternatives is not None:
+            # Same as RequirementOr/RequirementAnd: the cheapest alternative, ignoring the energy
+            result = None
+            resource_bitmask = current_resources.resource_bitmask
+            for bitmask, extra, damage in self._alternatives:
+                if bitmask & resource_bitmask != bitmask:
+                    continue
+                for resource, amount, negate in extra:
+                    if (current_resources[resource] >= amount) == negate:
+                        break
+                else:
+                    total = 0
+                    for individual in damage:
+                        individual_damage = individual.damage(current_resources, database)
+                        if individual_damage >= MAX_DAMAGE:
+                            break
+                        total += individual_damage
+                    else:
+                        if result is None or total < result:
+                            result = total
+
+            if result is not None:
+                return result
+
+        return self.original.damage(current_resources, database)
+
+    def satisfied(self, current_resources: ResourceCollection, current_energy: int, database: ResourceDatabase) -> bool:
+        if self._database is not database:
+            self._compile(database)
+
+        if self._alternatives is None:
+            return self.original.satisfied(current_resources, current_energy, database)
+
+        resource_bitmask = current_resources.resource_bitmask
+        for bitmask, extra, damage in self._alternatives:
+            if bitmask & resource_bitmask != bitmask:
+                continue
+            for resource, amount, negate in extra:
+                if (current_resources[resource] >= amount) == negate:
+                    break
+            else:
+                for individual in damage:
+                    if current_energy <= individual.damage(current_resources, database):
+                        break
+                else:
+                    return True
+
+        return False
+
+    def patch_requirements(self, static_resources: ResourceCollection, damage_multiplier: float,
+                           database: ResourceDatabase) -> Requirement:
+        return self.original.patch_requirements(static_resources, damage_multiplier, database)
+
+    def simplify(self, keep_comments: bool = False) -> Requirement:
+        return self
+
+    def as_set(self, database: ResourceDatabase) -> RequirementSet:
+        return self.original.as_set(database)
+
+    def iterate_resource_requirements(self, database: ResourceDatabase):
+        return self.original.iterate_resource_requirements(database)
+
+    def __eq__(self, other):
+        if isinstance(other, CompiledRequirement):
+            other = other.original
+        return self.original == other
+
+    def __hash__(self) -> int:
+        return hash(self.original)
+
+    def __repr__(self):
+        return repr(self.original)
+
+    def __str__(self) -> str:
+        return str(self.original)
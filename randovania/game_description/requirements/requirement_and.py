@@ -1,4 +1,5 @@
 from randovania.game_description.requirements.array_base import RequirementArrayBase, mergeable_array, expand_items
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import MAX_DAMAGE, Requirement
 from randovania.game_description.requirements.requirement_set import RequirementSet
 from randovania.game_description.resources.resource_database import ResourceDatabase
@@ -32,6 +33,7 @@ class RequirementAnd(RequirementArrayBase):
 
         return RequirementAnd(new_items, comment=self.comment)
 
+    @as_set_cache.cached
     def as_set(self, database: ResourceDatabase) -> RequirementSet:
         result = RequirementSet.trivial()
         for item in self.items:
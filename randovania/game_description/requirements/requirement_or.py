@@ -1,4 +1,5 @@
 from randovania.game_description.requirements.array_base import RequirementArrayBase, mergeable_array, expand_items
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import MAX_DAMAGE, Requirement
 from randovania.game_description.requirements.requirement_and import RequirementAnd
 from randovania.game_description.requirements.requirement_set import RequirementSet
@@ -69,6 +70,7 @@ class RequirementOr(RequirementArrayBase):
 
         return RequirementOr(final_items, comment=self.comment)
 
+    @as_set_cache.cached
     def as_set(self, database: ResourceDatabase) -> "RequirementSet":
         alternatives = set()
         for item in self.items:
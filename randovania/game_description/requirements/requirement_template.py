@@ -1,3 +1,4 @@
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import Requirement
 from randovania.game_description.requirements.requirement_set import RequirementSet
 from randovania.game_description.resources.resource_database import ResourceDatabase
@@ -27,6 +28,7 @@ class RequirementTemplate(Requirement):
     def simplify(self, keep_comments: bool = False) -> Requirement:
         return self
 
+    @as_set_cache.cached
     def as_set(self, database: ResourceDatabase) -> "RequirementSet":
         return self.template_requirement(database).as_set(database)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import array
 import copy
 import typing
 from typing import Union, Iterator
@@ -18,40 +19,59 @@ ResourceGainTuple = tuple[ResourceQuantity, ...]
 ResourceGain = Union[Iterator[ResourceQuantity], typing.ItemsView[ResourceInfo, int]]
 
 
+def _zeroed_array(size: int) -> array.array:
+    return array.array("i", bytes(4 * size))
+
+
 class ResourceCollection:
+    """
+    The quantity of each resource, stored in an `array` indexed by `resource_index`.
+
+    `duplicate` is cheap: the copy shares the array and the set resources with the original,
+    and whichever of them is modified first makes its own copy.
+    """
     __slots__ = ("resource_bitmask", "_resource_array", "_existing_resources", "add_self_as_requirement_to_resources",
-                 "_damage_reduction_cache")
+                 "_damage_reduction_cache", "_shared")
     resource_bitmask: int
-    _resource_array: list[int]
+    _resource_array: array.array
     _existing_resources: dict[int, ResourceInfo]
     add_self_as_requirement_to_resources: bool
     _damage_reduction_cache: dict[ResourceInfo, float] | None
+    _shared: bool
 
     def __init__(self):
         self.resource_bitmask = 0
-        self._resource_array = [0]
+        self._resource_array = _zeroed_array(1)
         self._existing_resources = {}
         self.add_self_as_requirement_to_resources = False
         self._damage_reduction_cache = None
+        self._shared = False
 
     @classmethod
     def with_database(cls, database: ResourceDatabase) -> ResourceCollection:
         result = cls()
-        result._resource_array = [0] * len(database.resource_by_index)
+        result._resource_array = _zeroed_array(len(database.resource_by_index))
         return result
 
-    def _resize_array_to(self, size: int):
-        self._resource_array.extend(
-            0 for _ in range(len(self._resource_array), size + 1)
-        )
+    def _prepare_for_write(self, resource_index: int):
+        """
+        Makes sure this collection owns its data and has space for the given index.
+        """
+        if self._shared:
+            self._resource_array = copy.copy(self._resource_array)
+            self._existing_resources = dict(self._existing_resources)
+            self._shared = False
+
+        size = len(self._resource_array)
+        if resource_index >= size:
+            self._resource_array.extend(_zeroed_array(resource_index + 1 - size))
 
     def __getitem__(self, item: ResourceInfo):
         resource_index = item.resource_index
         try:
             return self._resource_array[resource_index]
         except IndexError:
-            self._resize_array_to(resource_index)
-            return self._resource_array[resource_index]
+            return 0
 
     def __str__(self):
         return f"<ResourceCollection with {self.num_resources} resources>"
@@ -65,6 +85,19 @@ class ResourceCollection:
                 self._comparison_tuple == other._comparison_tuple
         )
 
+    @property
+    def counts_signature(self) -> tuple[tuple[int, int], ...]:
+        """
+        The index and quantity of every resource with a quantity other than 0 or 1.
+        Together with `resource_bitmask`, this identifies the quantity of all resources.
+        """
+        resource_array = self._resource_array
+        return tuple(sorted(
+            (index, quantity)
+            for index in self._existing_resources
+            if (quantity := resource_array[index]) > 1 or quantity < 0
+        ))
+
     @property
     def num_resources(self):
         return len(self._existing_resources)
@@ -83,11 +116,8 @@ class ResourceCollection:
     def set_resource(self, resource: ResourceInfo, quantity: int):
         resource_index = resource.resource_index
         self._damage_reduction_cache = None
-        try:
-            self._resource_array[resource_index] = quantity
-        except IndexError:
-            self._resize_array_to(resource_index)
-            self._resource_array[resource_index] = quantity
+        self._prepare_for_write(resource_index)
+        self._resource_array[resource_index] = quantity
         self._existing_resources[resource_index] = resource
 
         mask = 1 << resource_index
@@ -110,20 +140,29 @@ class ResourceCollection:
 
     def add_resource_gain(self, resource_gain: ResourceGain):
         self._damage_reduction_cache = None
+        self._prepare_for_write(0)
+
+        resource_array = self._resource_array
+        existing_resources = self._existing_resources
+        bitmask = self.resource_bitmask
+
         for resource, quantity in resource_gain:
             resource_index = resource.resource_index
             try:
-                self._resource_array[resource_index] += quantity
+                new_quantity = resource_array[resource_index] + quantity
             except IndexError:
-                self._resize_array_to(resource_index)
-                self._resource_array[resource_index] += quantity
-            self._existing_resources[resource_index] = resource
+                resource_array.extend(_zeroed_array(resource_index + 1 - len(resource_array)))
+                new_quantity = quantity
+            resource_array[resource_index] = new_quantity
+            existing_resources[resource_index] = resource
 
             mask = 1 << resource_index
-            if self._resource_array[resource_index] > 0:
-                self.resource_bitmask |= mask
-            elif self.resource_bitmask & mask:
-                self.resource_bitmask -= mask
+            if new_quantity > 0:
+                bitmask |= mask
+            elif bitmask & mask:
+                bitmask -= mask
+
+        self.resource_bitmask = bitmask
 
     def as_resource_gain(self) -> ResourceGain:
         for index, resource in self._existing_resources.items():
@@ -131,24 +170,54 @@ class ResourceCollection:
 
     def remove_resource(self, resource: ResourceInfo):
         resource_index = resource.resource_index
-        self._existing_resources.pop(resource_index, None)
-        try:
-            self._resource_array[resource_index] = 0
-        except IndexError:
-            pass
+        if resource_index not in self._existing_resources:
+            return
+
+        self._prepare_for_write(resource_index)
+        del self._existing_resources[resource_index]
+        self._resource_array[resource_index] = 0
 
         mask = 1 << resource_index
         if self.resource_bitmask & mask:
             self.resource_bitmask -= mask
 
     def duplicate(self) -> ResourceCollection:
-        result = ResourceCollection()
-        result._existing_resources.update(self._existing_resources)
-        result._resource_array = copy.copy(self._resource_array)
+        result = ResourceCollection.__new__(ResourceCollection)
         result.resource_bitmask = self.resource_bitmask
+        result._resource_array = self._resource_array
+        result._existing_resources = self._existing_resources
         result.add_self_as_requirement_to_resources = self.add_self_as_requirement_to_resources
+        result._damage_reduction_cache = None
+        result._shared = self._shared = True
         return result
 
+    def difference(self, other: ResourceCollection) -> ResourceGain:
+        """
+        How much each resource changed from `other` to this collection.
+        :param other:
+        :return: The resource and quantity delta of every resource that's different.
+        """
+        if self._resource_array is other._resource_array:
+            return
+
+        resources = dict(other._existing_resources)
+        resources.update(self._existing_resources)
+        for index, resource in resources.items():
+            delta = self[resource] - other[resource]
+            if delta != 0:
+                yield resource, delta
+
+    def changed_resources_mask(self, other: ResourceCollection) -> int:
+        """
+        A bitmask of all resources with a different quantity in this collection and `other`.
+        :param other:
+        :return:
+        """
+        mask = 0
+        for resource, _ in self.difference(other):
+            mask |= 1 << resource.resource_index
+        return mask
+
     def get_damage_reduction_cache(self, resource: ResourceInfo) -> float | None:
         if self._damage_reduction_cache is not None:
             return self._damage_reduction_cache.get(resource)
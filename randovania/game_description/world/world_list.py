@@ -1,10 +1,13 @@
 import copy
 import dataclasses
+import itertools
 import typing
 from typing import Iterator, Iterable
 
 from randovania.game_description.game_patches import GamePatches
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import Requirement
+from randovania.game_description.requirements.compiled_requirement import CompiledRequirement
 from randovania.game_description.resources.pickup_index import PickupIndex
 from randovania.game_description.resources.resource_database import ResourceDatabase
 from randovania.game_description.resources.resource_info import ResourceCollection
@@ -20,6 +23,10 @@ from randovania.game_description.world.teleporter_node import TeleporterNode
 from randovania.game_description.world.world import World
 
 NodeType = typing.TypeVar("NodeType", bound=Node)
+ConnectionTable = list[tuple[tuple[Node, Requirement], ...] | None]
+
+# How many dock and elevator assignments to keep the connections of
+_MAX_CONNECTION_TABLES = 8
 
 
 @dataclasses.dataclass(init=False, slots=True)
@@ -34,6 +41,7 @@ class WorldList(NodeProvider):
     _patched_node_connections: dict[NodeIndex, dict[NodeIndex, Requirement]] | None
     _patches_dock_open_requirements: list[Requirement] | None
     _patches_dock_lock_requirements: list[Requirement | None] | None
+    _connection_tables: dict[tuple[int, ...], tuple[tuple, ConnectionTable]]
 
     def __deepcopy__(self, memodict):
         return WorldList(
@@ -45,8 +53,24 @@ class WorldList(NodeProvider):
         self._patched_node_connections = None
         self._patches_dock_open_requirements = None
         self._patches_dock_lock_requirements = None
+        self._connection_tables = {}
         self.invalidate_node_cache()
 
+    def copy_sharing_worlds(self) -> "WorldList":
+        """
+        Creates a new WorldList with the same World objects, but its own patched requirements.
+        Meant for a GameDescription that is only modified via `patch_requirements`, so creating it is cheap.
+        :return:
+        """
+        self.ensure_has_node_cache()
+        result = WorldList(self.worlds)
+        result._nodes = self._nodes
+        result._nodes_to_area = copy.copy(self._nodes_to_area)
+        result._nodes_to_world = copy.copy(self._nodes_to_world)
+        result._pickup_index_to_node = self._pickup_index_to_node
+        result._identifier_to_node = self._identifier_to_node
+        return result
+
     def _refresh_node_cache(self):
         nodes = tuple(self._iterate_over_nodes())
 
@@ -178,15 +202,44 @@ class WorldList(NodeProvider):
             for target_node, requirements in area.connections[node].items():
                 yield target_node, requirements
 
-    def potential_nodes_from(self, node: Node, context: NodeContext) -> Iterator[tuple[Node, Requirement]]:
+    def _connection_table_for(self, context: NodeContext) -> ConnectionTable:
+        """
+        The connections of each node for the docks and elevators of the context's patches, calculated as needed.
+        Patches never modify these in place, so the same objects always mean the same connections.
+        """
+        patches = context.patches
+        sources = (patches.dock_connection, patches.dock_weakness, patches.elevator_connection, context.database)
+        key = tuple(id(source) for source in sources)
+
+        cached = self._connection_tables.get(key)
+        if cached is not None and all(old is new for old, new in zip(cached[0], sources)):
+            return cached[1]
+
+        if len(self._connection_tables) >= _MAX_CONNECTION_TABLES:
+            self._connection_tables.clear()
+
+        table: ConnectionTable = [None] * len(self.all_nodes)
+        self._connection_tables[key] = (sources, table)
+        return table
+
+    def potential_nodes_from(self, node: Node, context: NodeContext) -> Iterable[tuple[Node, Requirement]]:
         """
         Queries all nodes you can go from a given node, checking doors, teleporters and other nodes in the same area.
+        Once the requirements are patched, the result is cached for the docks and elevators of the context's patches.
         :param node:
         :param context:
-        :return: Generator of pairs Node + Requirement for going to that node
+        :return: Pairs of Node + Requirement for going to that node
         """
-        yield from node.connections_from(context)
-        yield from self.area_connections_from(node)
+        if self._patched_node_connections is None:
+            return itertools.chain(node.connections_from(context), self.area_connections_from(node))
+
+        table = self._connection_table_for(context)
+        connections = table[node.node_index]
+        if connections is None:
+            connections = tuple(node.connections_from(context)) + tuple(self.area_connections_from(node))
+            table[node.node_index] = connections
+
+        return connections
 
     def patch_requirements(self, static_resources: ResourceCollection, damage_multiplier: float,
                            database: ResourceDatabase, dock_weakness_database: DockWeaknessDatabase) -> None:
@@ -194,16 +247,23 @@ class WorldList(NodeProvider):
         Patches all Node connections, assuming the given resources will never change their quantity.
         This is removes all checking for tricks and difficulties in runtime since these never change.
         All damage requirements are multiplied by the given multiplier.
+        The resulting requirements are then compiled, for faster checking if they're satisfied.
         :param static_resources:
         :param damage_multiplier:
         :param database:
         :param dock_weakness_database
         :return:
         """
+        # The old requirements are being replaced, so there's no point in keeping their as_set
+        as_set_cache.invalidate(database)
+        self._connection_tables = {}
+
         # Area Connections
         self._patched_node_connections = {
             node.node_index: {
-                target.node_index: value.patch_requirements(static_resources, damage_multiplier, database).simplify()
+                target.node_index: CompiledRequirement.compile(
+                    value.patch_requirements(static_resources, damage_multiplier, database).simplify()
+                )
                 for target, value in area.connections[node].items()
             }
             for _, area, node in self.all_worlds_areas_nodes
@@ -223,16 +283,16 @@ class WorldList(NodeProvider):
         self._patches_dock_lock_requirements = []
         for weakness in sorted(dock_weakness_database.all_weaknesses, key=lambda it: it.weakness_index):
             assert len(self._patches_dock_open_requirements) == weakness.weakness_index
-            self._patches_dock_open_requirements.append(
+            self._patches_dock_open_requirements.append(CompiledRequirement.compile(
                 weakness.requirement.patch_requirements(static_resources, damage_multiplier, database).simplify()
-            )
+            ))
             if weakness.lock is None:
                 self._patches_dock_lock_requirements.append(None)
             else:
-                self._patches_dock_lock_requirements.append(
+                self._patches_dock_lock_requirements.append(CompiledRequirement.compile(
                     weakness.lock.requirement.patch_requirements(
                         static_resources, damage_multiplier, database).simplify()
-                )
+                ))
 
     def node_by_identifier(self, identifier: NodeIdentifier) -> Node:
         cache_result = self._identifier_to_node.get(identifier)
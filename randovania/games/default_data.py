@@ -1,4 +1,5 @@
 import functools
+import hashlib
 from pathlib import Path
 
 from randovania import get_data_path
@@ -20,3 +21,28 @@ def read_json_then_binary(game: RandovaniaGame) -> tuple[Path, dict]:
 
     binary_path = get_data_path().joinpath("binary_data", f"{game.value}.bin")
     return binary_path, binary_data.decode_file_path(binary_path)
+
+
+def _source_files(game: RandovaniaGame) -> list[Path]:
+    dir_path = game.data_path.joinpath("json_data")
+    if dir_path.exists():
+        return sorted(dir_path.glob("*.json"))
+
+    json_path = dir_path.joinpath(f"{game.value}.json")
+    if json_path.exists():
+        return [json_path]
+
+    return [get_data_path().joinpath("binary_data", f"{game.value}.bin")]
+
+
+def content_hash(game: RandovaniaGame) -> str:
+    """
+    Hashes the files that `read_json_then_binary` reads for the given game, without decoding them.
+    :param game:
+    :return: An hex string that changes whenever any of the files changes.
+    """
+    result = hashlib.blake2b(digest_size=16)
+    for path in _source_files(game):
+        result.update(path.name.encode("utf-8"))
+        result.update(path.read_bytes())
+    return result.hexdigest()
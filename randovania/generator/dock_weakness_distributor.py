@@ -108,33 +108,54 @@ def _get_docks_to_assign(rng: Random, filler_results: FillerResults) -> list[tup
 RESOLVER_ATTEMPTS = 125
 
 
-async def _run_resolver(state: State, logic: Logic, max_attempts: int):
+async def _run_resolver(state: State, logic: Logic, max_attempts: int, reach: ResolverReach | None = None):
     debug.log_resolve_start()
 
     resolver.set_attempts(0)
     with debug.with_level(0):
-        return await resolver.advance_depth(state, logic, lambda s: None, max_attempts=max_attempts)
+        return await resolver.advance_depth(state, logic, lambda s: None, max_attempts=max_attempts, reach=reach)
+
+
+@dataclasses.dataclass
+class PlayerDockSetup:
+    """
+    The resolver setup of a player, reused for all of their docks.
+    Dock weaknesses are only checked when resolving, so the bootstrapped State only needs the current patches.
+    """
+    state: State
+    logic: Logic
+    # The reach of the starting state in the previous dock's run.
+    # Only the connections of the docks changed since then are evaluated again.
+    starting_reach: ResolverReach | None = None
+
+    def state_with_patches(self, patches: GamePatches) -> State:
+        state = self.state.copy()
+        state.patches = patches
+        return state
 
 
 async def _run_dock_resolver(dock: DockNode,
                              target: DockNode,
                              dock_type_params: DockRandoParams,
-                             setup: tuple[State, Logic]
+                             setup: PlayerDockSetup,
+                             patches: GamePatches,
                              ) -> tuple[State, Logic]:
     """
     Run the resolver with the objective of reaching the dock, assuming the dock is locked.
     """
     locks = [(dock, dock_type_params.locked)]
-    if setup[0].patches.configuration.dock_rando.mode == DockRandoMode.TWO_WAY:
+    if patches.configuration.dock_rando.mode == DockRandoMode.TWO_WAY:
         locks.append((target, dock_type_params.locked))
 
-    state = setup[0].copy()
-    state.patches = state.patches.assign_dock_weakness(locks)
-    logic = DockRandoLogic.from_logic(setup[1], dock)
+    state = setup.state_with_patches(patches.assign_dock_weakness(locks))
+    logic = DockRandoLogic.from_logic(setup.logic, dock)
+
+    reach = ResolverReach.calculate_reach(logic, state, setup.starting_reach)
+    setup.starting_reach = reach
 
     debug.debug_print(f"{dock.identifier}")
     try:
-        new_state = await _run_resolver(state, logic, RESOLVER_ATTEMPTS)
+        new_state = await _run_resolver(state, logic, RESOLVER_ATTEMPTS, reach)
     except resolver.ResolverTimeout:
         new_state = None
         result = f"Timeout ({resolver.get_attempts()} attempts)"
@@ -208,6 +229,7 @@ async def distribute_post_fill_weaknesses(rng: Random,
     docks_to_place = len(unassigned_docks)
 
     start_time = time.perf_counter()
+    player_setups: dict[int, PlayerDockSetup] = {}
 
     for player, patches in new_patches.items():
         if patches.configuration.dock_rando.mode == DockRandoMode.VANILLA:
@@ -215,6 +237,7 @@ async def distribute_post_fill_weaknesses(rng: Random,
 
         status_update(f"Preparing dock randomizer for player {player + 1}.")
         state, logic = resolver.setup_resolver(patches.configuration, patches)
+        player_setups[player] = PlayerDockSetup(state, logic)
 
         try:
             new_state = await _run_resolver(state, logic, RESOLVER_ATTEMPTS * 2)
@@ -231,6 +254,7 @@ async def distribute_post_fill_weaknesses(rng: Random,
         status_update(f"{docks_placed}/{docks_to_place} docks placed")
 
         player, dock = unassigned_docks.pop()
+        dock_start_time = time.perf_counter()
 
         game = filler_results.player_results[player].game
         patches = new_patches[player]
@@ -249,7 +273,7 @@ async def distribute_post_fill_weaknesses(rng: Random,
         # Determine the reach and possible weaknesses given that reach
         new_state, logic = await _run_dock_resolver(
             dock, target, dock_type_params,
-            resolver.setup_resolver(patches.configuration, patches),
+            player_setups[player], patches,
         )
         weighted_weaknesses = _determine_valid_weaknesses(dock, target, dock_type_params, dock_type_state, new_state,
                                                           logic, patches.configuration.dock_rando.mode)
@@ -264,11 +288,14 @@ async def distribute_post_fill_weaknesses(rng: Random,
 
         docks_placed += 1
         debug.debug_print(f"Possibilities: {weighted_weaknesses}")
-        debug.debug_print(f"Chosen: {weakness}\n")
+        debug.debug_print(f"Chosen: {weakness}")
+        debug.debug_print(f"Placed in {time.perf_counter() - dock_start_time:.3f}s\n")
 
         new_patches[player] = patches.assign_dock_weakness(new_assignment)
 
-    debug.debug_print(f"Dock weakness distribution finished in {int(time.perf_counter() - start_time)}s")
+    total_time = time.perf_counter() - start_time
+    debug.debug_print(f"Dock weakness distribution finished in {total_time:.1f}s, "
+                      f"{total_time / max(docks_placed, 1):.3f}s per dock")
 
     return dataclasses.replace(
         filler_results,
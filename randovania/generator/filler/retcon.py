@@ -23,6 +23,7 @@ from randovania.generator.filler.filler_library import (
 from randovania.generator.filler.filler_logging import debug_print_collect_event
 from randovania.generator.filler.player_state import PlayerState, WeightedLocations
 from randovania.generator.generator_reach import GeneratorReach
+from randovania.lib import instrumentation_lib
 from randovania.lib.random_lib import select_element_with_weight
 from randovania.resolver import debug
 
@@ -95,6 +96,7 @@ def _get_next_player(rng: Random, player_states: list[PlayerState],
             )
 
 
+@instrumentation_lib.timed("weighted_potential_actions")
 def weighted_potential_actions(player_state: PlayerState, status_update: Callable[[str], None],
                                locations_weighted: WeightedLocations) -> dict[Action, float]:
     """
@@ -108,6 +110,7 @@ def weighted_potential_actions(player_state: PlayerState, status_update: Callabl
     current_uncollected = UncollectedState.from_reach(player_state.reach)
 
     actions = player_state.potential_actions(locations_weighted)
+    instrumentation_lib.count("potential_actions", len(actions))
     options_considered = 0
 
     def update_for_option():
@@ -223,45 +226,47 @@ def retcon_playthrough_filler(rng: Random,
     actions_log = []
 
     while True:
-        all_locations_weighted = _calculate_all_pickup_indices_weight(player_states)
-        current_player = _get_next_player(rng, player_states, all_locations_weighted)
-        if current_player is None:
-            break
-
-        weighted_actions = weighted_potential_actions(current_player, action_report, all_locations_weighted)
-        action = select_weighted_action(rng, weighted_actions)
-
-        new_resources, new_pickups = action.split_pickups()
-        new_pickups.sort()
-        rng.shuffle(new_pickups)
-
-        for new_resource in new_resources:
-            debug_print_collect_event(new_resource, current_player.game)
-            # This action is potentially dangerous. Use `act_on` to remove invalid paths
-            current_player.reach.act_on(new_resource)
-
-        if new_pickups:
-            debug.debug_print(f"\n>>> Will place {len(new_pickups)} pickups")
-            for i, new_pickup in enumerate(new_pickups):
-                if i > 0:
-                    current_player.reach = reach_lib.advance_reach_with_possible_unsafe_resources(current_player.reach)
-                    current_player.advance_scan_asset_seen_count()
-                    all_locations_weighted = _calculate_all_pickup_indices_weight(player_states)
-
-                log_entry = _assign_pickup_somewhere(new_pickup, current_player, player_states, rng,
-                                                     all_locations_weighted)
-                actions_log.append(log_entry)
-                debug.debug_print(f"* {log_entry}")
-
-                # TODO: this item is potentially dangerous and we should remove the invalidated paths
-                current_player.pickups_left.remove(new_pickup)
-
-            current_player.num_actions += 1
-
-        last_message = f"{sum(player.num_actions for player in player_states)} actions performed."
-        status_update(last_message)
-        current_player.reach = reach_lib.advance_reach_with_possible_unsafe_resources(current_player.reach)
-        current_player.update_for_new_state()
+        with instrumentation_lib.phase("retcon_iteration"):
+            all_locations_weighted = _calculate_all_pickup_indices_weight(player_states)
+            current_player = _get_next_player(rng, player_states, all_locations_weighted)
+            if current_player is None:
+                break
+
+            weighted_actions = weighted_potential_actions(current_player, action_report, all_locations_weighted)
+            action = select_weighted_action(rng, weighted_actions)
+
+            new_resources, new_pickups = action.split_pickups()
+            new_pickups.sort()
+            rng.shuffle(new_pickups)
+
+            for new_resource in new_resources:
+                debug_print_collect_event(new_resource, current_player.game)
+                # This action is potentially dangerous. Use `act_on` to remove invalid paths
+                current_player.reach.act_on(new_resource)
+
+            if new_pickups:
+                debug.debug_print(f"\n>>> Will place {len(new_pickups)} pickups")
+                for i, new_pickup in enumerate(new_pickups):
+                    if i > 0:
+                        current_player.reach = reach_lib.advance_reach_with_possible_unsafe_resources(
+                            current_player.reach)
+                        current_player.advance_scan_asset_seen_count()
+                        all_locations_weighted = _calculate_all_pickup_indices_weight(player_states)
+
+                    log_entry = _assign_pickup_somewhere(new_pickup, current_player, player_states, rng,
+                                                         all_locations_weighted)
+                    actions_log.append(log_entry)
+                    debug.debug_print(f"* {log_entry}")
+
+                    # TODO: this item is potentially dangerous and we should remove the invalidated paths
+                    current_player.pickups_left.remove(new_pickup)
+
+                current_player.num_actions += 1
+
+            last_message = f"{sum(player.num_actions for player in player_states)} actions performed."
+            status_update(last_message)
+            current_player.reach = reach_lib.advance_reach_with_possible_unsafe_resources(current_player.reach)
+            current_player.update_for_new_state()
 
     all_patches = {player_state: player_state.reach.state.patches for player_state in player_states}
     return all_patches, tuple(actions_log)
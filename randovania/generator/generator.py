@@ -23,6 +23,7 @@ from randovania.layout.base.base_configuration import BaseConfiguration
 from randovania.layout.generator_parameters import GeneratorParameters
 from randovania.layout.layout_description import LayoutDescription
 from randovania.layout.preset import Preset
+from randovania.lib import instrumentation_lib
 from randovania.resolver import resolver
 from randovania.resolver.exceptions import (GenerationFailure,
                                             ImpossibleForSolver,
@@ -147,12 +148,15 @@ async def _create_pools_and_fill(rng: Random,
 
     for player_index, player_preset in enumerate(presets):
         status_update(f"Creating item pool for player {player_index + 1}")
-        player_pools.append(await create_player_pool(rng, player_preset.configuration, player_index, len(presets)))
+        with instrumentation_lib.phase("create_player_pool"):
+            player_pools.append(await create_player_pool(rng, player_preset.configuration, player_index,
+                                                         len(presets)))
 
     for player_pool in player_pools:
         _validate_item_pool_size(player_pool.pickups, player_pool.game, player_pool.configuration)
 
-    return await run_filler(rng, player_pools, status_update)
+    with instrumentation_lib.phase("run_filler"):
+        return await run_filler(rng, player_pools, status_update)
 
 
 def _distribute_remaining_items(rng: Random,
@@ -230,7 +234,9 @@ async def _create_description(generator_params: GeneratorParameters,
     filler_results = await retrying(_create_pools_and_fill, rng, presets, status_update)
 
     filler_results = _distribute_remaining_items(rng, filler_results)
-    filler_results = await dock_weakness_distributor.distribute_post_fill_weaknesses(rng, filler_results, status_update)
+    with instrumentation_lib.phase("distribute_post_fill_weaknesses"):
+        filler_results = await dock_weakness_distributor.distribute_post_fill_weaknesses(rng, filler_results,
+                                                                                         status_update)
 
     return LayoutDescription.create_new(
         generator_parameters=generator_params,
@@ -277,7 +283,8 @@ async def generate_and_validate_description(generator_params: GeneratorParameter
             status_update=status_update,
         )
         try:
-            final_state_by_resolve = await asyncio.wait_for(final_state_async, timeout)
+            with instrumentation_lib.phase("validation"):
+                final_state_by_resolve = await asyncio.wait_for(final_state_async, timeout)
         except asyncio.TimeoutError as e:
             raise GenerationFailure("Timeout reached when validating possibility",
                                     generator_params=generator_params, source=e) from e
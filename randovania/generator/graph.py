@@ -1,8 +1,9 @@
 import copy
 import itertools
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict, deque
 from heapq import heappush, heappop
-from typing import Iterator, Callable
+from typing import Iterator, Callable, Iterable, Mapping, NamedTuple
 
 from randovania.game_description.requirements.requirement_set import RequirementSet
 
@@ -32,9 +33,63 @@ class BaseGraph:
     def multi_source_dijkstra(self, sources: set[int], weight: Callable[[int, int, RequirementSet], float]):
         raise NotImplementedError()
 
+    def node_costs_from(self, source: int, node_weight: Callable[[int], int]) -> dict[int, int]:
+        """
+        Calculates the cost of reaching every node that's reachable from the given source.
+        :param source:
+        :param node_weight: The cost of entering the given node. Must be 0 or 1.
+        :return: A dict of node to cost.
+        """
+        costs, _ = self.multi_source_dijkstra({source}, weight=lambda _, target, __: node_weight(target))
+        return costs
+
     def strongly_connected_components(self) -> Iterator[set[int]]:
         raise NotImplementedError()
 
+    def strongly_connected_component_of(self, node: int) -> set[int]:
+        raise NotImplementedError()
+
+
+def _tarjan(nodes: Iterable[int], adjacency: Mapping[int, Iterable[int]]) -> Iterator[set[int]]:
+    preorder = {}
+    lowlink = {}
+    scc_found = set()
+    scc_queue = []
+    i = 0  # Preorder counter
+    neighbors = {v: iter(adjacency[v]) for v in nodes}
+    for source in nodes:
+        if source not in scc_found:
+            queue = [source]
+            while queue:
+                v = queue[-1]
+                if v not in preorder:
+                    i = i + 1
+                    preorder[v] = i
+                done = True
+                for w in neighbors[v]:
+                    if w not in preorder:
+                        queue.append(w)
+                        done = False
+                        break
+                if done:
+                    lowlink[v] = preorder[v]
+                    for w in adjacency[v]:
+                        if w not in scc_found:
+                            if preorder[w] > preorder[v]:
+                                lowlink[v] = min([lowlink[v], lowlink[w]])
+                            else:
+                                lowlink[v] = min([lowlink[v], preorder[w]])
+                    queue.pop()
+                    if lowlink[v] == preorder[v]:
+                        scc = {v}
+                        while scc_queue and preorder[scc_queue[-1]] > preorder[v]:
+                            k = scc_queue.pop()
+                            scc.add(k)
+                        scc_found.update(scc)
+                        yield scc
+                    else:
+                        scc_queue.append(v)
+
 
 class RandovaniaGraph(BaseGraph):
     edges: dict[int, dict[int, RequirementSet]]
@@ -116,41 +171,285 @@ class RandovaniaGraph(BaseGraph):
         return dist, paths
 
     def strongly_connected_components(self) -> Iterator[set[int]]:
-        preorder = {}
-        lowlink = {}
-        scc_found = set()
-        scc_queue = []
-        i = 0  # Preorder counter
-        neighbors = {v: iter(self.edges[v]) for v in self.edges.keys()}
-        for source in self.edges.keys():
-            if source not in scc_found:
-                queue = [source]
-                while queue:
-                    v = queue[-1]
-                    if v not in preorder:
-                        i = i + 1
-                        preorder[v] = i
-                    done = True
-                    for w in neighbors[v]:
-                        if w not in preorder:
-                            queue.append(w)
-                            done = False
-                            break
-                    if done:
-                        lowlink[v] = preorder[v]
-                        for w in self.edges[v].keys():
-                            if w not in scc_found:
-                                if preorder[w] > preorder[v]:
-                                    lowlink[v] = min([lowlink[v], lowlink[w]])
-                                else:
-                                    lowlink[v] = min([lowlink[v], preorder[w]])
-                        queue.pop()
-                        if lowlink[v] == preorder[v]:
-                            scc = {v}
-                            while scc_queue and preorder[scc_queue[-1]] > preorder[v]:
-                                k = scc_queue.pop()
-                                scc.add(k)
-                            scc_found.update(scc)
-                            yield scc
-                        else:
-                            scc_queue.append(v)
+        yield from _tarjan(self.edges.keys(), self.edges)
+
+    def strongly_connected_component_of(self, node: int) -> set[int]:
+        """
+        Calculates the strongly connected component that contains the given node, without
+        having to calculate all other components.
+        :param node:
+        :return:
+        """
+        edges = self.edges
+
+        # All nodes that can be reached from the given node
+        reachable = {node}
+        queue = [node]
+        while queue:
+            for target in edges.get(queue.pop(), {}):
+                if target not in reachable:
+                    reachable.add(target)
+                    queue.append(target)
+
+        # Of these, the ones that can reach back to the given node.
+        # Any path back only uses nodes that are reachable, so the others can be ignored
+        predecessors = defaultdict(list)
+        for source in reachable:
+            for target in edges.get(source, {}):
+                predecessors[target].append(source)
+
+        component = {node}
+        queue = [node]
+        while queue:
+            for source in predecessors[queue.pop()]:
+                if source not in component:
+                    component.add(source)
+                    queue.append(source)
+
+        return component
+
+
+class _Adjacency(NamedTuple):
+    """
+    Compressed (CSR) adjacency of an ArrayGraph.
+    The edges leaving node `n` are `edges[offsets[n]:offsets[n + 1]]`, going to the same slice of `targets`.
+    The nodes with an edge to node `n` are `reverse_sources[reverse_offsets[n]:reverse_offsets[n + 1]]`.
+    """
+    offsets: array
+    edges: array
+    targets: array
+    reverse_offsets: array
+    reverse_sources: array
+
+
+def _offsets_for(nodes: Iterable[int], size: int) -> array:
+    counts = Counter(nodes)
+    return array("l", itertools.accumulate(map(counts.get, range(size - 1), itertools.repeat(0)), initial=0))
+
+
+class ArrayGraph(BaseGraph):
+    """
+    A graph that stores its edges in flat integer arrays, indexed by an edge id.
+    The adjacency of each node is built on demand, in a compressed (CSR) layout, and kept until the graph changes.
+    Copying only duplicates the flat containers, which makes it a cheap snapshot of the graph.
+    """
+    _nodes: bytearray
+    _sources: array
+    _targets: array
+    _requirements: list[RequirementSet | None]
+    _edge_ids: dict[int, int]
+    _adjacency: _Adjacency | None
+
+    @classmethod
+    def new(cls):
+        return cls(bytearray(), array("l"), array("l"), [], {})
+
+    def __init__(self, nodes: bytearray, sources: array, targets: array,
+                 requirements: list[RequirementSet | None], edge_ids: dict[int, int]):
+        self._nodes = nodes
+        self._sources = sources
+        self._targets = targets
+        self._requirements = requirements
+        self._edge_ids = edge_ids
+        self._adjacency = None
+
+    @staticmethod
+    def _edge_key(previous_node: int, next_node: int) -> int:
+        return (previous_node << 32) | next_node
+
+    def copy(self):
+        result = ArrayGraph(
+            bytearray(self._nodes),
+            array("l", self._sources),
+            array("l", self._targets),
+            self._requirements.copy(),
+            self._edge_ids.copy(),
+        )
+        # The adjacency is never modified, only replaced
+        result._adjacency = self._adjacency
+        return result
+
+    def _grow_to(self, node: int):
+        if node >= len(self._nodes):
+            self._nodes.extend(bytes(node + 1 - len(self._nodes)))
+
+    def add_node(self, node: int):
+        self._grow_to(node)
+        if not self._nodes[node]:
+            self._nodes[node] = 1
+            self._adjacency = None
+
+    def add_edge(self, previous_node: int, next_node: int, requirement: RequirementSet):
+        key = self._edge_key(previous_node, next_node)
+        edge_id = self._edge_ids.get(key)
+        if edge_id is not None:
+            self._requirements[edge_id] = requirement
+            return
+
+        self.add_node(previous_node)
+        self._grow_to(next_node)
+        self._edge_ids[key] = len(self._requirements)
+        self._sources.append(previous_node)
+        self._targets.append(next_node)
+        self._requirements.append(requirement)
+        self._adjacency = None
+
+    def remove_edge(self, previous: int, target: int):
+        edge_id = self._edge_ids.pop(self._edge_key(previous, target))
+        # Edge ids are never reused, so just mark it as removed
+        self._targets[edge_id] = -1
+        self._requirements[edge_id] = None
+        self._adjacency = None
+
+    def has_edge(self, previous_node: int, next_node: int) -> bool:
+        return self._edge_key(previous_node, next_node) in self._edge_ids
+
+    def __contains__(self, item: int):
+        return item < len(self._nodes) and self._nodes[item] == 1
+
+    def edges_data(self):
+        for source, target, requirement in zip(self._sources, self._targets, self._requirements):
+            if target >= 0:
+                yield source, target, requirement
+
+    def _get_adjacency(self) -> _Adjacency:
+        if self._adjacency is None:
+            sources = self._sources
+            targets = self._targets
+            size = len(self._nodes) + 1
+
+            # Stable sorts, so the edges of each node are kept in the order they were added
+            forward = sorted((edge_id for edge_id, target in enumerate(targets) if target >= 0),
+                             key=sources.__getitem__)
+            backward = sorted(forward, key=targets.__getitem__)
+
+            self._adjacency = _Adjacency(
+                offsets=_offsets_for(map(sources.__getitem__, forward), size),
+                edges=array("l", forward),
+                targets=array("l", map(targets.__getitem__, forward)),
+                reverse_offsets=_offsets_for(map(targets.__getitem__, backward), size),
+                reverse_sources=array("l", map(sources.__getitem__, backward)),
+            )
+
+        return self._adjacency
+
+    def multi_source_dijkstra(self, sources: set[int], weight: Callable[[int, int, RequirementSet], float]):
+        adjacency = self._get_adjacency()
+        offsets, edges, targets = adjacency.offsets, adjacency.edges, adjacency.targets
+        requirements = self._requirements
+
+        paths = {source: [source] for source in sources}
+        dist = {}
+        seen = {source: 0 for source in sources}
+        c = itertools.count()
+        fringe = [(0, next(c), source) for source in sources]
+
+        while fringe:
+            (d, _, v) = heappop(fringe)
+            if v in dist:
+                continue
+            dist[v] = d
+            start, end = offsets[v], offsets[v + 1]
+            for u, edge_id in zip(targets[start:end], edges[start:end]):
+                cost = weight(v, u, requirements[edge_id])
+                if cost is None:
+                    continue
+                vu_dist = d + cost
+                if u in dist:
+                    if vu_dist < dist[u]:
+                        raise ValueError("Contradictory paths found:", "negative weights?")
+                elif u not in seen or vu_dist < seen[u]:
+                    seen[u] = vu_dist
+                    heappush(fringe, (vu_dist, next(c), u))
+                    paths[u] = paths[v] + [u]
+
+        return dist, paths
+
+    def node_costs_from(self, source: int, node_weight: Callable[[int], int]) -> dict[int, int]:
+        # With weights of only 0 and 1, a deque replaces the priority queue: zero cost nodes go to the front.
+        adjacency = self._get_adjacency()
+        offsets, targets = adjacency.offsets, adjacency.targets
+        costs = {source: 0}
+        done = set()
+        queue = deque([source])
+
+        while queue:
+            node = queue.popleft()
+            if node in done:
+                continue
+            done.add(node)
+
+            cost = costs[node]
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if target in done:
+                    continue
+                weight = node_weight(target)
+                target_cost = cost + weight
+                if target_cost < costs.get(target, target_cost + 1):
+                    costs[target] = target_cost
+                    if weight == 0:
+                        queue.appendleft(target)
+                    else:
+                        queue.append(target)
+
+        return costs
+
+    def strongly_connected_components(self) -> Iterator[set[int]]:
+        adjacency = self._get_adjacency()
+        offsets, targets = adjacency.offsets, adjacency.targets
+        nodes = [node for node, present in enumerate(self._nodes) if present]
+        yield from _tarjan(nodes, {node: targets[offsets[node]:offsets[node + 1]] for node in nodes})
+
+    def strongly_connected_component_of(self, node: int) -> set[int]:
+        adjacency = self._get_adjacency()
+
+        offsets, targets = adjacency.offsets, adjacency.targets
+        reachable = {node}
+        queue = [node]
+        while queue:
+            source = queue.pop()
+            for target in targets[offsets[source]:offsets[source + 1]]:
+                if target not in reachable:
+                    reachable.add(target)
+                    queue.append(target)
+
+        # Any path back to the node only uses nodes that are reachable from it
+        offsets, sources = adjacency.reverse_offsets, adjacency.reverse_sources
+        component = {node}
+        queue = [node]
+        while queue:
+            target = queue.pop()
+            for source in sources[offsets[target]:offsets[target + 1]]:
+                if source not in component and source in reachable:
+                    component.add(source)
+                    queue.append(source)
+
+        return component
+
+
+GRAPH_BACKENDS: dict[str, type[BaseGraph]] = {
+    "dict": RandovaniaGraph,
+    "array": ArrayGraph,
+}
+_current_backend = "dict"
+
+
+def set_graph_backend(name: str):
+    """
+    Changes which graph implementation is used by `new_graph`.
+    :param name: One of the keys of GRAPH_BACKENDS.
+    :return:
+    """
+    if name not in GRAPH_BACKENDS:
+        raise ValueError(f"Unknown graph backend: {name}")
+
+    global _current_backend
+    _current_backend = name
+
+
+def get_graph_backend() -> str:
+    return _current_backend
+
+
+def new_graph() -> BaseGraph:
+    return GRAPH_BACKENDS[_current_backend].new()
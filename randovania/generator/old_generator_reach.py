@@ -10,6 +10,7 @@ from randovania.game_description.world.node import Node, NodeContext
 from randovania.game_description.world.resource_node import ResourceNode
 from randovania.generator import graph as graph_module
 from randovania.generator.generator_reach import GeneratorReach
+from randovania.lib import instrumentation_lib
 from randovania.resolver.state import State
 
 
@@ -50,7 +51,6 @@ class OldGeneratorReach(GeneratorReach):
     _digraph: graph_module.BaseGraph
     _state: State
     _game: GameDescription
-    _reachable_paths: dict[int, list[Node]] | None
     _reachable_costs: dict[int, int] | None
     _node_reachable_cache: dict[int, bool]
     _unreachable_paths: dict[tuple[int, int], RequirementSet]
@@ -64,7 +64,6 @@ class OldGeneratorReach(GeneratorReach):
             self._digraph.copy()
         )
         reach._unreachable_paths = copy.copy(self._unreachable_paths)
-        reach._reachable_paths = self._reachable_paths
         reach._reachable_costs = self._reachable_costs
         reach._safe_nodes = self._safe_nodes
 
@@ -82,7 +81,7 @@ class OldGeneratorReach(GeneratorReach):
         self._state = state
         self._digraph = graph
         self._unreachable_paths = {}
-        self._reachable_paths = None
+        self._reachable_costs = None
         self._node_reachable_cache = {}
         self._is_node_safe_cache = {}
 
@@ -92,30 +91,39 @@ class OldGeneratorReach(GeneratorReach):
                          initial_state: State,
                          ) -> "GeneratorReach":
 
-        reach = cls(game, initial_state, graph_module.RandovaniaGraph.new())
+        reach = cls(game, initial_state, graph_module.new_graph())
         game.world_list.ensure_has_node_cache()
         reach._expand_graph([GraphPath(None, initial_state.node, RequirementSet.trivial())])
         return reach
 
     def _potential_nodes_from(self, node: Node) -> Iterator[tuple[Node, RequirementSet]]:
+        database = self._state.resource_database
         extra_requirement = _extra_requirement_for_node(self._game, self.node_context(), node)
         requirement_to_leave = node.requirement_to_leave(self._state.node_context())
 
+        # Same as using RequirementAnd, but each as_set is calculated separately so the connection's is cached
+        extra_set = None
+        if requirement_to_leave != Requirement.trivial():
+            extra_set = requirement_to_leave.as_set(database)
+
+        if extra_requirement is not None:
+            extra_set = extra_requirement.as_set(database) if extra_set is None else extra_set.union(
+                extra_requirement.as_set(database))
+
         for target_node, requirement in self._game.world_list.potential_nodes_from(node, self.node_context()):
             if target_node is None:
                 continue
 
-            if requirement_to_leave != Requirement.trivial():
-                requirement = RequirementAnd([requirement, requirement_to_leave])
-
-            if extra_requirement is not None:
-                requirement = RequirementAnd([requirement, extra_requirement])
+            requirement_set = requirement.as_set(database)
+            if extra_set is not None:
+                requirement_set = requirement_set.union(extra_set)
 
-            yield target_node, requirement.as_set(self._state.resource_database)
+            yield target_node, requirement_set
 
+    @instrumentation_lib.timed("generator_reach_expansion")
     def _expand_graph(self, paths_to_check: list[GraphPath]):
         # print("!! _expand_graph", len(paths_to_check))
-        self._reachable_paths = None
+        self._reachable_costs = None
         while paths_to_check:
             path = paths_to_check.pop(0)
 
@@ -141,16 +149,18 @@ class OldGeneratorReach(GeneratorReach):
 
     def _can_advance(self,
                      node: Node,
+                     context: NodeContext | None = None,
                      ) -> bool:
         """
         Calculates if we can advance past a given node
         :param node:
+        :param context: The context to use. Defaults to the current state's, useful to avoid creating one per node.
         :return:
         """
         # We can't advance past a resource node if we haven't collected it
         if node.is_resource_node:
             assert isinstance(node, ResourceNode)
-            return node.is_collected(self.node_context())
+            return node.is_collected(context if context is not None else self.node_context())
         else:
             return True
 
@@ -158,29 +168,25 @@ class OldGeneratorReach(GeneratorReach):
         if self._safe_nodes is not None:
             return
 
-        for component in self._digraph.strongly_connected_components():
-            if self._state.node.node_index in component:
-                assert self._safe_nodes is None
-                self._safe_nodes = component
+        assert self._state.node.node_index in self._digraph
+        self._safe_nodes = self._digraph.strongly_connected_component_of(self._state.node.node_index)
 
-        assert self._safe_nodes is not None
-
-    def _calculate_reachable_paths(self):
-        if self._reachable_paths is not None:
+    def _calculate_reachable_costs(self):
+        if self._reachable_costs is not None:
             return
 
         all_nodes = self.all_nodes
+        context = self.node_context()
+        # The weight only depends on the target, which is usually the target of multiple edges
+        target_weights: dict[int, int] = {}
 
-        def weight(source: int, target: int, attributes):
-            if self._can_advance(all_nodes[target]):
-                return 0
-            else:
-                return 1
+        def weight(target: int) -> int:
+            result = target_weights.get(target)
+            if result is None:
+                result = target_weights[target] = 0 if self._can_advance(all_nodes[target], context) else 1
+            return result
 
-        self._reachable_costs, self._reachable_paths = self._digraph.multi_source_dijkstra(
-            {self.state.node.node_index},
-            weight=weight,
-        )
+        self._reachable_costs = self._digraph.node_costs_from(self.state.node.node_index, weight)
 
     def is_reachable_node(self, node: Node) -> bool:
         index = node.node_index
@@ -189,7 +195,7 @@ class OldGeneratorReach(GeneratorReach):
         if cached_value is not None:
             return cached_value
 
-        self._calculate_reachable_paths()
+        self._calculate_reachable_costs()
 
         cost = self._reachable_costs.get(index)
         if cost is not None:
@@ -210,9 +216,9 @@ class OldGeneratorReach(GeneratorReach):
         An iterator of all nodes there's an path from the reach's starting point. Similar to is_reachable_node
         :return:
         """
-        self._calculate_reachable_paths()
+        self._calculate_reachable_costs()
         all_nodes = self.all_nodes
-        for index in self._reachable_paths.keys():
+        for index in self._reachable_costs.keys():
             yield all_nodes[index]
 
     @property
@@ -235,9 +241,12 @@ class OldGeneratorReach(GeneratorReach):
 
     @property
     def safe_nodes(self) -> Iterator[Node]:
-        for node in self.nodes:
-            if self.is_safe_node(node):
-                yield node
+        # The safe nodes are all in the graph, so there's no need to check every node of the game.
+        # Nodes are sorted by index, which is the same order as `iterate_nodes`.
+        self._calculate_safe_nodes()
+        all_nodes = self.all_nodes
+        for node_index in sorted(self._safe_nodes):
+            yield all_nodes[node_index]
 
     def is_safe_node(self, node: Node) -> bool:
         node_index = node.node_index
@@ -7,6 +7,7 @@ import typing
 from PySide6 import QtWidgets, QtCore
 from PySide6.QtCore import Qt
 
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import Requirement
 from randovania.game_description.resources.item_resource_info import ItemResourceInfo
 from randovania.game_description.resources.resource_database import ResourceDatabase
@@ -286,4 +287,5 @@ class ResourceDatabaseEditor(QtWidgets.QDockWidget, Ui_ResourceDatabaseEditor):
         result = editor.exec_()
         if result == QtWidgets.QDialog.Accepted:
             self.db.requirement_template[name] = editor.final_requirement
+            as_set_cache.invalidate(self.db)
             self.editor_for_template[name].create_visualizer(self.db)
@@ -0,0 +1,163 @@
+"""
+A process pool for generating games, where each worker loads the game databases and presets only once.
+
+Work is sent as a `GenerationRequest`, which refers to presets by uuid when possible, so the per-seed cost is only
+the generation itself.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+from randovania.games.game import RandovaniaGame
+from randovania.layout.generator_parameters import GeneratorParameters
+from randovania.layout.layout_description import LayoutDescription
+from randovania.layout.preset import Preset
+from randovania.lib import enum_lib
+
+T = TypeVar("T")
+
+# The presets known by this process. Filled by `preload_worker` in worker processes.
+_worker_presets: dict[uuid.UUID, Preset] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class GenerationRequest:
+    presets: tuple[uuid.UUID | Preset, ...]
+    seed_number: int
+    spoiler: bool = True
+    validate_after_generation: bool = True
+    timeout: int | None = 600
+    attempts: int = 15
+
+
+def bundled_presets(games: Iterable[RandovaniaGame]) -> list[Preset]:
+    from randovania.layout.versioned_preset import VersionedPreset
+
+    return [
+        VersionedPreset.from_file_sync(game.data_path.joinpath("presets", preset["path"])).get_preset()
+        for game in games
+        for preset in game.data.presets
+    ]
+
+
+def preload_worker(games: tuple[RandovaniaGame, ...], presets: tuple[Preset, ...]):
+    """
+    Initializer of the pool's processes. Loads everything that's the same for all seeds of the given games.
+    :param games: Load the databases and bundled presets of these games.
+    :param presets: Additional presets, which replace bundled presets with the same uuid.
+    :return:
+    """
+    from randovania.game_description import default_database
+    from randovania.generator import generator  # noqa: F401 (the import itself is slow)
+    from randovania.layout import filtered_database
+
+    for game in games:
+        default_database.game_description_for(game)
+        default_database.item_database_for_game(game)
+
+    _worker_presets.clear()
+    for preset in bundled_presets(games) + list(presets):
+        _worker_presets[preset.uuid] = preset
+
+    for preset in _worker_presets.values():
+        filtered_database.game_description_for_layout(preset.configuration)
+
+
+def worker_generator_params(request: GenerationRequest) -> GeneratorParameters:
+    """
+    Creates the GeneratorParameters for the request, using the presets loaded in this process.
+    :param request:
+    :return:
+    """
+    return GeneratorParameters(
+        seed_number=request.seed_number,
+        spoiler=request.spoiler,
+        presets=[
+            preset if isinstance(preset, Preset) else _worker_presets[preset]
+            for preset in request.presets
+        ],
+    )
+
+
+def generate_in_worker(request: GenerationRequest) -> LayoutDescription:
+    from randovania.generator import generator
+
+    return asyncio.run(generator.generate_and_validate_description(
+        generator_params=worker_generator_params(request),
+        status_update=None,
+        validate_after_generation=request.validate_after_generation,
+        timeout=request.timeout,
+        attempts=request.attempts,
+    ))
+
+
+class GenerationPool:
+    """
+    Generates games in other processes. Meant to be kept alive, so anything that generates on demand can share it.
+    """
+    _executor: ProcessPoolExecutor
+    _presets: dict[uuid.UUID, Preset]
+
+    def __init__(self, max_workers: int | None = None,
+                 games: Iterable[RandovaniaGame] | None = None,
+                 presets: Iterable[Preset] = (),
+                 ):
+        """
+        :param max_workers: How many processes to use. Defaults to the CPU count.
+        :param games: Which games to preload. Defaults to the games of `presets`, or all games if there's none.
+        :param presets: Presets that aren't bundled with Randovania, but are used often.
+        """
+        presets = tuple(presets)
+        if games is None:
+            games = {preset.game for preset in presets} or enum_lib.iterate_enum(RandovaniaGame)
+        games = tuple(sorted(games, key=lambda it: it.value))
+
+        self._presets = {}
+        for preset in bundled_presets(games) + list(presets):
+            self._presets[preset.uuid] = preset
+
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=preload_worker,
+                                             initargs=(games, presets))
+
+    def request_for(self, generator_params: GeneratorParameters, **kwargs) -> GenerationRequest:
+        """
+        Creates a request for the given parameters. Presets this pool knows are sent only as their uuid.
+        :param generator_params:
+        :param kwargs: Other fields of GenerationRequest.
+        :return:
+        """
+        return GenerationRequest(
+            presets=tuple(
+                preset.uuid if self._presets.get(preset.uuid) == preset else preset
+                for preset in generator_params.presets
+            ),
+            seed_number=generator_params.seed_number,
+            spoiler=generator_params.spoiler,
+            **kwargs,
+        )
+
+    def submit(self, request: GenerationRequest) -> Future[LayoutDescription]:
+        return self._executor.submit(generate_in_worker, request)
+
+    def submit_call(self, fn: Callable[..., T], *args) -> Future[T]:
+        """
+        Runs a custom function in one of the workers. It can use `worker_generator_params` to make use of
+        the preloaded presets.
+        """
+        return self._executor.submit(fn, *args)
+
+    async def generate(self, request: GenerationRequest) -> LayoutDescription:
+        return await asyncio.wrap_future(self.submit(request))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -1,12 +1,35 @@
 from randovania.game_description import derived_nodes, default_database
 from randovania.game_description.game_description import GameDescription
+from randovania.game_description.world.world_list import WorldList
+from randovania.games.game import RandovaniaGame
 from randovania.layout.base.base_configuration import BaseConfiguration
 
+# For each game and active layers, the WorldList that was filtered and the result of filtering it
+_filtered_world_lists: dict[tuple[RandovaniaGame, frozenset[str]], tuple[WorldList, WorldList]] = {}
+
 
 def game_description_for_layout(configuration: BaseConfiguration) -> GameDescription:
-    game = derived_nodes.remove_inactive_layers(
-        default_database.game_description_for(configuration.game),
-        configuration.active_layers(),
-    )
+    """
+    Returns the GameDescription for the configuration's game, without the inactive layers.
+    Filtering the WorldList is cached per set of active layers, so the result is shared and never mutable.
+    """
+    game = default_database.game_description_for(configuration.game)
+    key = (configuration.game, frozenset(configuration.active_layers()))
+
+    cached = _filtered_world_lists.get(key)
+    if cached is not None and cached[0] is game.world_list:
+        return GameDescription(
+            game=game.game,
+            resource_database=game.resource_database,
+            layers=game.layers,
+            dock_weakness_database=game.dock_weakness_database,
+            world_list=cached[1],
+            victory_condition=game.victory_condition,
+            starting_location=game.starting_location,
+            initial_states=game.initial_states,
+            minimal_logic=game.minimal_logic,
+        )
 
-    return game
+    result = derived_nodes.remove_inactive_layers(game, set(key[1]))
+    _filtered_world_lists[key] = (game.world_list, result.world_list)
+    return result
@@ -1,4 +1,5 @@
 import base64
+import gzip
 import hashlib
 import itertools
 import json
@@ -111,7 +112,12 @@ class LayoutDescription:
 
     @classmethod
     def from_file(cls, json_path: Path) -> "LayoutDescription":
-        with json_path.open("r") as open_file:
+        if json_path.suffix == ".gz":
+            open_file = gzip.open(json_path, "rt")
+        else:
+            open_file = json_path.open("r")
+
+        with open_file:
             return cls.from_json_dict(json.load(open_file))
 
     @property
@@ -0,0 +1,197 @@
+"""
+Records how long each phase of generation and resolution takes, as well as how often they happen.
+
+Nothing is recorded unless a collector is active, which is done with `collecting`. With no collector, `phase` and
+`count` only cost a function call, so they can be used in hot paths.
+"""
+from __future__ import annotations
+
+import contextlib
+import functools
+import time
+import typing
+from pathlib import Path
+from typing import Callable, Iterator
+
+from randovania.lib import json_lib
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+OUTPUT_FORMATS = ("json", "speedscope")
+
+
+class InstrumentationCollector:
+    """
+    Collects the timings of nested phases, as a sequence of open and close events, and named counters.
+    """
+    clock: Callable[[], float]
+    start_time: float
+    end_time: float | None
+    counters: dict[str, int]
+    _frames: dict[str, int]
+    _events: list[tuple[str, int, float]]
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.start_time = clock()
+        self.end_time = None
+        self.counters = {}
+        self._frames = {}
+        self._events = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        frame = self._frames.setdefault(name, len(self._frames))
+        self._events.append(("O", frame, self.clock()))
+        try:
+            yield
+        finally:
+            self._events.append(("C", frame, self.clock()))
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def finish(self):
+        if self.end_time is None:
+            self.end_time = self.clock()
+
+    @property
+    def duration(self) -> float:
+        end_time = self.end_time if self.end_time is not None else self.clock()
+        return end_time - self.start_time
+
+    def phase_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregates all recorded phases by name. Time spent in a phase includes the time of the phases nested in it.
+        :return: For each phase, how many times it happened, the total and the longest time.
+        """
+        names = list(self._frames)
+        result = {name: {"count": 0, "total": 0.0, "max": 0.0} for name in names}
+        open_times = []
+
+        for kind, frame, at in self._events:
+            if kind == "O":
+                open_times.append(at)
+            else:
+                elapsed = at - open_times.pop()
+                entry = result[names[frame]]
+                entry["count"] += 1
+                entry["total"] += elapsed
+                entry["max"] = max(entry["max"], elapsed)
+
+        return result
+
+    def as_json(self) -> dict:
+        return {
+            "duration": self.duration,
+            "phases": self.phase_summary(),
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def as_speedscope(self, name: str) -> dict:
+        """
+        Creates an evented profile that can be opened in https://www.speedscope.app
+        :param name: The name of the profile.
+        :return:
+        """
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "randovania",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": frame_name} for frame_name in self._frames],
+            },
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "events": [
+                        {"type": kind, "frame": frame, "at": at - self.start_time}
+                        for kind, frame, at in self._events
+                    ],
+                }
+            ],
+        }
+
+    def write(self, path: Path, output_format: str, name: str):
+        if output_format == "json":
+            data = self.as_json()
+        elif output_format == "speedscope":
+            data = self.as_speedscope(name)
+        else:
+            raise ValueError(f"Unknown format: {output_format}")
+
+        json_lib.write_path(path, data)
+
+
+_collector: InstrumentationCollector | None = None
+_NO_PHASE = contextlib.nullcontext()
+
+
+def current_collector() -> InstrumentationCollector | None:
+    return _collector
+
+
+@contextlib.contextmanager
+def collecting(collector: InstrumentationCollector | None = None) -> Iterator[InstrumentationCollector]:
+    """
+    Makes the given collector (or a new one) receive all phases and counts until the context exits.
+    :param collector:
+    :return:
+    """
+    global _collector
+    if collector is None:
+        collector = InstrumentationCollector()
+
+    previous = _collector
+    _collector = collector
+    try:
+        yield collector
+    finally:
+        _collector = previous
+        collector.finish()
+
+
+def phase(name: str) -> typing.ContextManager[None]:
+    """
+    A context manager that records the time spent inside it as the given phase, if there's an active collector.
+    :param name:
+    :return:
+    """
+    if _collector is None:
+        return _NO_PHASE
+    return _collector.phase(name)
+
+
+def count(name: str, amount: int = 1):
+    """
+    Increments the given counter, if there's an active collector.
+    :param name:
+    :param amount:
+    :return:
+    """
+    if _collector is not None:
+        _collector.count(name, amount)
+
+
+def timed(name: str):
+    """
+    Decorator that records every call of the function as the given phase, if there's an active collector.
+    :param name:
+    :return:
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _collector is None:
+                return func(*args, **kwargs)
+            with _collector.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,37 @@
+"""
+An immutable singly linked list, where each new list shares all elements with the list it was created from.
+Adding an element is O(1) and uses constant memory, which is useful for sequences that grow as a search goes deeper.
+"""
+from __future__ import annotations
+
+from typing import Iterable, TypeVar, Union
+
+T = TypeVar("T")
+
+# The last element and the list before it. None is the empty list.
+LinkedList = Union[tuple[T, "LinkedList[T]"], None]
+
+
+def append(linked: LinkedList[T], value: T) -> LinkedList[T]:
+    return value, linked
+
+
+def from_iterable(values: Iterable[T]) -> LinkedList[T]:
+    result = None
+    for value in values:
+        result = value, result
+    return result
+
+
+def to_tuple(linked: LinkedList[T]) -> tuple[T, ...]:
+    """
+    Materializes the list, in the order the elements were appended.
+    :param linked:
+    :return:
+    """
+    result = []
+    while linked is not None:
+        value, linked = linked
+        result.append(value)
+    result.reverse()
+    return tuple(result)
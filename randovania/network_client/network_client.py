@@ -325,10 +325,22 @@ class NetworkClient:
                          entry.state.user_friendly_name)
         self._current_game_session_meta = entry
 
-    async def _on_game_session_actions_update_raw(self, data: bytes):
+    async def _on_game_session_actions_update_raw(self, data: dict):
+        current = ()
+        if self._current_game_session_actions is not None:
+            current = self._current_game_session_actions.actions
+
+        # The server only sends the actions after the first `start`, which we should already have
+        start: int = data["start"]
+        if start > len(current):
+            self.logger.info("received actions starting at %d, but only has %d. Requesting the missing ones.",
+                             start, len(current))
+            await self.game_session_request_update()
+            return
+
         await self.on_game_session_actions_update(GameSessionActions(
-            tuple(GameSessionAction.from_json(item)
-                  for item in binary_formats.BinaryGameSessionActions.parse(data))
+            current[:start] + tuple(GameSessionAction.from_json(item)
+                                    for item in binary_formats.BinaryGameSessionActions.parse(data["actions"]))
         ))
 
     async def on_game_session_actions_update(self, actions: GameSessionActions):
@@ -339,9 +351,22 @@ class NetworkClient:
         game = RandovaniaGame(data["game"])
         resource_database = default_database.resource_database_for(game)
 
+        current = self._current_game_session_pickups
+        if current is None or current.game != game:
+            current = GameSessionPickups(game=game, pickups=())
+
+        # The server only sends the pickups after the first `start`, which we should already have
+        start: int = data.get("start", 0)
+        if start > len(current.pickups):
+            self.logger.info("received pickups starting at %d, but only has %d. Requesting the missing ones.",
+                             start, len(current.pickups))
+            self._current_game_session_pickups = current
+            await self.game_session_request_update()
+            return
+
         await self.on_game_session_pickups_update(GameSessionPickups(
             game=game,
-            pickups=tuple(
+            pickups=current.pickups[:start] + tuple(
                 (item["provider_name"], _decode_pickup(item["pickup"], resource_database))
                 for item in data["pickups"]
             ),
@@ -351,11 +376,23 @@ class NetworkClient:
         self.logger.info("num pickups: %d", len(pickups.pickups))
         self._current_game_session_pickups = pickups
 
-    async def _on_game_session_audit_update_raw(self, data):
+    async def _on_game_session_audit_update_raw(self, data: dict):
+        current = ()
+        if self._current_game_session_audit_log is not None:
+            current = self._current_game_session_audit_log.entries
+
+        # The server only sends the entries after the first `start`, which we should already have
+        start: int = data["start"]
+        if start > len(current):
+            self.logger.info("received audit entries starting at %d, but only has %d. Requesting the missing ones.",
+                             start, len(current))
+            await self.game_session_request_update()
+            return
+
         await self.on_game_session_audit_update(GameSessionAuditLog(
-            entries=tuple(
+            entries=current[:start] + tuple(
                 GameSessionAuditEntry.from_json(entry)
-                for entry in binary_formats.BinaryGameSessionAuditLog.parse(data)
+                for entry in binary_formats.BinaryGameSessionAuditLog.parse(data["entries"])
             ),
         ))
 
@@ -415,7 +452,12 @@ class NetworkClient:
             raise possible_error
 
     async def game_session_request_update(self):
-        await self._emit_with_result("game_session_request_update", self._current_game_session_meta.id)
+        known_pickups = 0
+        if self._current_game_session_pickups is not None:
+            known_pickups = len(self._current_game_session_pickups.pickups)
+
+        await self._emit_with_result("game_session_request_update",
+                                     (self._current_game_session_meta.id, known_pickups))
 
     async def game_session_collect_locations(self, locations: tuple[int, ...]):
         await self._emit_with_result("game_session_collect_locations",
@@ -431,6 +473,7 @@ class NetworkClient:
         result = await self._emit_with_result("create_game_session", session_name)
         self._current_game_session_meta = GameSessionEntry.from_json(result)
         self._current_game_session_actions = None
+        self._current_game_session_pickups = None
         self._current_game_session_audit_log = None
         return self._current_game_session_meta
 
@@ -438,6 +481,7 @@ class NetworkClient:
         result = await self._emit_with_result("join_game_session", (session.id, password))
         self._current_game_session_meta = GameSessionEntry.from_json(result)
         self._current_game_session_actions = None
+        self._current_game_session_pickups = None
         self._current_game_session_audit_log = None
 
     async def leave_game_session(self, permanent: bool):
@@ -446,6 +490,7 @@ class NetworkClient:
         await self._emit_with_result("disconnect_game_session", self._current_game_session_meta.id)
         self._current_game_session_meta = None
         self._current_game_session_actions = None
+        self._current_game_session_pickups = None
         self._current_game_session_audit_log = None
 
     async def session_admin_global(self, action: admin_actions.SessionAdminGlobalAction, arg):
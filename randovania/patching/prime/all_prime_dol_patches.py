@@ -1,5 +1,6 @@
 import dataclasses
 import struct
+from typing import Iterable
 
 from randovania.bitpacking.type_enforcement import DataclassPostInitTypeCheck
 from randovania.dol_patching import assembler
@@ -211,6 +212,28 @@ def apply_remote_execution_patch(patch_addresses: StringDisplayPatchAddresses, d
     dol_file.write_instructions(patch_addresses.update_hint_state, remote_execution_patch())
 
 
+def _remote_execution_body_instructions(instructions: Iterable[BaseInstruction]) -> list[BaseInstruction]:
+    body_instructions = list(instructions)
+    body_instructions.extend(remote_execution_clear_pending_op())
+    body_instructions.extend(remote_execution_cleanup_and_return())
+    return body_instructions
+
+
+def remote_execution_body_byte_limit() -> int:
+    """
+    How many bytes the body created by `create_remote_execution_body` may have.
+    """
+    return _remote_execution_max_byte_count - assembler.byte_count(remote_execution_patch_start())
+
+
+def fits_in_remote_execution_body(instructions: Iterable[BaseInstruction]) -> bool:
+    """
+    Checks if the given instructions can be executed with a single `create_remote_execution_body`.
+    """
+    body_byte_count = assembler.byte_count(_remote_execution_body_instructions(instructions))
+    return body_byte_count <= remote_execution_body_byte_limit()
+
+
 def create_remote_execution_body(patch_addresses: StringDisplayPatchAddresses,
                                  instructions: list[BaseInstruction]) -> tuple[int, bytes]:
     """
@@ -222,14 +245,12 @@ def create_remote_execution_body(patch_addresses: StringDisplayPatchAddresses,
     remote_start_byte_count = assembler.byte_count(remote_start_instructions)
 
     body_address = update_hint_state + remote_start_byte_count
-    body_instructions = list(instructions)
-    body_instructions.extend(remote_execution_clear_pending_op())
-    body_instructions.extend(remote_execution_cleanup_and_return())
+    body_instructions = _remote_execution_body_instructions(instructions)
     body_bytes = bytes(assembler.assemble_instructions(body_address, body_instructions))
 
-    if len(body_bytes) > _remote_execution_max_byte_count - remote_start_byte_count:
+    if len(body_bytes) > remote_execution_body_byte_limit():
         raise ValueError(f"Received {len(body_instructions)} instructions with total {len(body_bytes)} bytes, "
-                         f"but limit is {_remote_execution_max_byte_count - remote_start_byte_count}.")
+                         f"but limit is {remote_execution_body_byte_limit()}.")
 
     return body_address, body_bytes
 
@@ -102,7 +102,7 @@ class Bootstrap:
 
         starting_state = State(
             initial_resources,
-            (),
+            None,
             None,
             starting_node,
             patches,
@@ -67,6 +67,11 @@ def log_new_advance(state: "State", reach: "ResolverReach"):
         print_function(f"{_indent(1)}> {n(state.node, world_list=world_list)} for {resources}")
 
 
+def log_known_dead_end(state: "State"):
+    if _DEBUG_LEVEL > 1:
+        print_function(f"{_indent()}* Skip {n(state.node, world_list=state.world_list)}, known dead end")
+
+
 def log_checking_satisfiable_actions():
     if _DEBUG_LEVEL > 1:
         print_function(f"{_indent()}# Satisfiable Actions")
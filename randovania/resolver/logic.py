@@ -3,6 +3,8 @@ from randovania.game_description.requirements.base import Requirement
 from randovania.game_description.requirements.requirement_set import RequirementSet
 from randovania.game_description.world.node import Node
 from randovania.layout.base.base_configuration import BaseConfiguration
+from randovania.resolver import transposition_table
+from randovania.resolver.transposition_table import TranspositionTable
 
 
 class Logic:
@@ -11,11 +13,14 @@ class Logic:
     game: GameDescription
     configuration: BaseConfiguration
     additional_requirements: list[RequirementSet]
+    transposition_table: TranspositionTable
 
-    def __init__(self, game: GameDescription, configuration: BaseConfiguration):
+    def __init__(self, game: GameDescription, configuration: BaseConfiguration,
+                 max_transposition_entries: int = transposition_table.DEFAULT_MAX_ENTRIES):
         self.game = game
         self.configuration = configuration
         self.additional_requirements = [RequirementSet.trivial()] * len(game.world_list.all_nodes)
+        self.transposition_table = TranspositionTable(max_transposition_entries)
 
     def get_additional_requirements(self, node: Node) -> RequirementSet:
         return self.additional_requirements[node.node_index]
@@ -12,7 +12,8 @@ from randovania.game_description.world.pickup_node import PickupNode
 from randovania.game_description.world.resource_node import ResourceNode
 from randovania.layout import filtered_database
 from randovania.layout.base.base_configuration import BaseConfiguration
-from randovania.resolver import debug
+from randovania.lib import instrumentation_lib
+from randovania.resolver import debug, transposition_table
 from randovania.resolver.logic import Logic
 from randovania.resolver.resolver_reach import ResolverReach
 from randovania.resolver.state import State
@@ -110,6 +111,7 @@ async def _inner_advance_depth(state: State,
                                status_update: Callable[[str], None],
                                *,
                                reach: ResolverReach | None = None,
+                               parent_reach: ResolverReach | None = None,
                                max_attempts: int | None = None,
                                ) -> tuple[State | None, bool]:
     """
@@ -118,6 +120,7 @@ async def _inner_advance_depth(state: State,
     :param logic:
     :param status_update:
     :param reach: A precalculated reach for the given state
+    :param parent_reach: The reach of the state this one came from, used to incrementally calculate the reach
     :return:
     """
 
@@ -127,8 +130,15 @@ async def _inner_advance_depth(state: State,
     # Yield back to the asyncio runner, so cancel can do something
     await asyncio.sleep(0)
 
+    # The same node, energy and resources can be reached by collecting things in a different order
+    key = transposition_table.state_key(state)
+    known_has_action = logic.transposition_table.get_dead_end(key)
+    if known_has_action is not None:
+        debug.log_known_dead_end(state)
+        return None, known_has_action
+
     if reach is None:
-        reach = ResolverReach.calculate_reach(logic, state)
+        reach = ResolverReach.calculate_reach(logic, state, parent_reach)
 
     _check_attempts(max_attempts)
     debug.log_new_advance(state, reach)
@@ -138,7 +148,7 @@ async def _inner_advance_depth(state: State,
         if _should_check_if_action_is_safe(state, action, logic.game.dangerous_resources,
                                            logic.game.world_list.iterate_nodes()):
             potential_state = state.act_on_node(action, path=reach.path_to_node(action), new_energy=energy)
-            potential_reach = ResolverReach.calculate_reach(logic, potential_state)
+            potential_reach = ResolverReach.calculate_reach(logic, potential_state, reach)
 
             # If we can go back to where we were, it's a simple safe node
             if state.node in potential_reach.nodes:
@@ -154,6 +164,8 @@ async def _inner_advance_depth(state: State,
                     debug.log_rollback(state, True, True)
 
                 # If a safe node was a dead end, we're certainly a dead end as well
+                if new_result[0] is None:
+                    logic.transposition_table.add_dead_end(key, new_result[1])
                 return new_result
 
     debug.log_checking_satisfiable_actions()
@@ -163,6 +175,7 @@ async def _inner_advance_depth(state: State,
             state=state.act_on_node(action, path=reach.path_to_node(action), new_energy=energy),
             logic=logic,
             status_update=status_update,
+            parent_reach=reach,
             max_attempts=max_attempts,
         )
 
@@ -188,12 +201,23 @@ async def _inner_advance_depth(state: State,
                                              state,
                                              logic.game.dangerous_resources)
     )
+    logic.transposition_table.add_dead_end(key, has_action)
     return None, has_action
 
 
 async def advance_depth(state: State, logic: Logic, status_update: Callable[[str], None],
-                        max_attempts: int | None = None) -> State | None:
-    return (await _inner_advance_depth(state, logic, status_update, max_attempts=max_attempts))[0]
+                        max_attempts: int | None = None,
+                        reach: ResolverReach | None = None) -> State | None:
+    """
+    Resolves the game from the given state.
+    :param state:
+    :param logic:
+    :param status_update:
+    :param max_attempts: Raise ResolverTimeout after this many attempts.
+    :param reach: A precalculated reach for the given state
+    :return: The final state, or None if the victory condition is impossible.
+    """
+    return (await _inner_advance_depth(state, logic, status_update, reach=reach, max_attempts=max_attempts))[0]
 
 
 def _quiet_print(s):
@@ -222,7 +246,10 @@ async def resolve(configuration: BaseConfiguration,
     if status_update is None:
         status_update = _quiet_print
 
-    starting_state, logic = setup_resolver(configuration, patches)
-    debug.log_resolve_start()
+    with instrumentation_lib.phase("resolve"):
+        starting_state, logic = setup_resolver(configuration, patches)
+        debug.log_resolve_start()
 
-    return await advance_depth(starting_state, logic, status_update)
+        result = await advance_depth(starting_state, logic, status_update)
+        instrumentation_lib.count("resolver_attempts", get_attempts())
+        return result
@@ -8,19 +8,41 @@ from randovania.game_description.requirements.base import Requirement
 from randovania.game_description.requirements.requirement_and import RequirementAnd
 from randovania.game_description.requirements.requirement_list import RequirementList, SatisfiableRequirements
 from randovania.game_description.requirements.requirement_set import RequirementSet
+from randovania.game_description.resources.resource_database import ResourceDatabase
+from randovania.game_description.resources.resource_info import ResourceCollection
 from randovania.game_description.world.node import Node
 from randovania.game_description.world.resource_node import ResourceNode
+from randovania.lib import instrumentation_lib, linked_list_lib
+from randovania.lib.linked_list_lib import LinkedList
 from randovania.resolver import debug
 from randovania.resolver.logic import Logic
 from randovania.resolver.state import State
 
+# Requirement, energy when evaluated, satisfied, damage and the mask of resources the requirement depends on
+EdgeEvaluation = tuple[Requirement, int, bool, int, int]
+
+
+def _requirement_resource_mask(requirement: Requirement, database: ResourceDatabase) -> int:
+    """
+    Calculates a bitmask of all resources the given requirement depends on.
+    Damage depends on damage reductions that aren't part of the requirement, so these use a mask with all bits set.
+    """
+    mask = 0
+    for individual in requirement.iterate_resource_requirements(database):
+        if individual.is_damage:
+            return -1
+        mask |= 1 << individual.resource.resource_index
+    return mask
+
 
 class ResolverReach:
     _node_indices: tuple[int, ...]
     _energy_at_node: dict[int, int]
-    _path_to_node: dict[int, list[int]]
+    _path_to_node: dict[int, LinkedList[int]]
     _satisfiable_requirements: SatisfiableRequirements
     _logic: Logic
+    _resources: ResourceCollection | None
+    _edge_evaluations: dict[tuple[int, int], EdgeEvaluation]
 
     @property
     def nodes(self) -> Iterator[Node]:
@@ -36,7 +58,7 @@ class ResolverReach:
         all_nodes = self._logic.game.world_list.all_nodes
         return tuple(
             all_nodes[part]
-            for part in self._path_to_node[node.node_index]
+            for part in linked_list_lib.to_tuple(self._path_to_node[node.node_index])
         )
 
     @property
@@ -45,24 +67,49 @@ class ResolverReach:
 
     def __init__(self,
                  nodes: dict[int, int],
-                 path_to_node: dict[int, list[int]],
+                 path_to_node: dict[int, LinkedList[int]],
                  requirements: SatisfiableRequirements,
-                 logic: Logic):
+                 logic: Logic,
+                 resources: ResourceCollection | None = None,
+                 edge_evaluations: dict[tuple[int, int], EdgeEvaluation] | None = None):
         self._node_indices = tuple(nodes.keys())
         self._energy_at_node = nodes
         self._logic = logic
         self._path_to_node = path_to_node
         self._satisfiable_requirements = requirements
+        self._resources = resources
+        self._edge_evaluations = edge_evaluations if edge_evaluations is not None else {}
 
     @classmethod
+    @instrumentation_lib.timed("resolver_reach")
     def calculate_reach(cls,
                         logic: Logic,
-                        initial_state: State) -> "ResolverReach":
+                        initial_state: State,
+                        parent: typing.Optional["ResolverReach"] = None) -> "ResolverReach":
+        """
+        Calculates all nodes reachable from the given state.
+        :param logic:
+        :param initial_state:
+        :param parent: A reach calculated for an earlier state in the same Logic. When given, the evaluation of every
+        connection whose requirement, energy and relevant resources didn't change since is reused instead of evaluated.
+        :return:
+        """
 
         all_nodes = logic.game.world_list.all_nodes
         checked_nodes: dict[int, int] = {}
         database = initial_state.resource_database
+        resources = initial_state.resources
         context = initial_state.node_context()
+        trivial = Requirement.trivial()
+
+        if parent is not None and parent._resources is not None:
+            previous_evaluations = parent._edge_evaluations
+            changed_mask = resources.changed_resources_mask(parent._resources)
+        else:
+            previous_evaluations = {}
+            changed_mask = -1
+
+        edge_evaluations: dict[tuple[int, int], EdgeEvaluation] = {}
 
         # Keys: nodes to check
         # Value: how much energy was available when visiting that node
@@ -73,8 +120,9 @@ class ResolverReach:
         reach_nodes: dict[int, int] = {}
         requirements_by_node: dict[int, set[RequirementList]] = defaultdict(set)
 
-        path_to_node: dict[int, list[int]] = {
-            initial_state.node.node_index: [],
+        # The paths share their beginning with the path of the node they came from
+        path_to_node: dict[int, LinkedList[int]] = {
+            initial_state.node.node_index: None,
         }
 
         while nodes_to_check:
@@ -90,6 +138,13 @@ class ResolverReach:
                 reach_nodes[node_index] = energy
 
             requirement_to_leave = node.requirement_to_leave(context)
+            if requirement_to_leave != trivial:
+                leave_satisfied = requirement_to_leave.satisfied(resources, energy, database)
+                leave_damage = requirement_to_leave.damage(resources, database) if leave_satisfied else 0
+            else:
+                requirement_to_leave = None
+                leave_satisfied = True
+                leave_damage = 0
 
             for target_node, requirement in logic.game.world_list.potential_nodes_from(node, context):
                 target_node_index = target_node.node_index
@@ -98,27 +153,35 @@ class ResolverReach:
                                                                                                   math.inf) <= energy:
                     continue
 
-                if requirement_to_leave != Requirement.trivial():
-                    requirement = RequirementAnd([requirement, requirement_to_leave])
-
                 # Check if the normal requirements to reach that node is satisfied
-                satisfied = requirement.satisfied(initial_state.resources, energy, database)
+                edge = (node_index, target_node_index)
+                evaluation = previous_evaluations.get(edge)
+                if (evaluation is None or evaluation[0] is not requirement or evaluation[1] != energy
+                        or evaluation[4] & changed_mask):
+                    if evaluation is not None and evaluation[0] is requirement:
+                        mask = evaluation[4]
+                    else:
+                        mask = _requirement_resource_mask(requirement, database)
+                    satisfied = requirement.satisfied(resources, energy, database)
+                    evaluation = (requirement, energy, satisfied,
+                                  requirement.damage(resources, database) if satisfied else 0, mask)
+                edge_evaluations[edge] = evaluation
+
+                satisfied = evaluation[2] and leave_satisfied
                 if satisfied:
                     # If it is, check if we additional requirements figured out by backtracking is satisfied
-                    satisfied = logic.get_additional_requirements(node).satisfied(initial_state.resources,
-                                                                                  energy,
-                                                                                  initial_state.resource_database)
+                    satisfied = logic.get_additional_requirements(node).satisfied(resources, energy, database)
 
                 if satisfied:
-                    nodes_to_check[target_node_index] = energy - requirement.damage(initial_state.resources, database)
-                    path_to_node[target_node_index] = list(path_to_node[node_index])
-                    path_to_node[target_node_index].append(node_index)
+                    nodes_to_check[target_node_index] = energy - evaluation[3] - leave_damage
+                    path_to_node[target_node_index] = linked_list_lib.append(path_to_node[node_index], node_index)
 
                 elif target_node:
                     # If we can't go to this node, store the reason in order to build the satisfiable requirements.
                     # Note we ignore the 'additional requirements' here because it'll be added on the end.
-                    requirements_by_node[target_node_index].update(
-                        requirement.as_set(initial_state.resource_database).alternatives)
+                    if requirement_to_leave is not None:
+                        requirement = RequirementAnd([requirement, requirement_to_leave])
+                    requirements_by_node[target_node_index].update(requirement.as_set(database).alternatives)
 
         # Discard satisfiable requirements of nodes reachable by other means
         for node_index in set(reach_nodes.keys()).intersection(requirements_by_node.keys()):
@@ -134,7 +197,9 @@ class ResolverReach:
 
         return ResolverReach(reach_nodes, path_to_node,
                              satisfiable_requirements,
-                             logic)
+                             logic,
+                             resources,
+                             edge_evaluations)
 
     def possible_actions(self,
                          state: State) -> Iterator[tuple[ResourceNode, int]]:
@@ -14,6 +14,8 @@ from randovania.game_description.world.node_identifier import NodeIdentifier
 from randovania.game_description.world.pickup_node import PickupNode
 from randovania.game_description.world.resource_node import ResourceNode
 from randovania.game_description.world.world_list import WorldList
+from randovania.lib import linked_list_lib
+from randovania.lib.linked_list_lib import LinkedList
 
 
 def _energy_tank_difference(new_resources: ResourceCollection,
@@ -31,9 +33,14 @@ class StateGameData:
     starting_energy: int
 
 
+def _is_linked_list(value: tuple) -> bool:
+    # A linked list is a pair of a node and another linked list. A tuple of nodes never ends with a tuple or None.
+    return len(value) == 2 and (value[1] is None or isinstance(value[1], tuple))
+
+
 class State:
     resources: ResourceCollection
-    collected_resource_nodes: tuple[ResourceNode, ...]
+    _collected_resource_nodes: LinkedList[ResourceNode]
     energy: int
     node: Node
     patches: GamePatches
@@ -51,15 +58,22 @@ class State:
 
     def __init__(self,
                  resources: ResourceCollection,
-                 collected_resource_nodes: tuple[ResourceNode, ...],
+                 collected_resource_nodes: LinkedList[ResourceNode],
                  energy: int | None,
                  node: Node,
                  patches: GamePatches,
                  previous: Optional["State"],
                  game_data: StateGameData):
+        """
+        :param collected_resource_nodes: A linked_list_lib.LinkedList, where None means no nodes.
+            A tuple of nodes, as accepted before, is converted.
+        """
+
+        if isinstance(collected_resource_nodes, tuple) and not _is_linked_list(collected_resource_nodes):
+            collected_resource_nodes = linked_list_lib.from_iterable(collected_resource_nodes)
 
         self.resources = resources
-        self.collected_resource_nodes = collected_resource_nodes
+        self._collected_resource_nodes = collected_resource_nodes
         self.node = node
         self.patches = patches
         self.path_from_previous_state = ()
@@ -71,9 +85,13 @@ class State:
             energy = self.maximum_energy
         self.energy = min(energy, self.maximum_energy)
 
+    @property
+    def collected_resource_nodes(self) -> tuple[ResourceNode, ...]:
+        return linked_list_lib.to_tuple(self._collected_resource_nodes)
+
     def copy(self) -> "State":
         return State(self.resources.duplicate(),
-                     self.collected_resource_nodes,
+                     self._collected_resource_nodes,
                      self.energy,
                      self.node,
                      self.patches,
@@ -102,12 +120,12 @@ class State:
                 yield resource
 
     def take_damage(self, damage: int) -> "State":
-        return State(self.resources, self.collected_resource_nodes, self.energy - damage, self.node, self.patches, self,
-                     self.game_data)
+        return State(self.resources, self._collected_resource_nodes, self.energy - damage, self.node, self.patches,
+                     self, self.game_data)
 
     def heal(self) -> "State":
-        return State(self.resources, self.collected_resource_nodes, self.maximum_energy, self.node, self.patches, self,
-                     self.game_data)
+        return State(self.resources, self._collected_resource_nodes, self.maximum_energy, self.node, self.patches,
+                     self, self.game_data)
 
     def _energy_for(self, resources: ResourceCollection) -> int:
         num_tanks = resources[self.game_data.resource_database.energy_tank]
@@ -137,8 +155,8 @@ class State:
         if _energy_tank_difference(new_resources, self.resources, self.resource_database) > 0:
             energy = self._energy_for(new_resources)
 
-        return State(new_resources, self.collected_resource_nodes + (node,), energy, self.node, self.patches, self,
-                     self.game_data)
+        return State(new_resources, linked_list_lib.append(self._collected_resource_nodes, node), energy, self.node,
+                     self.patches, self, self.game_data)
 
     def act_on_node(self, node: ResourceNode, path: tuple[Node, ...] = (), new_energy: int | None = None) -> "State":
         if new_energy is None:
@@ -162,7 +180,7 @@ class State:
 
         return State(
             new_resources,
-            self.collected_resource_nodes,
+            self._collected_resource_nodes,
             energy,
             self.node,
             self.patches,
@@ -188,7 +206,7 @@ class State:
 
         return State(
             new_resources,
-            self.collected_resource_nodes,
+            self._collected_resource_nodes,
             self.energy + tank_delta * self.game_data.energy_per_tank,
             self.node,
             new_patches,
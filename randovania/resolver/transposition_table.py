@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from randovania.resolver.state import State
+
+# How many states are remembered by default
+DEFAULT_MAX_ENTRIES = 20_000
+
+StateKey = tuple[int, int, int, tuple[tuple[int, int], ...]]
+
+
+def state_key(state: State) -> StateKey:
+    """
+    Creates a key that is the same for all states with the same node, energy and resources,
+    regardless of the order in which the resources were collected.
+    :param state:
+    :return:
+    """
+    resources = state.resources
+    return state.node.node_index, state.energy, resources.resource_bitmask, resources.counts_signature
+
+
+class TranspositionTable:
+    """
+    Remembers which states were already fully explored by the resolver without reaching victory.
+    Since the resolver returns as soon as victory is reached, only dead ends are stored.
+    When full, the least recently used entries are discarded first.
+    """
+    __slots__ = ("max_entries", "_dead_ends", "hits", "misses")
+    max_entries: int
+    _dead_ends: dict[StateKey, bool]
+    hits: int
+    misses: int
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._dead_ends = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._dead_ends)
+
+    def get_dead_end(self, key: StateKey) -> bool | None:
+        """
+        Checks if the state with the given key is a known dead end.
+        :param key:
+        :return: The `has_action` of the dead end, or None if the state isn't known.
+        """
+        has_action = self._dead_ends.pop(key, None)
+        if has_action is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Re-insert at the end, so it's the last to be discarded
+        self._dead_ends[key] = has_action
+        return has_action
+
+    def add_dead_end(self, key: StateKey, has_action: bool):
+        if self.max_entries <= 0:
+            return
+
+        if key not in self._dead_ends and len(self._dead_ends) >= self.max_entries:
+            del self._dead_ends[next(iter(self._dead_ends))]
+        self._dead_ends[key] = has_action
@@ -5,7 +5,6 @@ from typing import Iterator, Callable, Any
 
 import peewee
 
-from randovania.game_description.resources.pickup_index import PickupIndex
 from randovania.games.game import RandovaniaGame
 from randovania.layout.layout_description import LayoutDescription
 from randovania.layout.preset import Preset
@@ -13,6 +12,7 @@ from randovania.layout.versioned_preset import VersionedPreset
 from randovania.network_common.binary_formats import BinaryGameSessionEntry, BinaryGameSessionActions, \
     BinaryGameSessionAuditLog
 from randovania.network_common.session_state import GameSessionState
+from randovania.server import session_pickups
 
 db = peewee.SqliteDatabase(None, pragmas={'foreign_keys': 1})
 
@@ -99,6 +99,7 @@ class GameSession(BaseModel):
 
     @layout_description.setter
     def layout_description(self, description: LayoutDescription | None):
+        session_pickups.evict_session(self.id)
         if description is not None:
             self.layout_description_json = json.dumps(description.as_json(force_spoiler=True))
         else:
@@ -127,8 +128,21 @@ class GameSession(BaseModel):
             if game.data.defaults_available_in_game_sessions or game.value in dev_features
         ]
 
-    def describe_actions(self):
-        description = self.layout_description
+    def _query_actions(self):
+        # The rest of the primary key is a tiebreaker, so the order is always the same for the deltas
+        return GameSessionTeamAction.select().where(GameSessionTeamAction.session == self).order_by(
+            GameSessionTeamAction.time.asc(),
+            GameSessionTeamAction.provider_row.asc(),
+            GameSessionTeamAction.provider_location_index.asc(),
+        )
+
+    def describe_actions(self, start: int = 0) -> tuple[bytes, int]:
+        """
+        Encodes the actions of this session, skipping the first `start` of them.
+        :param start:
+        :return: The encoded actions, and how many actions were encoded.
+        """
+        pickup_table = session_pickups.table_for_session(self)
         location_to_name = {
             row: f"Player {row + 1}" for row in range(self.num_rows)
         }
@@ -139,24 +153,24 @@ class GameSession(BaseModel):
         def _describe_action(action: GameSessionTeamAction) -> dict:
             provider: int = action.provider_row
             receiver: int = action.receiver_row
-            provider_location_index = PickupIndex(action.provider_location_index)
+            provider_location_index: int = action.provider_location_index
             time = datetime.datetime.fromisoformat(action.time)
-            target = description.all_patches[provider].pickup_assignment[provider_location_index]
+            target = pickup_table.get_target(provider, provider_location_index)
 
             return {
                 "provider": location_to_name[provider],
                 "provider_row": provider,
                 "receiver": location_to_name[receiver],
-                "pickup": target.pickup.name,
-                "location": provider_location_index.index,
+                "pickup": target.pickup_name,
+                "location": provider_location_index,
                 "time": time.astimezone(datetime.timezone.utc).isoformat(),
             }
 
-        return BinaryGameSessionActions.build([
+        actions = [
             _describe_action(action)
-            for action in GameSessionTeamAction.select().where(GameSessionTeamAction.session == self
-                                                               ).order_by(GameSessionTeamAction.time.asc())
-        ])
+            for action in self._query_actions().offset(start)
+        ]
+        return BinaryGameSessionActions.build(actions), len(actions)
 
     def create_session_entry(self):
         description = self.layout_description
@@ -187,13 +201,23 @@ class GameSession(BaseModel):
             "allowed_games": [game.value for game in self.allowed_games],
         })
 
-    def get_audit_log(self):
-        return BinaryGameSessionAuditLog.build([
+    def _query_audit_log(self):
+        return self.audit_log.order_by(GameSessionAudit.id.asc())
+
+    def get_audit_log(self, start: int = 0) -> tuple[bytes, int]:
+        """
+        Encodes the audit log of this session, skipping the first `start` entries.
+        :param start:
+        :return: The encoded entries, and how many entries were encoded.
+        """
+        entries = [
             entry.as_json
-            for entry in self.audit_log
-        ])
+            for entry in self._query_audit_log().offset(start)
+        ]
+        return BinaryGameSessionAuditLog.build(entries), len(entries)
 
     def reset_layout_description(self):
+        session_pickups.evict_session(self.id)
         self.layout_description_json = None
         self.save()
 
@@ -1,4 +1,4 @@
-import base64
+import collections
 import hashlib
 import json
 import logging
@@ -10,27 +10,22 @@ import flask_socketio
 import peewee
 from playhouse import flask_utils
 
-from randovania.bitpacking import bitpacking
 from randovania.game_description import default_database
-from randovania.game_description.assignment import PickupTarget
 from randovania.game_description.resources.item_resource_info import ItemResourceInfo
-from randovania.game_description.resources.pickup_entry import PickupEntry
-from randovania.game_description.resources.pickup_index import PickupIndex
-from randovania.game_description.resources.resource_database import ResourceDatabase
 from randovania.interface_common.players_configuration import PlayersConfiguration
-from randovania.interface_common.preset_manager import PresetManager
 from randovania.layout.layout_description import LayoutDescription
 from randovania.layout.versioned_preset import VersionedPreset
 from randovania.network_common.admin_actions import SessionAdminGlobalAction, SessionAdminUserAction
 from randovania.network_common.binary_formats import BinaryInventory, OldBinaryInventory
 from randovania.network_common.error import (WrongPassword, NotAuthorizedForAction, InvalidAction)
-from randovania.network_common.pickup_serializer import BitPackPickupEntry
 from randovania.network_common.session_state import GameSessionState
-from randovania.server import database
+from randovania.server import database, preset_registry, session_pickups
 from randovania.server.database import (GameSession, GameSessionMembership, GameSessionTeamAction, GameSessionPreset,
                                         GameSessionAudit)
 from randovania.server.lib import logger
+from randovania.server.self_update_buffer import SelfUpdateBuffer
 from randovania.server.server_app import ServerApp
+from randovania.server.session_emitter import SessionUpdate
 
 
 def _describe_session(session: GameSession, membership: GameSessionMembership | None = None) -> str:
@@ -57,7 +52,7 @@ def create_game_session(sio: ServerApp, session_name: str):
             creator=current_user,
         )
         GameSessionPreset.create(session=new_session, row=0,
-                                 preset=json.dumps(PresetManager(None).default_preset.as_json))
+                                 preset=preset_registry.default_preset_json())
         membership = GameSessionMembership.create(
             user=sio.get_current_user(), session=new_session,
             row=0, admin=True, connection_state="Online, Unknown")
@@ -75,11 +70,13 @@ def join_game_session(sio: ServerApp, session_id: int, password: str | None):
     elif password is not None:
         raise WrongPassword()
 
-    membership = GameSessionMembership.get_or_create(user=sio.get_current_user(), session=session,
+    current_user = sio.get_current_user()
+    sio.self_update_buffer.flush_user(current_user.id)
+    membership = GameSessionMembership.get_or_create(user=current_user, session=session,
                                                      defaults={"row": None, "admin": False,
                                                                "connection_state": "Online, Unknown"})[0]
 
-    _emit_session_meta_update(session)
+    _emit_session_meta_update(sio, session)
     sio.join_game_session(membership)
 
     return session.create_session_entry()
@@ -87,11 +84,12 @@ def join_game_session(sio: ServerApp, session_id: int, password: str | None):
 
 def disconnect_game_session(sio: ServerApp, session_id: int):
     current_user = sio.get_current_user()
+    sio.self_update_buffer.flush_user(current_user.id)
     try:
         current_membership = GameSessionMembership.get_by_ids(current_user.id, session_id)
         current_membership.connection_state = "Offline"
         current_membership.save()
-        _emit_session_meta_update(current_membership.session)
+        _emit_session_meta_update(sio, current_membership.session)
     except peewee.DoesNotExist:
         pass
     sio.leave_game_session()
@@ -131,29 +129,21 @@ def _verify_no_layout_description(session: GameSession):
 
 def _get_preset(preset_json: dict) -> VersionedPreset:
     try:
-        preset = VersionedPreset(preset_json)
-        preset.get_preset()  # test if valid
-        return preset
+        return preset_registry.validated_preset(preset_json)
     except Exception as e:
         raise InvalidAction(f"invalid preset: {e}")
 
 
-def _emit_session_meta_update(session: GameSession):
-    logger().debug("game_session_meta_update for session %d (%s)", session.id, session.name)
-    flask_socketio.emit("game_session_meta_update", session.create_session_entry(), room=f"game-session-{session.id}",
-                        namespace="/")
+def _emit_session_meta_update(sio: ServerApp, session: GameSession):
+    sio.session_emitter.schedule(session, SessionUpdate.META)
 
 
-def _emit_session_actions_update(session: GameSession):
-    logger().debug("game_session_actions_update for session %d (%s)", session.id, session.name)
-    flask_socketio.emit("game_session_actions_update", session.describe_actions(), room=f"game-session-{session.id}",
-                        namespace="/")
+def _emit_session_actions_update(sio: ServerApp, session: GameSession):
+    sio.session_emitter.schedule(session, SessionUpdate.ACTIONS)
 
 
-def _emit_session_audit_update(session: GameSession):
-    logger().debug("game_session_audit_update for session %d (%s)", session.id, session.name)
-    flask_socketio.emit("game_session_audit_update", session.get_audit_log(), room=f"game-session-{session.id}",
-                        namespace="/")
+def _emit_session_audit_update(sio: ServerApp, session: GameSession):
+    sio.session_emitter.schedule(session, SessionUpdate.AUDIT)
 
 
 def _add_audit_entry(sio: ServerApp, session: GameSession, message: str):
@@ -162,22 +152,25 @@ def _add_audit_entry(sio: ServerApp, session: GameSession, message: str):
         user=sio.get_current_user(),
         message=message
     )
-    _emit_session_audit_update(session)
+    _emit_session_audit_update(sio, session)
 
 
-def game_session_request_update(sio: ServerApp, session_id: int):
+def game_session_request_update(sio: ServerApp, session_id: int, known_pickups: int = 0):
+    """
+    Sends to the current user everything about the session.
+    :param sio:
+    :param session_id:
+    :param known_pickups: How many pickups the user already has from a previous update, so only the ones after are sent.
+    :return:
+    """
     current_user = sio.get_current_user()
     session: GameSession = GameSession.get_by_id(session_id)
     membership = GameSessionMembership.get_by_ids(current_user.id, session_id)
 
-    _emit_session_meta_update(session)
-    if session.layout_description is not None:
-        _emit_session_actions_update(session)
+    sio.session_emitter.emit_session_state(session)
 
     if not membership.is_observer and session.state != GameSessionState.SETUP:
-        _emit_game_session_pickups_update(sio, membership)
-
-    _emit_session_audit_update(session)
+        _emit_game_session_pickups_update(sio, membership, known_pickups)
 
 
 def _create_row(sio: ServerApp, session: GameSession, preset_json: dict):
@@ -454,11 +447,12 @@ def game_session_admin_session(sio: ServerApp, session_id: int, action: str, arg
     elif action == SessionAdminGlobalAction.DELETE_SESSION:
         logger().info(f"{_describe_session(session)}: Deleting session.")
         session.delete_instance(recursive=True)
+        session_pickups.evict_session(session.id)
 
     elif action == SessionAdminGlobalAction.REQUEST_PERMALINK:
         return _get_permalink(sio, session)
 
-    _emit_session_meta_update(session)
+    _emit_session_meta_update(sio, session)
 
 
 def _find_empty_row(session: GameSession) -> int:
@@ -485,6 +479,7 @@ def game_session_admin_player(sio: ServerApp, session_id: int, user_id: int, act
         membership.delete_instance()
         if not list(session.players):
             session.delete_instance(recursive=True)
+            session_pickups.evict_session(session.id)
             logger().info(f"{_describe_session(session)}. Kicking user {user_id} and deleting session.")
         else:
             logger().info(f"{_describe_session(session)}. Kicking user {user_id}.")
@@ -567,7 +562,7 @@ def game_session_admin_player(sio: ServerApp, session_id: int, user_id: int, act
         # FIXME
         raise InvalidAction("Abandon is NYI")
 
-    _emit_session_meta_update(session)
+    _emit_session_meta_update(sio, session)
 
 
 def _query_for_actions(membership: GameSessionMembership) -> peewee.ModelSelect:
@@ -575,27 +570,27 @@ def _query_for_actions(membership: GameSessionMembership) -> peewee.ModelSelect:
         GameSessionTeamAction.provider_row != membership.row,
         GameSessionTeamAction.session == membership.session,
         GameSessionTeamAction.receiver_row == membership.row,
-    ).order_by(GameSessionTeamAction.time.asc())
-
-
-def _base64_encode_pickup(pickup: PickupEntry, resource_database: ResourceDatabase) -> str:
-    encoded_pickup = bitpacking.pack_value(BitPackPickupEntry(pickup, resource_database))
-    return base64.b85encode(encoded_pickup).decode("utf-8")
+    ).order_by(
+        # The rest of the primary key is a tiebreaker, so the order is always the same for the deltas
+        GameSessionTeamAction.time.asc(),
+        GameSessionTeamAction.provider_row.asc(),
+        GameSessionTeamAction.provider_location_index.asc(),
+    )
 
 
 def _collect_location(session: GameSession, membership: GameSessionMembership,
-                      description: LayoutDescription,
+                      pickup_table: session_pickups.SessionPickupTable,
                       pickup_location: int) -> int | None:
     """
     Collects the pickup in the given location. Returns
     :param session:
     :param membership:
-    :param description:
+    :param pickup_table:
     :param pickup_location:
     :return: The rewarded player if some player must be updated of the fact.
     """
     player_row: int = membership.row
-    pickup_target = _get_pickup_target(description, player_row, pickup_location)
+    pickup_target = pickup_table.get_target(player_row, pickup_location)
 
     def log(msg):
         logger().info(f"{_describe_session(session, membership)} found item at {pickup_location}. {msg}")
@@ -604,8 +599,8 @@ def _collect_location(session: GameSession, membership: GameSessionMembership,
         log(f"It's an ETM.")
         return None
 
-    if pickup_target.player == membership.row:
-        log(f"It's a {pickup_target.pickup.name} for themselves.")
+    if pickup_target.receiver == membership.row:
+        log(f"It's a {pickup_target.pickup_name} for themselves.")
         return None
 
     try:
@@ -613,15 +608,15 @@ def _collect_location(session: GameSession, membership: GameSessionMembership,
             session=session,
             provider_row=membership.row,
             provider_location_index=pickup_location,
-            receiver_row=pickup_target.player,
+            receiver_row=pickup_target.receiver,
         )
     except peewee.IntegrityError:
         # Already exists and it's for another player, no inventory update needed
-        log(f"It's a {pickup_target.pickup.name} for {pickup_target.player}, but it was already collected.")
+        log(f"It's a {pickup_target.pickup_name} for {pickup_target.receiver}, but it was already collected.")
         return None
 
-    log(f"It's a {pickup_target.pickup.name} for {pickup_target.player}.")
-    return pickup_target.player
+    log(f"It's a {pickup_target.pickup_name} for {pickup_target.receiver}.")
+    return pickup_target.receiver
 
 
 def game_session_collect_locations(sio: ServerApp, session_id: int, pickup_locations: tuple[int, ...]):
@@ -636,36 +631,38 @@ def game_session_collect_locations(sio: ServerApp, session_id: int, pickup_locat
         raise InvalidAction("Observers can't collect locations")
 
     logger().info(f"{_describe_session(session, membership)} found items {pickup_locations}")
-    description = session.layout_description
+    pickup_table = session_pickups.table_for_session(session)
 
-    receiver_players = set()
+    new_pickups_for_player: dict[int, int] = collections.defaultdict(int)
     for location in pickup_locations:
-        receiver_player = _collect_location(session, membership, description, location)
+        receiver_player = _collect_location(session, membership, pickup_table, location)
         if receiver_player is not None:
-            receiver_players.add(receiver_player)
+            new_pickups_for_player[receiver_player] += 1
 
-    if not receiver_players:
+    if not new_pickups_for_player:
         return
 
-    for receiver_player in receiver_players:
+    for receiver_player, new_pickups in new_pickups_for_player.items():
         try:
             receiver_membership = GameSessionMembership.get_by_session_position(session, row=receiver_player)
-            _emit_game_session_pickups_update(sio, receiver_membership)
+            # Only the new pickups are sent, as the receiver already got all the others
+            _emit_game_session_pickups_update(sio, receiver_membership,
+                                              _query_for_actions(receiver_membership).count() - new_pickups)
         except peewee.DoesNotExist:
             pass
-    _emit_session_actions_update(session)
-
-
-def _get_resource_database(description: LayoutDescription, player: int) -> ResourceDatabase:
-    return default_database.resource_database_for(description.get_preset(player).game)
+    _emit_session_actions_update(sio, session)
 
 
-def _get_pickup_target(description: LayoutDescription, provider: int, location: int) -> PickupTarget | None:
-    pickup_assignment = description.all_patches[provider].pickup_assignment
-    return pickup_assignment.get(PickupIndex(location))
-
-
-def _emit_game_session_pickups_update(sio: ServerApp, membership: GameSessionMembership):
+def _emit_game_session_pickups_update(sio: ServerApp, membership: GameSessionMembership, start: int = 0):
+    """
+    Sends the pickups the given player received from other players, starting with the `start`-th one.
+    The client appends these to the ones it already has. When `start` is after the last pickup, which means
+    the client has pickups the server doesn't know about, all pickups are sent instead.
+    :param sio:
+    :param membership:
+    :param start: How many pickups the client already has.
+    :return:
+    """
     session: GameSession = membership.session
 
     if session.state == GameSessionState.SETUP:
@@ -674,18 +671,22 @@ def _emit_game_session_pickups_update(sio: ServerApp, membership: GameSessionMem
     if membership.is_observer:
         raise RuntimeError("Unable to emit pickups for observers")
 
-    description = session.layout_description
+    pickup_table = session_pickups.table_for_session(session)
     row_to_member_name = {
         member.row: member.effective_name
         for member in GameSessionMembership.non_observer_members(session)
     }
 
-    resource_database = _get_resource_database(description, membership.row)
+    game = pickup_table.games[membership.row]
+
+    query = _query_for_actions(membership)
+    if start < 0 or start > query.count():
+        start = 0
 
     result = []
-    actions: list[GameSessionTeamAction] = list(_query_for_actions(membership))
+    actions: list[GameSessionTeamAction] = list(query.offset(start))
     for action in actions:
-        pickup_target = _get_pickup_target(description, action.provider_row, action.provider_location_index)
+        pickup_target = pickup_table.get_target(action.provider_row, action.provider_location_index)
 
         if pickup_target is None:
             logging.error(f"Action {action} has a location index with nothing.")
@@ -694,14 +695,15 @@ def _emit_game_session_pickups_update(sio: ServerApp, membership: GameSessionMem
             name = row_to_member_name.get(action.provider_row, f"Player {action.provider_row + 1}")
             result.append({
                 "provider_name": name,
-                "pickup": _base64_encode_pickup(pickup_target.pickup, resource_database),
+                "pickup": pickup_target.encoded_pickup,
             })
 
     logger().info(f"{_describe_session(session, membership)} "
-                  f"notifying {resource_database.game_enum.value} of {len(result)} pickups.")
+                  f"notifying {game.value} of {len(result)} pickups, starting at {start}.")
 
     data = {
-        "game": resource_database.game_enum.value,
+        "game": game.value,
+        "start": start,
         "pickups": result,
     }
     flask_socketio.emit("game_session_pickups_update", data, room=f"game-session-{session.id}-{membership.user.id}")
@@ -709,16 +711,9 @@ def _emit_game_session_pickups_update(sio: ServerApp, membership: GameSessionMem
 
 def game_session_self_update(sio: ServerApp, session_id: int, inventory: bytes, game_connection_state: str):
     current_user = sio.get_current_user()
-    membership = GameSessionMembership.get_by_ids(current_user.id, session_id)
 
-    old_state = membership.connection_state
-    # old_inventory = membership.inventory
-
-    membership.connection_state = f"Online, {game_connection_state}"
-    membership.inventory = inventory
-    membership.save()
-    if old_state != membership.connection_state:
-        _emit_session_meta_update(membership.session)
+    if sio.self_update_buffer.update(current_user.id, session_id, inventory, f"Online, {game_connection_state}"):
+        _emit_session_meta_update(sio, GameSession.get_by_id(session_id))
 
 
 def report_user_disconnected(sio: ServerApp, user_id: int, log):
@@ -726,6 +721,7 @@ def report_user_disconnected(sio: ServerApp, user_id: int, log):
         GameSessionMembership.user == user_id))
 
     log.info(f"User {user_id} is disconnected, disconnecting from sessions: {memberships}")
+    sio.self_update_buffer.flush_user(user_id)
     sessions_to_update = []
 
     for membership in memberships:
@@ -735,10 +731,14 @@ def report_user_disconnected(sio: ServerApp, user_id: int, log):
             membership.save()
 
     for session in sessions_to_update:
-        _emit_session_meta_update(session)
+        _emit_session_meta_update(sio, session)
 
 
 def setup_app(sio: ServerApp):
+    # Read the included presets now, instead of in the first session created
+    preset_registry.default_preset_json()
+    sio.self_update_buffer = SelfUpdateBuffer(sio)
+
     sio.on("list_game_sessions", list_game_sessions, with_header_check=True)
     sio.on("create_game_session", create_game_session, with_header_check=True)
     sio.on("join_game_session", join_game_session, with_header_check=True)
@@ -795,6 +795,8 @@ def setup_app(sio: ServerApp):
 
     @sio.admin_route("/session/<session_id>")
     def admin_session(user, session_id):
+        # Make sure the inventories are up to date
+        sio.self_update_buffer.flush()
         session: GameSession = GameSession.get_by_id(session_id)
 
         rows = []
@@ -0,0 +1,73 @@
+"""
+Presets used by the server. The included presets are read only once per process, and presets sent by clients are
+migrated and validated only once for each distinct content.
+"""
+import collections
+import functools
+import hashlib
+import json
+import types
+import uuid
+
+from randovania.interface_common.preset_manager import read_preset_list
+from randovania.layout.versioned_preset import VersionedPreset
+
+# How many distinct presets sent by clients are kept already validated.
+MAX_CACHED_PRESETS = 256
+
+_validated_presets: collections.OrderedDict[str, VersionedPreset] = collections.OrderedDict()
+
+
+@functools.cache
+def included_presets() -> types.MappingProxyType[uuid.UUID, VersionedPreset]:
+    """
+    All presets included with Randovania, in the same order as PresetManager.
+    :return:
+    """
+    return types.MappingProxyType({
+        preset.uuid: preset
+        for preset in [VersionedPreset.from_file_sync(f) for f in read_preset_list()]
+    })
+
+
+@functools.cache
+def default_preset_json() -> str:
+    """
+    The encoded preset that new sessions start with.
+    :return:
+    """
+    for preset in included_presets().values():
+        return json.dumps(preset.as_json)
+    raise ValueError(f"No included presets")
+
+
+def _preset_key(preset_json: dict) -> str:
+    return hashlib.sha256(json.dumps(preset_json, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def validated_preset(preset_json: dict) -> VersionedPreset:
+    """
+    Gets a VersionedPreset for the given json, migrated to the current version.
+    Raises an exception if the preset is invalid.
+    :param preset_json:
+    :return:
+    """
+    key = _preset_key(preset_json)
+
+    preset = _validated_presets.get(key)
+    if preset is not None:
+        _validated_presets.move_to_end(key)
+        return preset
+
+    preset = VersionedPreset(preset_json)
+    preset.get_preset()  # test if valid
+
+    _validated_presets[key] = preset
+    while len(_validated_presets) > MAX_CACHED_PRESETS:
+        _validated_presets.popitem(last=False)
+
+    return preset
+
+
+def clear_cache():
+    _validated_presets.clear()
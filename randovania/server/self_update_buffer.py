@@ -0,0 +1,114 @@
+"""
+Players send their inventory to the server every time it changes. Instead of writing each one to the database as it
+arrives, the latest inventory of each player is kept in memory and all are written together periodically.
+Changes to the connection state are still written right away, as everyone in the session is told about them.
+"""
+from __future__ import annotations
+
+import typing
+
+import prometheus_client
+
+from randovania.server import database
+from randovania.server.database import GameSessionMembership
+
+if typing.TYPE_CHECKING:
+    from randovania.server.server_app import ServerApp
+
+# How long inventories wait in memory before being written to the database, in seconds.
+FLUSH_INTERVAL = 2.0
+
+MembershipKey = tuple[int, int]
+
+
+class SelfUpdateBuffer:
+    # The latest inventory of each (user id, session id) not yet written
+    _pending_inventories: dict[MembershipKey, bytes]
+    # The connection state in the database of each (user id, session id) that sent an update
+    _connection_states: dict[MembershipKey, str]
+    _flush_scheduled: bool = False
+
+    def __init__(self, sio: ServerApp):
+        self.sio = sio
+        self._pending_inventories = {}
+        self._connection_states = {}
+
+        self._queue_depth = prometheus_client.Gauge("self_update_queue_depth",
+                                                     "How many inventories are waiting to be written to the database.",
+                                                     registry=sio.metrics.registry)
+        self._flush_latency = prometheus_client.Summary("self_update_flush",
+                                                        "How long writing the pending inventories takes.",
+                                                        registry=sio.metrics.registry)
+
+    def update(self, user_id: int, session_id: int, inventory: bytes, connection_state: str) -> bool:
+        """
+        Stores the new inventory and connection state of the given player.
+        :param user_id:
+        :param session_id:
+        :param inventory:
+        :param connection_state:
+        :return: True if the connection state changed.
+        """
+        key = (user_id, session_id)
+        if self._connection_states.get(key) != connection_state:
+            membership = GameSessionMembership.get_by_ids(user_id, session_id)
+            self._connection_states[key] = connection_state
+
+            if membership.connection_state != connection_state:
+                membership.connection_state = connection_state
+                membership.inventory = inventory
+                membership.save()
+                self._pending_inventories.pop(key, None)
+                self._queue_depth.set(len(self._pending_inventories))
+                return True
+
+        self._pending_inventories[key] = inventory
+        self._queue_depth.set(len(self._pending_inventories))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.sio.sio.start_background_task(self._flush_later)
+
+        return False
+
+    def _flush_later(self):
+        self.sio.sio.sleep(FLUSH_INTERVAL)
+        with self.sio.app.app_context():
+            self.flush()
+
+    def _write(self, inventories: dict[MembershipKey, bytes]):
+        if not inventories:
+            return
+
+        with self._flush_latency.time(), database.db.atomic():
+            for (user_id, session_id), inventory in inventories.items():
+                GameSessionMembership.update(inventory=inventory).where(
+                    GameSessionMembership.user == user_id,
+                    GameSessionMembership.session == session_id,
+                ).execute()
+
+    def flush(self):
+        """
+        Writes all pending inventories to the database.
+        :return:
+        """
+        self._flush_scheduled = False
+        pending = self._pending_inventories
+        self._pending_inventories = {}
+        self._write(pending)
+        self._queue_depth.set(len(self._pending_inventories))
+
+    def flush_user(self, user_id: int):
+        """
+        Writes the pending inventories of the given user to the database, and forgets their connection states.
+        Must be called before something else changes the connection state of the user.
+        :param user_id:
+        :return:
+        """
+        self._write({
+            key: self._pending_inventories.pop(key)
+            for key in list(self._pending_inventories.keys())
+            if key[0] == user_id
+        })
+        for key in [key for key in self._connection_states.keys() if key[0] == user_id]:
+            del self._connection_states[key]
+        self._queue_depth.set(len(self._pending_inventories))
@@ -18,6 +18,8 @@ from randovania.server import client_check
 from randovania.server.custom_discord_oauth import CustomDiscordOAuth2Session
 from randovania.server.database import User, GameSessionMembership
 from randovania.server.lib import logger
+from randovania.server.self_update_buffer import SelfUpdateBuffer
+from randovania.server.session_emitter import SessionEmitter
 
 
 class EnforceDiscordRole:
@@ -54,6 +56,8 @@ class ServerApp:
     guest_encrypt: Fernet | None = None
     enforce_role: EnforceDiscordRole | None = None
     expected_headers: dict[str, str]
+    session_emitter: SessionEmitter
+    self_update_buffer: SelfUpdateBuffer  # Created by game_session.setup_app, as it registers metrics
 
     def __init__(self, app: flask.Flask):
         self.app = app
@@ -68,6 +72,7 @@ class ServerApp:
 
         self.expected_headers = connection_headers()
         self.expected_headers.pop("X-Randovania-Version")
+        self.session_emitter = SessionEmitter(self)
 
     def get_server(self) -> socketio.Server:
         return self.sio.server
@@ -0,0 +1,194 @@
+"""
+Sends the updates of game sessions to everyone in them. Updates scheduled in quick succession are combined into a
+single emit a short time later. The encoded actions and audit log are kept until the session changes again, for the
+most recently used sessions.
+Actions and the audit log only ever grow, so each update sends only the entries after the ones already sent,
+together with how many entries come before them.
+"""
+from __future__ import annotations
+
+import collections
+import dataclasses
+import enum
+import typing
+
+import flask_socketio
+import peewee
+
+from randovania.server.database import GameSession
+from randovania.server.lib import logger
+
+if typing.TYPE_CHECKING:
+    from randovania.server.server_app import ServerApp
+
+# How long to wait for more changes before sending the scheduled updates of a session, in seconds.
+EMIT_DELAY = 0.25
+
+# How many sessions to keep the state of. Sessions with updates waiting to be sent are always kept.
+MAX_CACHED_SESSIONS = 200
+
+
+class SessionUpdate(enum.Enum):
+    META = "game_session_meta_update"
+    ACTIONS = "game_session_actions_update"
+    AUDIT = "game_session_audit_update"
+
+
+@dataclasses.dataclass()
+class _SessionState:
+    session: GameSession
+    pending: set[SessionUpdate] = dataclasses.field(default_factory=set)
+    flush_scheduled: bool = False
+
+    # Encoded data for everything in the session, to send to who asks for it
+    actions: bytes | None = None
+    audit_log: bytes | None = None
+
+    # How many entries everyone in the session was sent
+    num_actions_sent: int = 0
+    num_audit_entries_sent: int = 0
+
+
+class SessionEmitter:
+    _sessions: collections.OrderedDict[int, _SessionState]
+
+    def __init__(self, sio: ServerApp):
+        self.sio = sio
+        self._sessions = collections.OrderedDict()
+
+    def _state_for(self, session: GameSession) -> _SessionState:
+        state = self._sessions.get(session.id)
+        if state is not None:
+            self._sessions.move_to_end(session.id)
+            return state
+
+        state = _SessionState(session)
+        self._sessions[session.id] = state
+        self._evict_old_sessions()
+        return state
+
+    def _evict_old_sessions(self):
+        # Forgetting a session only means the next update sends everything again
+        for session_id in list(self._sessions):
+            if len(self._sessions) <= MAX_CACHED_SESSIONS:
+                break
+            if not self._sessions[session_id].flush_scheduled:
+                del self._sessions[session_id]
+
+    def schedule(self, session: GameSession, update: SessionUpdate):
+        """
+        Marks that the given part of the session changed, sending it to everyone in the session soon.
+        :param session:
+        :param update:
+        :return:
+        """
+        state = self._state_for(session)
+        state.session = session
+        state.pending.add(update)
+
+        if update == SessionUpdate.ACTIONS:
+            state.actions = None
+        elif update == SessionUpdate.AUDIT:
+            state.audit_log = None
+
+        if not state.flush_scheduled:
+            state.flush_scheduled = True
+            self.sio.sio.start_background_task(self._flush_later, session.id)
+
+    def _flush_later(self, session_id: int):
+        self.sio.sio.sleep(EMIT_DELAY)
+        with self.sio.app.app_context():
+            self.flush(session_id)
+
+    def flush(self, session_id: int):
+        """
+        Sends all scheduled updates of the given session.
+        :param session_id:
+        :return:
+        """
+        state = self._sessions.get(session_id)
+        if state is None:
+            return
+
+        pending = state.pending
+        state.pending = set()
+        state.flush_scheduled = False
+
+        try:
+            session = GameSession.get_by_id(session_id)
+        except peewee.DoesNotExist:
+            # The session was deleted. Let everyone know with the last known version of it.
+            self.forget_session(session_id)
+            if SessionUpdate.META in pending:
+                self._emit(SessionUpdate.META, state.session.create_session_entry(), session_id)
+            return
+
+        state.session = session
+        for update in SessionUpdate:
+            if update not in pending:
+                continue
+
+            logger().debug("%s for session %d (%s)", update.value, session.id, session.name)
+            if update == SessionUpdate.META:
+                data = session.create_session_entry()
+
+            elif update == SessionUpdate.ACTIONS:
+                # Count what was encoded, since more actions might have been added since
+                actions, num_actions = session.describe_actions(state.num_actions_sent)
+                data = {
+                    "start": state.num_actions_sent,
+                    "actions": actions,
+                }
+                state.num_actions_sent += num_actions
+
+            else:
+                entries, num_entries = session.get_audit_log(state.num_audit_entries_sent)
+                data = {
+                    "start": state.num_audit_entries_sent,
+                    "entries": entries,
+                }
+                state.num_audit_entries_sent += num_entries
+
+            self._emit(update, data, session_id)
+
+    def _emit(self, update: SessionUpdate, data, session_id: int):
+        self.sio.sio.emit(update.value, data, room=f"game-session-{session_id}", namespace="/")
+
+    def emit_session_state(self, session: GameSession):
+        """
+        Sends everything about the session to the user of the current request, and only to them.
+        :param session:
+        :return:
+        """
+        state = self._state_for(session)
+        state.session = session
+
+        # The meta also depends on the users and their names, so it's always encoded again
+        flask_socketio.emit(SessionUpdate.META.value, session.create_session_entry())
+
+        if session.layout_description_json is not None:
+            if state.actions is None:
+                state.actions = session.describe_actions()[0]
+            flask_socketio.emit(SessionUpdate.ACTIONS.value, {"start": 0, "actions": state.actions})
+
+        if state.audit_log is None:
+            state.audit_log = session.get_audit_log()[0]
+        flask_socketio.emit(SessionUpdate.AUDIT.value, {"start": 0, "entries": state.audit_log})
+
+    def user_renamed(self):
+        """
+        Forgets the encoded actions and audit logs, since they include the names of the users.
+        Renames are rare, so it's simpler to forget it for every session.
+        :return:
+        """
+        for state in self._sessions.values():
+            state.actions = None
+            state.audit_log = None
+
+    def forget_session(self, session_id: int):
+        """
+        Forgets everything known about the given session, such as when it's deleted.
+        :param session_id:
+        :return:
+        """
+        self._sessions.pop(session_id, None)
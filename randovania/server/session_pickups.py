@@ -0,0 +1,105 @@
+"""
+Compact tables of where every pickup of a session's layout goes, so handling collected locations and sending
+pickups doesn't need the full LayoutDescription, which is expensive to decode and keep around.
+"""
+from __future__ import annotations
+
+import base64
+import collections
+import dataclasses
+import typing
+
+from randovania.bitpacking import bitpacking
+from randovania.game_description import default_database
+from randovania.game_description.resources.pickup_entry import PickupEntry
+from randovania.game_description.resources.resource_database import ResourceDatabase
+from randovania.games.game import RandovaniaGame
+from randovania.layout.layout_description import LayoutDescription
+from randovania.network_common.pickup_serializer import BitPackPickupEntry
+
+if typing.TYPE_CHECKING:
+    from randovania.server.database import GameSession
+
+# How many sessions have their tables kept in memory. Sessions that stop being used are rebuilt when needed again.
+MAX_CACHED_SESSIONS = 200
+
+
+def encode_pickup(pickup: PickupEntry, resource_database: ResourceDatabase) -> str:
+    encoded_pickup = bitpacking.pack_value(BitPackPickupEntry(pickup, resource_database))
+    return base64.b85encode(encoded_pickup).decode("utf-8")
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionPickupTarget:
+    receiver: int
+    pickup_name: str
+    encoded_pickup: str
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionPickupTable:
+    games: tuple[RandovaniaGame, ...]
+    targets: dict[tuple[int, int], SessionPickupTarget]
+
+    @classmethod
+    def from_layout(cls, description: LayoutDescription) -> SessionPickupTable:
+        """
+        Creates the table for the given layout, encoding every pickup for the game of the player receiving it.
+        :param description:
+        :return:
+        """
+        games = tuple(preset.game for preset in description.all_presets)
+        resource_databases = [default_database.resource_database_for(game) for game in games]
+
+        targets = {}
+        for provider, patches in description.all_patches.items():
+            for index, target in patches.pickup_assignment.items():
+                targets[(provider, index.index)] = SessionPickupTarget(
+                    receiver=target.player,
+                    pickup_name=target.pickup.name,
+                    encoded_pickup=encode_pickup(target.pickup, resource_databases[target.player]),
+                )
+
+        return cls(games=games, targets=targets)
+
+    def get_target(self, provider: int, location: int) -> SessionPickupTarget | None:
+        return self.targets.get((provider, location))
+
+
+_tables: collections.OrderedDict[int, SessionPickupTable] = collections.OrderedDict()
+
+
+def table_for_session(session: GameSession) -> SessionPickupTable | None:
+    """
+    Gets the table for the layout of the given session, creating it if it's not cached.
+    :param session:
+    :return: None if the session has no layout.
+    """
+    table = _tables.get(session.id)
+    if table is not None:
+        _tables.move_to_end(session.id)
+        return table
+
+    description = session.layout_description
+    if description is None:
+        return None
+
+    table = SessionPickupTable.from_layout(description)
+    _tables[session.id] = table
+    while len(_tables) > MAX_CACHED_SESSIONS:
+        _tables.popitem(last=False)
+
+    return table
+
+
+def evict_session(session_id: int | None):
+    """
+    Forgets the table of the given session. Must be called whenever the layout of a session changes or it's deleted.
+    :param session_id:
+    :return:
+    """
+    _tables.pop(session_id, None)
+
+
+def clear_cache():
+    _tables.clear()
@@ -49,6 +49,7 @@ def _create_session_with_discord_token(sio: ServerApp, access_token: str) -> tup
     if user.name != discord_user.name:
         user.name = discord_user.name
         user.save()
+        sio.session_emitter.user_renamed()
 
     if sio.enforce_role is not None:
         if not sio.enforce_role.verify_user(discord_user.id):
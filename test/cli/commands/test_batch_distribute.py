@@ -1,7 +1,13 @@
+import gzip
+import json
 from unittest.mock import MagicMock, AsyncMock
 
+import pytest
+
 from randovania.cli.commands import batch_distribute
+from randovania.interface_common.generation_pool import GenerationRequest
 from randovania.layout.generator_parameters import GeneratorParameters
+from randovania.resolver.exceptions import GenerationFailure
 
 
 def test_batch_distribute_helper(mocker):
@@ -39,3 +45,73 @@ def test_batch_distribute_helper(mocker):
     assert delta_time == 4000
     output_dir.joinpath.assert_called_once_with(f"{seed_number}.rdvgame")
     description.save_to_file.assert_called_once_with(output_dir.joinpath.return_value)
+
+
+def test_batch_distribute_helper_compress(mocker, tmp_path):
+    # Setup
+    description = MagicMock()
+    description.file_extension.return_value = "rdvgame"
+    description.as_json.return_value = {"info": "something"}
+    mocker.patch("randovania.generator.generator.generate_and_validate_description",
+                 new_callable=AsyncMock, return_value=description)
+    base_permalink = MagicMock(spec=GeneratorParameters)
+    base_permalink.presets = [MagicMock()]
+
+    # Run
+    batch_distribute.batch_distribute_helper(base_permalink, 5000, 67, False, tmp_path, compress=True)
+
+    # Assert
+    with gzip.open(tmp_path.joinpath("5000.rdvgame.gz"), "rt") as f:
+        assert json.load(f) == {"info": "something"}
+    description.save_to_file.assert_not_called()
+
+
+@pytest.mark.parametrize("error", [None, "failure", "exception"])
+def test_batch_distribute_record(mocker, error):
+    # Setup
+    mock_helper = mocker.patch("randovania.cli.commands.batch_distribute.batch_distribute_helper", return_value=10.0)
+    mocker.patch("randovania.resolver.resolver.get_attempts", return_value=3)
+    mock_set_attempts = mocker.patch("randovania.resolver.resolver.set_attempts")
+    if error == "failure":
+        mock_helper.side_effect = GenerationFailure("Bad luck", MagicMock(), ValueError("Unreachable"))
+    elif error == "exception":
+        mock_helper.side_effect = KeyError("key")
+
+    # Run
+    request = GenerationRequest(presets=(), seed_number=5000, timeout=67)
+    record = batch_distribute.batch_distribute_record(request, MagicMock(), False)
+
+    # Assert
+    mock_helper.assert_called_once_with(GeneratorParameters(5000, True, []), 5000, 67, True, mocker.ANY, False)
+    mock_set_attempts.assert_called_once_with(0)
+    assert record["seed"] == 5000
+    assert record["attempts"] == 3
+    if error is None:
+        assert record["status"] == "success"
+        assert record["time"] == 10.0
+        assert record["reason"] is None
+    elif error == "failure":
+        assert record["status"] == "failed"
+        assert record["reason"] == "Bad luck: Unreachable"
+    else:
+        assert record["status"] == "error"
+        assert record["reason"] == "'key' (KeyError)"
+
+
+@pytest.mark.parametrize("retry_errors", [False, True])
+def test_read_manifest_seeds(tmp_path, retry_errors):
+    # Setup
+    manifest = tmp_path.joinpath("manifest.jsonl")
+    manifest.write_text('{"seed": 10, "status": "success"}\n{"seed": 12, "status": "failed"}\n'
+                        '{"seed": 14, "status": "error"}\n{"seed": 16, "status": "error"}\n'
+                        '{"seed": 16, "status": "success"}\n{"seed": 1')
+
+    # Run
+    seeds = batch_distribute.read_manifest_seeds(manifest, retry_errors)
+
+    # Assert
+    if retry_errors:
+        assert seeds == {10, 12, 16}
+    else:
+        assert seeds == {10, 12, 14, 16}
+    assert batch_distribute.read_manifest_seeds(tmp_path.joinpath("missing.jsonl")) == set()
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from randovania.cli.commands import benchmark
+from randovania.games.game import RandovaniaGame
+
+
+def test_all_cases():
+    # Run
+    cases = benchmark.all_cases([RandovaniaGame.BLANK], [10, 11])
+
+    # Assert
+    assert cases == [
+        {"game": "blank", "preset": "starter_preset.rdvpreset", "seed": 10},
+        {"game": "blank", "preset": "starter_preset.rdvpreset", "seed": 11},
+    ]
+
+
+def test_benchmark_case_blank():
+    # Run
+    result = benchmark.benchmark_case({"game": "blank", "preset": "starter_preset.rdvpreset", "seed": 1000}, 60)
+
+    # Assert
+    assert "error" not in result
+    assert result["possible"]
+    assert result["generator_reach_expansions"] > 0
+    assert result["resolver_reaches"] > 0
+    assert result["resolver_attempts"] > 0
+
+
+def test_compare_with_baseline():
+    # Setup
+    base = {"game": "blank", "preset": "starter_preset.rdvpreset", "hash": "AAAA"}
+    baseline = [
+        dict(base, seed=1, generation_time=1.0, resolve_time=1.0, resolver_attempts=100),
+        dict(base, seed=2, generation_time=1.0, resolve_time=0.01, resolver_attempts=100),
+        dict(base, seed=3, generation_time=1.0),
+    ]
+    results = [
+        dict(base, seed=1, generation_time=1.1, resolve_time=2.0, resolver_attempts=150),
+        dict(base, seed=2, generation_time=0.5, resolve_time=0.02, resolver_attempts=100, hash="BBBB"),
+        dict(base, seed=3, error="Broken (ValueError)"),
+        dict(base, seed=4, generation_time=10.0),
+    ]
+
+    # Run
+    regressions = benchmark.compare_with_baseline(results, baseline, 0.2)
+
+    # Assert
+    assert regressions == [
+        "blank/starter_preset.rdvpreset/1: resolve_time went from 1.000 to 2.000",
+        "blank/starter_preset.rdvpreset/1: resolver_attempts went from 100 to 150",
+        "blank/starter_preset.rdvpreset/2: generated a different game (AAAA -> BBBB)",
+        "blank/starter_preset.rdvpreset/3: failed with Broken (ValueError)",
+    ]
+
+
+def test_benchmark_command_logic(tmp_path, mocker):
+    # Setup
+    case = {"game": "blank", "preset": "starter_preset.rdvpreset", "seed": 1000}
+    result = dict(case, hash="AAAA", generation_time=1.0, dock_weakness_time=0.0, resolve_time=2.0,
+                  resolver_attempts=5, serialization_time=0.1)
+    mock_pool = mocker.patch("multiprocessing.Pool")
+    mock_pool.return_value.__enter__.return_value.imap_unordered.return_value = [result]
+
+    baseline = tmp_path.joinpath("baseline.json")
+    benchmark.json_lib.write_path(baseline, [dict(result, resolve_time=1.0)])
+
+    args = MagicMock()
+    args.game = [RandovaniaGame.BLANK]
+    args.seed_number = 1000
+    args.seed_count = 1
+    args.output = tmp_path.joinpath("output.json")
+    args.baseline = baseline
+    args.threshold = 0.2
+
+    # Run
+    return_code = benchmark.benchmark_command_logic(args)
+
+    # Assert
+    assert return_code == 1
+    assert benchmark.json_lib.read_path(args.output) == [result]
+    mock_pool.return_value.__enter__.return_value.imap_unordered.assert_called_once_with(
+        benchmark._benchmark_case_star, [(case, args.timeout)]
+    )
@@ -23,6 +23,7 @@ def test_generate_logic(no_retry: bool, preset_name: str | None, repeat: int, mo
     args.output_file = Path("asdfasdf/qwerqwerqwer/zxcvzxcv.json")
     args.no_retry = no_retry
     args.repeat = repeat
+    args.instrumentation_output = None
 
     if preset_name is None:
         # Permalink
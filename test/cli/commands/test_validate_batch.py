@@ -0,0 +1,73 @@
+import asyncio
+import csv
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from randovania.cli.commands import validate_batch
+
+
+@pytest.mark.parametrize(("resolve_result", "expected"), [
+    (MagicMock(), "possible"),
+    (None, "impossible"),
+])
+def test_validate_batch_helper(test_files_dir, mocker, resolve_result, expected):
+    # Setup
+    mock_resolve: AsyncMock = mocker.patch("randovania.resolver.resolver.resolve", new_callable=AsyncMock,
+                                           return_value=resolve_result)
+    layout_file = test_files_dir.joinpath("log_files", "prime1-vanilla.rdvgame")
+
+    # Run
+    result = validate_batch.validate_batch_helper(layout_file, 60)
+
+    # Assert
+    mock_resolve.assert_awaited_once()
+    assert result["layout"] == "prime1-vanilla.rdvgame"
+    assert result["result"] == expected
+    assert result["reason"] is None
+
+
+def test_validate_batch_helper_timeout(test_files_dir, mocker):
+    # Setup
+    async def slow_resolve(**kwargs):
+        await asyncio.sleep(10)
+
+    mocker.patch("randovania.resolver.resolver.resolve", side_effect=slow_resolve)
+    layout_file = test_files_dir.joinpath("log_files", "prime1-vanilla.rdvgame")
+
+    # Run
+    result = validate_batch.validate_batch_helper(layout_file, 0)
+
+    # Assert
+    assert result["result"] == "timeout"
+
+
+def test_validate_batch_helper_multiworld(test_files_dir):
+    # Run
+    result = validate_batch.validate_batch_helper(test_files_dir.joinpath("log_files", "multiworld.rdvgame"), 60)
+
+    # Assert
+    assert result["result"] == "unsupported"
+    assert result["reason"] == "Layout has 2 players"
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json"])
+def test_write_summary(tmp_path, suffix):
+    summary = [
+        {"layout": "a.rdvgame", "result": "possible", "time": 1.5, "attempts": 20, "reason": None},
+        {"layout": "b.rdvgame", "result": "error", "time": 0.5, "attempts": 0, "reason": "Broken"},
+    ]
+    output = tmp_path.joinpath(f"summary{suffix}")
+
+    # Run
+    validate_batch.write_summary(summary, output)
+
+    # Assert
+    with output.open() as f:
+        if suffix == ".csv":
+            rows = list(csv.DictReader(f))
+            assert [row["layout"] for row in rows] == ["a.rdvgame", "b.rdvgame"]
+            assert rows[1]["reason"] == "Broken"
+        else:
+            assert json.load(f) == summary
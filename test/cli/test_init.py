@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch, ANY
 import pytest
 
 from randovania import cli
+from randovania.games.game import RandovaniaGame
 
 
 def test_create_subparsers(mocker):
@@ -99,3 +100,33 @@ def test_run_pytest(mocker):
     # Assert
     mock_main.assert_called_once_with(["c", "d"], plugins=ANY)
     mock_exit.assert_called_once_with(mock_main.return_value)
+
+
+@pytest.mark.parametrize(("args", "env", "expected"), [
+    ([], None, "default"),
+    ([], "from_env", "from_env"),
+    (["--game-description-cache", "custom"], "from_env", "custom"),
+    (["--no-game-description-cache"], "from_env", None),
+])
+def test_run_args_game_description_cache(args, env, expected, tmp_path, monkeypatch, mocker):
+    # Setup
+    from randovania.game_description import default_database
+    mocker.patch("randovania.game_description.default_database.default_cache_dir",
+                 return_value=tmp_path.joinpath("default"))
+    monkeypatch.chdir(tmp_path)
+    if env is None:
+        monkeypatch.delenv(default_database.CACHE_DIR_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(default_database.CACHE_DIR_ENV_VAR, str(tmp_path.joinpath(env)))
+
+    parsed = cli._create_parser().parse_args(args)
+    parsed.func = MagicMock()
+
+    # Run
+    cli._run_args(MagicMock(), parsed)
+
+    # Assert
+    if expected is None:
+        assert default_database._cache_path(RandovaniaGame.BLANK) is None
+    else:
+        assert default_database._cache_path(RandovaniaGame.BLANK) == tmp_path.joinpath(expected, "blank.pickle")
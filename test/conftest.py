@@ -239,6 +239,12 @@ def empty_patches(default_blank_configuration, blank_game_description) -> GamePa
     return GamePatches.create_from_game(blank_game_description, 0, configuration)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _disable_game_description_cache():
+    # Never write the decoded databases into the user's data dir
+    default_database.set_cache_dir(None)
+
+
 def pytest_addoption(parser):
     parser.addoption('--skip-generation-tests', action='store_true', dest="skip_generation_tests",
                      default=False, help="Skips running layout generation tests")
@@ -15,6 +15,7 @@ from randovania.games.game import RandovaniaGame
 from randovania.games.prime2.patcher.echoes_dol_patches import EchoesDolVersion
 from randovania.generator.item_pool import pickup_creator
 from randovania.layout.base.major_item_state import MajorItemState
+from randovania.patching.prime import all_prime_dol_patches
 
 
 @pytest.fixture(name="version")
@@ -146,6 +147,23 @@ async def test_known_collected_locations_location(connector: EchoesRemoteConnect
     assert patches == [DolRemotePatch([], mock_item_patch.return_value)]
 
 
+async def test_inventory_change_probe(connector: EchoesRemoteConnector, version: EchoesDolVersion):
+    # Setup
+    executor = AsyncMock()
+    executor.perform_single_memory_operation.return_value = struct.pack(">II", 2, 10)
+
+    # Run
+    result = await connector.inventory_change_probe(executor)
+
+    # Assert
+    assert result == struct.pack(">II", 2, 10)
+    executor.perform_single_memory_operation.assert_awaited_once_with(MemoryOperation(
+        address=version.cstate_manager_global + 0x150c,
+        offset=connector.game.resource_database.multiworld_magic_item.extra["item_id"] * 0xc + 0x5c,
+        read_byte_count=8,
+    ))
+
+
 async def test_find_missing_remote_pickups_nothing(connector: EchoesRemoteConnector):
     # Setup
     executor = AsyncMock()
@@ -186,7 +204,7 @@ async def test_find_missing_remote_pickups_give_pickup(connector: EchoesRemoteCo
     connector._patches_for_pickup = AsyncMock(return_value=([pickup_patches, pickup_patches], "The Message"))
 
     executor = AsyncMock()
-    inventory = {connector.game.resource_database.multiworld_magic_item: InventoryItem(0, 0)}
+    inventory = {connector.game.resource_database.multiworld_magic_item: InventoryItem(0, 1)}
     permanent_pickups = [
         ("A", MagicMock()),
         ("B", MagicMock()),
@@ -208,8 +226,9 @@ async def test_find_missing_remote_pickups_give_pickup(connector: EchoesRemoteCo
 
     mock_item_patch.assert_called_once_with(version.powerup_functions,
                                             RandovaniaGame.METROID_PRIME_ECHOES,
-                                            connector.game.resource_database.multiworld_magic_item.extra["item_id"])
-    connector._patches_for_pickup.assert_awaited_once_with(permanent_pickups[0][0], permanent_pickups[0][1], inventory)
+                                            connector.game.resource_database.multiworld_magic_item.extra["item_id"],
+                                            1)
+    connector._patches_for_pickup.assert_awaited_once_with(permanent_pickups[1][0], permanent_pickups[1][1], inventory)
     assert has_message
     assert patches == [
         DolRemotePatch([], pickup_patches),
@@ -224,6 +243,68 @@ async def test_find_missing_remote_pickups_give_pickup(connector: EchoesRemoteCo
     mock_call_display_hud_patch.assert_called_once_with(version.string_display)
 
 
+async def test_find_missing_remote_pickups_multiple_pickups(connector: EchoesRemoteConnector,
+                                                            echoes_item_database, echoes_resource_database):
+    # Setup
+    missile_expansion = pickup_creator.create_ammo_expansion(
+        echoes_item_database.ammo["Missile Expansion"], [5], False, echoes_resource_database,
+    )
+    connector._write_string_to_game_buffer = MagicMock()
+
+    executor = AsyncMock()
+    inventory = {echoes_resource_database.multiworld_magic_item: InventoryItem(0, 2)}
+    permanent_pickups = tuple((name, missile_expansion) for name in ["A", "B", "A", "A", "B", "A", "B", "A"] * 5)
+
+    # Run
+    patches, has_message = await connector.find_missing_remote_pickups(executor, inventory, permanent_pickups,
+                                                                       False)
+    await connector.execute_remote_patches(executor, patches)
+
+    # Assert
+    item_patches = patches[:-2]
+    assert has_message
+    assert 1 < len(item_patches) < len(permanent_pickups) - 2
+    connector._write_string_to_game_buffer.assert_called_once_with(
+        f"Received {len(item_patches)} items from 2 players."
+    )
+    assert repr(patches[-2].instructions) == repr(all_prime_dol_patches.increment_item_capacity_patch(
+        connector.version.powerup_functions, RandovaniaGame.METROID_PRIME_ECHOES,
+        echoes_resource_database.multiworld_magic_item.extra["item_id"], len(item_patches),
+    ))
+
+
+async def test_find_missing_remote_pickups_multiple_unlocks(connector: EchoesRemoteConnector,
+                                                            echoes_item_database, echoes_resource_database):
+    # Setup
+    launcher = pickup_creator.create_major_item(
+        echoes_item_database.major_items["Missile Launcher"],
+        MajorItemState(included_ammo=(5,)),
+        True,
+        echoes_resource_database,
+        echoes_item_database.ammo["Missile Expansion"],
+        True,
+    )
+    missile_expansion = pickup_creator.create_ammo_expansion(
+        echoes_item_database.ammo["Missile Expansion"], [5], True, echoes_resource_database,
+    )
+    connector._write_string_to_game_buffer = MagicMock()
+
+    executor = AsyncMock()
+    inventory = {echoes_resource_database.multiworld_magic_item: InventoryItem(0, 0)}
+    permanent_pickups = (("Someone", launcher), ("Someone", missile_expansion))
+
+    # Run
+    patches, has_message = await connector.find_missing_remote_pickups(executor, inventory, permanent_pickups,
+                                                                       False)
+
+    # Assert
+    missile = echoes_resource_database.get_item("Missile")
+    changed_items = [repr(patch.instructions[1]) for patch in patches[:-2]]
+    assert has_message
+    assert changed_items.count(f"<li r4, {missile.extra['item_id']}>") == 2
+    connector._write_string_to_game_buffer.assert_called_once_with("Received 2 items from Someone.")
+
+
 @pytest.mark.parametrize("has_item_percentage", [False, True])
 async def test_patches_for_pickup(connector: EchoesRemoteConnector, version: EchoesDolVersion, mocker,
                                   generic_item_category, has_item_percentage):
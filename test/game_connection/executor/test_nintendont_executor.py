@@ -1,10 +1,75 @@
 import asyncio
+import struct
 from unittest.mock import MagicMock, AsyncMock, call
 
 import pytest
 
 from randovania.game_connection.executor.memory_operation import MemoryOperationException, MemoryOperation
-from randovania.game_connection.executor.nintendont_executor import NintendontExecutor, SocketHolder, RequestBatch
+from randovania.game_connection.executor.nintendont_executor import (
+    NintendontExecutor, SocketHolder, RequestBatch, merge_adjacent_reads,
+)
+
+_FAKE_MEMORY_START = 0x80000000
+
+
+class FakeNintendontServer:
+    """
+    Reads requests from the stream the same way the Nintendont server does, performing them on a bytearray.
+    """
+
+    def __init__(self, max_input: int, max_output: int, max_addresses: int):
+        self.api = struct.pack(">IIII", 2, max_input, max_output, max_addresses)
+        self.memory = bytearray(range(256)) * 16
+        self.num_requests = 0
+
+    def _address_range(self, address: int, size: int) -> slice | None:
+        start = address - _FAKE_MEMORY_START
+        if 0 <= start and start + size <= len(self.memory):
+            return slice(start, start + size)
+        return None
+
+    async def _perform_request(self, reader: asyncio.StreamReader, num_ops: int, num_addresses: int) -> bytes:
+        addresses = struct.unpack(f">{num_addresses}I", await reader.readexactly(4 * num_addresses))
+        validator = bytearray(1 + (num_ops - 1) // 8)
+        read_data = b""
+
+        for i in range(num_ops):
+            op_byte = (await reader.readexactly(1))[0]
+            byte_count = 4 if op_byte & 0x20 else (await reader.readexactly(1))[0]
+            address = addresses[op_byte & 0xF]
+            if op_byte & 0x10:
+                offset = struct.unpack(">h", await reader.readexactly(2))[0]
+                pointer = self._address_range(address, 4)
+                address = None if pointer is None else struct.unpack(">I", self.memory[pointer])[0] + offset
+
+            region = self._address_range(address, byte_count) if address is not None else None
+            write_bytes = await reader.readexactly(byte_count) if op_byte & 0x40 else None
+            if region is None:
+                # The response always has space for all reads
+                if op_byte & 0x80:
+                    read_data += b"\x00" * byte_count
+                continue
+
+            validator[i // 8] |= 1 << (i % 8)
+            if op_byte & 0x80:
+                read_data += self.memory[region]
+            if write_bytes is not None:
+                self.memory[region] = write_bytes
+
+        return bytes(validator) + read_data
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                command_id, num_ops, num_addresses, keep_alive = struct.unpack(">BBBB", await reader.readexactly(4))
+                if command_id == 1:
+                    writer.write(self.api)
+                else:
+                    self.num_requests += 1
+                    writer.write(await self._perform_request(reader, num_ops, num_addresses))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
 
 
 @pytest.fixture(name="executor")
@@ -13,13 +78,31 @@ def nintendont_executor():
     return executor
 
 
+@pytest.fixture(name="fake_server")
+async def _fake_server():
+    fake = FakeNintendontServer(max_input=100, max_output=60, max_addresses=4)
+    server = await asyncio.start_server(fake.handle_client, "127.0.0.1", 0)
+    fake.port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield fake
+
+
+@pytest.fixture(name="connected_executor")
+async def _connected_executor(fake_server):
+    executor = NintendontExecutor("127.0.0.1")
+    executor._port = fake_server.port
+    assert await executor.connect()
+    yield executor
+    executor.disconnect()
+
+
 async def test_perform_memory_operations_success(executor: NintendontExecutor):
     executor._socket = MagicMock()
     executor._socket.max_input = 120
     executor._socket.max_output = 100
     executor._socket.max_addresses = 8
     executor._socket.writer.drain = AsyncMock()
-    executor._socket.reader.read = AsyncMock(side_effect=[
+    executor._socket.reader.readexactly = AsyncMock(side_effect=[
         b"\x03" + b"A" * 50 + b"B" * 30,
         b"\x01" + b"C" * 60,
     ])
@@ -39,7 +122,7 @@ async def test_perform_memory_operations_success(executor: NintendontExecutor):
         call(b'\x00\x01\x01\x01\x00\x00\x10\x00\x80\x3c'),
     ])
     assert result == ops
-    executor._socket.reader.read.assert_has_awaits([call(1024), call(1024)])
+    executor._socket.reader.readexactly.assert_has_awaits([call(81), call(61)])
 
 
 async def test_perform_memory_operations_invalid(executor: NintendontExecutor):
@@ -48,8 +131,8 @@ async def test_perform_memory_operations_invalid(executor: NintendontExecutor):
     executor._socket.max_output = 100
     executor._socket.max_addresses = 8
     executor._socket.writer.drain = AsyncMock()
-    executor._socket.reader.read = AsyncMock(side_effect=[
-        b"\x03" + b"A" * 50 + b"B" * 30,
+    executor._socket.reader.readexactly = AsyncMock(side_effect=[
+        b"\x01" + b"A" * 50 + b"B" * 10,
     ])
 
     # Run
@@ -63,9 +146,9 @@ async def test_perform_memory_operations_invalid(executor: NintendontExecutor):
     # Assert
     executor._socket.writer.drain.assert_has_awaits([call()])
     executor._socket.writer.write.assert_has_calls([
-        call(b'\x00\x03\x02\x01\x00\x00\x10\x00\x00\x00 \x00\x802\x81\n\x81\n'),
+        call(b'\x00\x02\x02\x01\x00\x00\x10\x00\x00\x00 \x00\x802\x81\n'),
     ])
-    executor._socket.reader.read.assert_has_awaits([call(1024)])
+    executor._socket.reader.readexactly.assert_has_awaits([call(61)])
 
 
 async def test_perform_single_giant_memory_operation(executor: NintendontExecutor):
@@ -74,7 +157,7 @@ async def test_perform_single_giant_memory_operation(executor: NintendontExecuto
     executor._socket.max_output = 100
     executor._socket.max_addresses = 8
     executor._socket.writer.drain = AsyncMock()
-    executor._socket.reader.read = AsyncMock(side_effect=[
+    executor._socket.reader.readexactly = AsyncMock(side_effect=[
         b"\x01",
         b"\x01",
     ])
@@ -91,7 +174,7 @@ async def test_perform_single_giant_memory_operation(executor: NintendontExecuto
         call(b'\x00\x01\x01\x01\x00\x00\x10\x64' + b'\x40\x64' + (b"1" * 100)),
     ])
     assert result is None
-    executor._socket.reader.read.assert_has_awaits([call(1024), call(1024)])
+    executor._socket.reader.readexactly.assert_has_awaits([call(1), call(1)])
 
 
 async def test_connect(executor, mocker):
@@ -159,7 +242,7 @@ async def test_send_requests_to_socket_timeout(executor: NintendontExecutor, use
     socket.writer.write = MagicMock()
     socket.writer.drain.side_effect = asyncio.TimeoutError() if use_timeout else OSError("test-exp")
     executor._socket = socket
-    executor.disconnect = AsyncMock()
+    executor.disconnect = MagicMock()
     reqs = [RequestBatch()]
     if use_timeout:
         msg = "Timeout when reading response"
@@ -172,4 +255,104 @@ async def test_send_requests_to_socket_timeout(executor: NintendontExecutor, use
 
     # Assert
     assert executor._socket_error is x.value
-    executor.disconnect.assert_awaited_once_with()
+    executor.disconnect.assert_called_once_with()
+
+
+def test_merge_adjacent_reads():
+    # Setup
+    ops = [
+        MemoryOperation(0x1008, read_byte_count=8),
+        MemoryOperation(0x1000, read_byte_count=4),
+        MemoryOperation(0x2000, offset=0x10, read_byte_count=8),
+        MemoryOperation(0x1000, read_byte_count=4),
+        MemoryOperation(0x2000, offset=0x1c, read_byte_count=8),
+        MemoryOperation(0x1010, write_bytes=b"\x00" * 4),
+        MemoryOperation(0x1014, read_byte_count=4),
+        MemoryOperation(0x1100, read_byte_count=200),
+        MemoryOperation(0x11c8, read_byte_count=100),
+    ]
+
+    # Run
+    merged, sources = merge_adjacent_reads(ops)
+
+    # Assert
+    assert merged == [
+        MemoryOperation(0x1000, read_byte_count=16),
+        MemoryOperation(0x2000, offset=0x10, read_byte_count=20),
+        MemoryOperation(0x1010, write_bytes=b"\x00" * 4),
+        MemoryOperation(0x1014, read_byte_count=4),
+        MemoryOperation(0x1100, read_byte_count=200),
+        MemoryOperation(0x11c8, read_byte_count=100),
+    ]
+    assert sources == {
+        ops[0]: (merged[0], 8),
+        ops[1]: (merged[0], 0),
+        ops[2]: (merged[1], 0),
+        ops[4]: (merged[1], 12),
+        ops[6]: (merged[3], 0),
+        ops[7]: (merged[4], 0),
+        ops[8]: (merged[5], 0),
+    }
+
+
+async def test_fake_server_operations(connected_executor: NintendontExecutor, fake_server: FakeNintendontServer):
+    # Setup
+    fake_server.memory[0x100:0x104] = struct.pack(">I", _FAKE_MEMORY_START + 0x200)
+    ops = [
+        MemoryOperation(_FAKE_MEMORY_START + 0x100, offset=index * 12 + 4, read_byte_count=8)
+        for index in range(20)
+    ]
+    ops.append(MemoryOperation(_FAKE_MEMORY_START + 0x300, write_bytes=b"\xff" * 4))
+    ops.append(MemoryOperation(_FAKE_MEMORY_START + 0x300, read_byte_count=4))
+
+    # Run
+    result = await connected_executor.perform_memory_operations(ops)
+
+    # Assert
+    assert result == {
+        op: bytes(fake_server.memory[0x204 + index * 12:0x20c + index * 12])
+        for index, op in enumerate(ops[:20])
+    } | {ops[-1]: b"\xff" * 4}
+    assert fake_server.memory[0x300:0x304] == b"\xff" * 4
+
+
+async def test_fake_server_invalid_address(connected_executor: NintendontExecutor):
+    # Run
+    with pytest.raises(MemoryOperationException, match="invalid address"):
+        await connected_executor.perform_memory_operations([
+            MemoryOperation(_FAKE_MEMORY_START, read_byte_count=4),
+            MemoryOperation(0x1000, read_byte_count=4),
+        ])
+
+
+async def test_fake_server_pipelined(connected_executor: NintendontExecutor, fake_server: FakeNintendontServer):
+    # Setup
+    events = []
+    socket = connected_executor._socket
+    original_write, original_readexactly = socket.writer.write, socket.reader.readexactly
+
+    def write(data):
+        events.append("write")
+        original_write(data)
+
+    async def readexactly(n):
+        events.append("read")
+        return await original_readexactly(n)
+
+    socket.writer.write = write
+    socket.reader.readexactly = readexactly
+    ops = [
+        MemoryOperation(_FAKE_MEMORY_START + index * 0x100, read_byte_count=50)
+        for index in range(6)
+    ]
+
+    # Run
+    result = await connected_executor.perform_memory_operations(ops)
+
+    # Assert
+    assert fake_server.num_requests == 6
+    assert events == ["write"] * 4 + ["read", "write"] * 2 + ["read"] * 4
+    assert result == {
+        op: bytes(fake_server.memory[index * 0x100:index * 0x100 + 50])
+        for index, op in enumerate(ops)
+    }
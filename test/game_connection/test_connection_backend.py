@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from randovania.game_connection import connection_backend
 from randovania.game_connection.connection_backend import ConnectionBackend
 from randovania.game_connection.connection_base import GameConnectionStatus
 from randovania.game_connection.connector.echoes_remote_connector import EchoesRemoteConnector
@@ -21,23 +22,22 @@ def dolphin_backend():
 
 async def test_identify_game_ntsc(backend: ConnectionBackend):
     # Setup
+    build_info = b"!#$MetroidBuildInfo!#$Build v1.028 10/18/2004 10:44:32"
+
     def side_effect(ops: list[MemoryOperation]):
-        if len(ops) > 1:
-            return {
-                op: b"!#$M"
-                for op in ops
-                if op.address == 0x803ac3b0
-            }
-        return {}
+        return {
+            op: build_info[:op.read_byte_count]
+            for op in ops
+            if op.address == 0x803ac3b0
+        }
 
-    build_info = b"!#$MetroidBuildInfo!#$Build v1.028 10/18/2004 10:44:32"
     backend.executor.perform_memory_operations.side_effect = side_effect
-    backend.executor.perform_single_memory_operation.return_value = build_info
 
     # Run
     connector = await backend._identify_game()
 
     # Assert
+    assert backend.executor.perform_memory_operations.await_count == 2
     assert isinstance(connector, EchoesRemoteConnector)
     assert connector.version is echoes_dol_versions.ALL_VERSIONS[0]
 
@@ -329,3 +329,63 @@ def test_get_current_inventory(backend: ConnectionBackend):
 
     # Assert
     assert result is inventory
+
+
+@pytest.mark.parametrize(["expected_game", "same_probe", "inventory_age", "reads_inventory"], [
+    (None, True, 0.0, True),
+    (RandovaniaGame.METROID_PRIME_ECHOES, False, 0.0, True),
+    (RandovaniaGame.METROID_PRIME_ECHOES, True, 0.0, False),
+    (RandovaniaGame.METROID_PRIME_ECHOES, True, 9.0, True),
+])
+async def test_update_current_inventory(backend: ConnectionBackend, expected_game, same_probe, inventory_age,
+                                        reads_inventory):
+    # Setup
+    old_inventory = {"a": 5}
+    backend.connector = AsyncMock()
+    backend.connector.inventory_change_probe.return_value = b"\x00\x01" if same_probe else b"\x00\x02"
+    backend.connector.get_inventory.return_value = {"a": 6}
+    backend.set_expected_game(expected_game)
+    backend._inventory = old_inventory
+    backend._inventory_probe = b"\x00\x01"
+    backend._inventory_age = inventory_age
+
+    # Run
+    await backend.update_current_inventory(2.0)
+
+    # Assert
+    if expected_game is None:
+        backend.connector.inventory_change_probe.assert_not_awaited()
+    else:
+        backend.connector.inventory_change_probe.assert_awaited_once_with(backend.executor)
+
+    if reads_inventory:
+        backend.connector.get_inventory.assert_awaited_once_with(backend.executor)
+        assert backend.get_current_inventory() == {"a": 6}
+        assert backend._inventory_age == 0.0
+        assert backend._had_activity
+    else:
+        backend.connector.get_inventory.assert_not_awaited()
+        assert backend.get_current_inventory() is old_inventory
+        assert backend._inventory_age == 2.0
+        assert not backend._had_activity
+
+
+@pytest.mark.parametrize(["had_activity", "previous_interval", "expected_interval"], [
+    (True, 2.5, connection_backend.MINIMUM_UPDATE_INTERVAL),
+    (False, 0.5, 1.0),
+    (False, 2.0, connection_backend.MAXIMUM_UPDATE_INTERVAL),
+])
+async def test_update_interval(backend: ConnectionBackend, had_activity, previous_interval, expected_interval):
+    # Setup
+    async def update(dt):
+        backend._had_activity = had_activity
+
+    backend._update = AsyncMock(side_effect=update)
+    backend.update_interval = previous_interval
+
+    # Run
+    await backend.update(1)
+
+    # Assert
+    backend._update.assert_awaited_once_with(1)
+    assert backend.update_interval == expected_interval
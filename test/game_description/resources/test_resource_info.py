@@ -22,3 +22,53 @@ def test_remove_resource_missing(echoes_resource_database):
     col.remove_resource(m)
 
     assert dict(col.as_resource_gain()) == {beam: 1}
+
+
+def test_duplicate_is_independent(echoes_resource_database):
+    m = echoes_resource_database.get_item("Missile")
+    beam = echoes_resource_database.get_item("Light")
+    col = ResourceCollection.from_dict(echoes_resource_database, {
+        m: 10,
+    })
+
+    duplicated = col.duplicate()
+    duplicated.add_resource_gain([(beam, 1), (m, -10)])
+    col.set_resource(m, 5)
+    other_copy = col.duplicate()
+    other_copy.remove_resource(m)
+
+    assert dict(col.as_resource_gain()) == {m: 5}
+    assert dict(duplicated.as_resource_gain()) == {m: 0, beam: 1}
+    assert dict(other_copy.as_resource_gain()) == {}
+    assert col.resource_bitmask == 1 << m.resource_index
+    assert duplicated.resource_bitmask == 1 << beam.resource_index
+    assert other_copy.resource_bitmask == 0
+
+
+def test_difference(echoes_resource_database):
+    m = echoes_resource_database.get_item("Missile")
+    beam = echoes_resource_database.get_item("Light")
+    dark = echoes_resource_database.get_item("Dark")
+    old = ResourceCollection.from_dict(echoes_resource_database, {
+        m: 10,
+        dark: 1,
+    })
+    new = old.duplicate()
+    assert list(new.difference(old)) == []
+
+    new.add_resource_gain([(m, 5), (beam, 1), (dark, 0)])
+    new.remove_resource(dark)
+
+    assert dict(new.difference(old)) == {m: 5, beam: 1, dark: -1}
+    assert new.changed_resources_mask(old) == (
+            (1 << m.resource_index) | (1 << beam.resource_index) | (1 << dark.resource_index)
+    )
+
+
+def test_resource_outside_database(echoes_resource_database):
+    m = echoes_resource_database.get_item("Missile")
+    col = ResourceCollection()
+
+    assert col[m] == 0
+    col.add_resource_gain([(m, 3)])
+    assert col[m] == 3
@@ -0,0 +1,87 @@
+import pytest
+
+from randovania.game_description import default_database, data_reader
+from randovania.games.game import RandovaniaGame
+
+
+@pytest.fixture(name="cache_dir")
+def _cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path.joinpath("game_description_cache")
+    monkeypatch.setenv(default_database.CACHE_DIR_ENV_VAR, str(cache_dir))
+    return cache_dir
+
+
+def _uncached_game_description_for(game: RandovaniaGame):
+    # Skip the lru_cache, so other tests keep their GameDescription
+    return default_database.game_description_for.__wrapped__(game)
+
+
+def test_game_description_for_writes_and_reads_cache(cache_dir, mocker):
+    # Setup
+    game = RandovaniaGame.BLANK
+    decode_data = mocker.patch("randovania.game_description.data_reader.decode_data",
+                               wraps=data_reader.decode_data)
+
+    # Run
+    first = _uncached_game_description_for(game)
+    second = _uncached_game_description_for(game)
+
+    # Assert
+    decode_data.assert_called_once()
+    assert cache_dir.joinpath("blank.pickle").is_file()
+    assert second is not first
+    assert second.game == game
+    assert [node.name for node in second.world_list.iterate_nodes()] == [
+        node.name for node in first.world_list.iterate_nodes()
+    ]
+
+
+def test_game_description_for_rebuilds_outdated_cache(cache_dir, mocker):
+    # Setup
+    game = RandovaniaGame.BLANK
+    _uncached_game_description_for(game)
+
+    mocker.patch("randovania.games.default_data.content_hash", return_value="changed")
+    decode_data = mocker.patch("randovania.game_description.data_reader.decode_data",
+                               wraps=data_reader.decode_data)
+
+    # Run
+    _uncached_game_description_for(game)
+    _uncached_game_description_for(game)
+
+    # Assert
+    decode_data.assert_called_once()
+
+
+def test_game_description_for_invalid_cache(cache_dir, mocker):
+    # Setup
+    game = RandovaniaGame.BLANK
+    cache_dir.mkdir(parents=True)
+    cache_dir.joinpath("blank.pickle").write_bytes(b"not a pickle")
+    decode_data = mocker.patch("randovania.game_description.data_reader.decode_data",
+                               wraps=data_reader.decode_data)
+
+    # Run
+    result = _uncached_game_description_for(game)
+
+    # Assert
+    decode_data.assert_called_once()
+    assert result.game == game
+    assert cache_dir.joinpath("blank.pickle").read_bytes() != b"not a pickle"
+
+
+def test_game_description_for_without_cache_dir(tmp_path, monkeypatch, mocker):
+    # Setup
+    monkeypatch.delenv(default_database.CACHE_DIR_ENV_VAR, raising=False)
+    cache_key = mocker.patch("randovania.game_description.default_database._cache_key")
+    read_cache = mocker.patch("randovania.game_description.default_database._read_cached_game_description")
+    write_cache = mocker.patch("randovania.game_description.default_database._write_cached_game_description")
+
+    # Run
+    result = _uncached_game_description_for(RandovaniaGame.BLANK)
+
+    # Assert
+    assert result.game == RandovaniaGame.BLANK
+    cache_key.assert_not_called()
+    read_cache.assert_not_called()
+    write_cache.assert_not_called()
@@ -4,6 +4,7 @@ import pytest
 
 from randovania.game_description import game_description
 from randovania.game_description.requirements.base import Requirement
+from randovania.game_description.resources.resource_info import ResourceCollection
 from randovania.game_description.world.area import Area
 from randovania.game_description.world.world import World
 from randovania.game_description.world.world_list import WorldList
@@ -60,3 +61,24 @@ def test_calculate_dangerous_resources(danger_a, danger_b, expected_result):
 
     # Assert
     assert set(result) == set(expected_result)
+
+
+def test_get_mutable_shares_worlds(blank_game_description):
+    # Setup
+    world_list = blank_game_description.world_list
+    node = next(node for node in world_list.iterate_nodes() if list(world_list.area_connections_from(node)))
+    original_connections = list(world_list.area_connections_from(node))
+
+    # Run
+    mutable = blank_game_description.get_mutable()
+    mutable.patch_requirements(ResourceCollection.with_database(blank_game_description.resource_database), 1.0)
+
+    # Assert
+    assert mutable.mutable
+    assert not blank_game_description.mutable
+    assert mutable.get_mutable() is mutable
+    assert mutable.world_list.worlds is world_list.worlds
+    assert mutable.world_list.all_nodes is world_list.all_nodes
+    assert list(world_list.area_connections_from(node)) == original_connections
+    assert mutable.world_list._patched_node_connections is not None
+    assert world_list._patched_node_connections is None
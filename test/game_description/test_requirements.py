@@ -3,7 +3,9 @@ from unittest.mock import MagicMock
 import pytest
 
 from randovania.game_description import data_reader
+from randovania.game_description.requirements import as_set_cache
 from randovania.game_description.requirements.base import MAX_DAMAGE, Requirement
+from randovania.game_description.requirements.compiled_requirement import CompiledRequirement
 from randovania.game_description.requirements.requirement_and import RequirementAnd
 from randovania.game_description.requirements.requirement_list import RequirementList
 from randovania.game_description.requirements.requirement_or import RequirementOr
@@ -562,6 +564,87 @@ def test_requirement_damage(damage, items, requirement, echoes_resource_database
     })
 
     assert req.damage(collection, echoes_resource_database) == damage
+    assert CompiledRequirement.compile(req).damage(collection, echoes_resource_database) == damage
+
+
+@pytest.mark.parametrize(["energy", "items", "requirement"], [
+    (60, [], _arr_req("and", [_json_req(50), _json_req(50)])),
+    (40, [], _arr_req("and", [_json_req(50), _json_req(50)])),
+    (10, [], _arr_req("or", [_json_req(50), _json_req(1, "Dark", ResourceType.ITEM)])),
+    (10, ["Dark"], _arr_req("or", [_json_req(50), _json_req(1, "Dark", ResourceType.ITEM)])),
+    (20, ["DarkSuit"], _arr_req("and", [_json_req(100, "DarkWorld1"), _json_req(2, "Missile", ResourceType.ITEM)])),
+    (200, ["Missile"], _arr_req("and", [
+        _json_req(100),
+        _arr_req("or", [_json_req(50), _json_req(1, "Dark", ResourceType.ITEM)]),
+    ])),
+])
+def test_compiled_requirement_same_as_original(energy, items, requirement, echoes_resource_database):
+    db = echoes_resource_database
+    req = data_reader.read_requirement(requirement, db)
+    compiled = CompiledRequirement.compile(req)
+    collection = ResourceCollection.from_dict(db, {
+        db.get_item(item): 1
+        for item in items
+    })
+
+    # Assert
+    assert isinstance(compiled, CompiledRequirement)
+    assert compiled.is_compiled(db)
+    assert compiled == req
+    assert compiled.satisfied(collection, energy, db) == req.satisfied(collection, energy, db)
+    assert compiled.damage(collection, db) == req.damage(collection, db)
+
+
+def test_compiled_requirement_compile_skips(database):
+    single = ResourceRequirement.simple(database.item[0])
+
+    assert CompiledRequirement.compile(single) is single
+    assert CompiledRequirement.compile(Requirement.trivial()) is Requirement.trivial()
+    assert CompiledRequirement.compile(Requirement.impossible()) is Requirement.impossible()
+
+
+def test_as_set_cache(database):
+    # Setup
+    req = RequirementAnd([
+        ResourceRequirement.simple(database.item[0]),
+        RequirementOr([
+            ResourceRequirement.simple(database.item[1]),
+            ResourceRequirement.simple(database.item[2]),
+        ]),
+    ])
+    cache = as_set_cache.cache_for(database)
+
+    # Run
+    first = req.as_set(database)
+    second = req.as_set(database)
+    equal_req = RequirementAnd(req.items)
+    third = equal_req.as_set(database)
+
+    # Assert
+    assert first is second
+    assert first == third
+    assert third is not first
+    # equal_req is a new object, but the RequirementOr inside is shared
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_as_set_cache_invalidate(database):
+    # Setup
+    database.requirement_template["Use A"] = ResourceRequirement.simple(database.item[0])
+    use_a = RequirementTemplate("Use A")
+    old_set = use_a.as_set(database)
+
+    # Run
+    database.requirement_template["Use A"] = ResourceRequirement.simple(database.item[1])
+    cached_set = use_a.as_set(database)
+    as_set_cache.invalidate(database)
+    new_set = use_a.as_set(database)
+
+    # Assert
+    assert cached_set is old_set
+    assert new_set == make_single_set(make_req_b(database))
+    new_cache = as_set_cache.cache_for(database)
+    assert (new_cache.hits, new_cache.misses) == (0, 1)
 
 
 def test_simple_echoes_damage(echoes_resource_database):
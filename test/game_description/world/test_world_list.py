@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from frozendict import frozendict
 
+from randovania.game_description.game_patches import GamePatches
 from randovania.game_description.requirements.base import Requirement
 from randovania.game_description.requirements.requirement_and import RequirementAnd
 from randovania.game_description.requirements.resource_requirement import ResourceRequirement
@@ -92,3 +93,33 @@ def test_node_index_multiple_games(default_prime_preset):
 
     for node in default_game.world_list.iterate_nodes():
         assert all_nodes_default[node.node_index] is node
+
+
+def test_potential_nodes_from_cached_for_patches(blank_game_description, default_blank_configuration):
+    # Setup
+    game = blank_game_description.get_mutable()
+    game.world_list = game.world_list.copy_sharing_worlds()
+    game.world_list.patch_requirements(ResourceCollection(), 1.0, game.resource_database,
+                                       game.dock_weakness_database)
+    patches = GamePatches.create_from_game(game, 0, default_blank_configuration)
+    dock = next(node for node in game.world_list.iterate_nodes() if isinstance(node, DockNode))
+    weakness = next(weak for weak in game.dock_weakness_database.all_weaknesses
+                    if weak != patches.get_dock_weakness_for(dock))
+
+    def context_for(p):
+        return NodeContext(p, ResourceCollection(), game.resource_database, game.world_list)
+
+    def expected_for(p):
+        return tuple(dock.connections_from(context_for(p))) + tuple(game.world_list.area_connections_from(dock))
+
+    # Run
+    first = game.world_list.potential_nodes_from(dock, context_for(patches))
+    second = game.world_list.potential_nodes_from(dock, context_for(dataclasses.replace(patches, hints={})))
+    new_patches = patches.assign_dock_weakness([(dock, weakness)])
+    changed = game.world_list.potential_nodes_from(dock, context_for(new_patches))
+
+    # Assert
+    assert first == expected_for(patches)
+    assert second is first
+    assert changed == expected_for(new_patches)
+    assert changed != first
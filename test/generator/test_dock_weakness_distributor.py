@@ -4,6 +4,7 @@ from randovania.generator.generator import generate_and_validate_description
 from randovania.interface_common.preset_editor import PresetEditor
 from randovania.layout.base.dock_rando_configuration import DockRandoMode
 from randovania.layout.generator_parameters import GeneratorParameters
+from randovania.resolver import resolver
 
 
 async def test_dock_weakness_distribute(default_blank_preset):
@@ -19,3 +20,25 @@ async def test_dock_weakness_distribute(default_blank_preset):
     description = await generate_and_validate_description(gen_params, None, False)
 
     assert list(description.all_patches[0].all_dock_weaknesses())
+
+
+async def test_dock_weakness_distribute_setup_once(default_blank_preset, mocker):
+    # Setup
+    _editor = PresetEditor(default_blank_preset.fork())
+    with _editor as editor:
+        editor.dock_rando_configuration = dataclasses.replace(
+            editor.dock_rando_configuration,
+            mode=DockRandoMode.TWO_WAY
+        )
+        preset = editor.create_custom_preset_with()
+
+    mock_setup = mocker.patch("randovania.resolver.resolver.setup_resolver", wraps=resolver.setup_resolver)
+    gen_params = GeneratorParameters(5000, False, [preset])
+
+    # Run
+    description = await generate_and_validate_description(gen_params, None, False)
+
+    # Assert
+    assert list(description.all_patches[0].all_dock_weaknesses())
+    # All docks reuse the same setup
+    mock_setup.assert_called_once()
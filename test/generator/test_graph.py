@@ -0,0 +1,81 @@
+import pytest
+
+from randovania.game_description.requirements.requirement_set import RequirementSet
+from randovania.generator import graph as graph_module
+
+
+@pytest.fixture(name="graph_class", params=list(graph_module.GRAPH_BACKENDS.values()))
+def _graph_class(request) -> type[graph_module.BaseGraph]:
+    return request.param
+
+
+def _create_graph(graph_class: type[graph_module.BaseGraph]) -> graph_module.BaseGraph:
+    graph = graph_class.new()
+    for node in range(7):
+        graph.add_node(node)
+
+    # 0 <-> 1 -> 2 <-> 3 -> 1, 3 -> 4 -> 5 <-> 6
+    for source, target in [(0, 1), (1, 0), (1, 2), (2, 3), (3, 2), (3, 1), (3, 4), (4, 5), (5, 6), (6, 5)]:
+        graph.add_edge(source, target, RequirementSet.trivial())
+
+    return graph
+
+
+def test_strongly_connected_component_of(graph_class):
+    # Setup
+    graph = _create_graph(graph_class)
+
+    # Run
+    results = {node: graph.strongly_connected_component_of(node) for node in range(7)}
+
+    # Assert
+    assert results[0] == {0, 1, 2, 3}
+    assert results[4] == {4}
+    assert results[5] == {5, 6}
+    for component in graph.strongly_connected_components():
+        for node in component:
+            assert results[node] == component
+
+
+def test_node_costs_from(graph_class):
+    # Setup
+    graph = _create_graph(graph_class)
+    weights = {0: 0, 1: 0, 2: 1, 3: 0, 4: 1, 5: 1, 6: 0}
+
+    # Run
+    costs = graph.node_costs_from(0, weights.__getitem__)
+
+    # Assert
+    assert costs == {0: 0, 1: 0, 2: 1, 3: 1, 4: 2, 5: 3, 6: 3}
+
+
+def test_copy_is_independent(graph_class):
+    # Setup
+    graph = _create_graph(graph_class)
+
+    # Run
+    copy = graph.copy()
+    copy.remove_edge(3, 4)
+    copy.add_node(7)
+    copy.add_edge(6, 7, RequirementSet.impossible())
+
+    # Assert
+    assert graph.has_edge(3, 4)
+    assert not copy.has_edge(3, 4)
+    assert 7 not in graph
+    assert 7 in copy
+    assert graph.strongly_connected_component_of(0) == copy.strongly_connected_component_of(0)
+    assert len(list(graph.edges_data())) == 10
+    assert len(list(copy.edges_data())) == 10
+
+
+def test_set_graph_backend():
+    previous = graph_module.get_graph_backend()
+    try:
+        graph_module.set_graph_backend("array")
+        assert isinstance(graph_module.new_graph(), graph_module.ArrayGraph)
+
+        with pytest.raises(ValueError, match="Unknown graph backend: foo"):
+            graph_module.set_graph_backend("foo")
+    finally:
+        graph_module.set_graph_backend(previous)
@@ -0,0 +1,43 @@
+import dataclasses
+import uuid
+
+from randovania.games.game import RandovaniaGame
+from randovania.interface_common import generation_pool
+from randovania.interface_common.generation_pool import GenerationPool, GenerationRequest
+from randovania.layout.generator_parameters import GeneratorParameters
+
+
+def test_request_for(mocker):
+    # Setup
+    mock_executor = mocker.patch("randovania.interface_common.generation_pool.ProcessPoolExecutor")
+    bundled = generation_pool.bundled_presets([RandovaniaGame.BLANK])[0]
+    custom = dataclasses.replace(bundled, uuid=uuid.UUID("b41fde84-1f57-4b79-8cd6-3e5a78077fa6"), name="Custom")
+    changed = dataclasses.replace(bundled, name="Changed")
+
+    # Run
+    pool = GenerationPool(2, presets=[custom])
+    request = pool.request_for(GeneratorParameters(1000, False, [bundled, custom, changed]), timeout=None)
+
+    # Assert
+    mock_executor.assert_called_once_with(max_workers=2, initializer=generation_pool.preload_worker,
+                                          initargs=((RandovaniaGame.BLANK,), (custom,)))
+    assert request == GenerationRequest(
+        presets=(bundled.uuid, custom.uuid, changed),
+        seed_number=1000,
+        spoiler=False,
+        timeout=None,
+    )
+
+
+def test_generate_in_worker():
+    # Setup
+    preset = generation_pool.bundled_presets([RandovaniaGame.BLANK])[0]
+    generation_pool.preload_worker((RandovaniaGame.BLANK,), ())
+
+    # Run
+    description = generation_pool.generate_in_worker(
+        GenerationRequest(presets=(preset.uuid,), seed_number=1000, validate_after_generation=False)
+    )
+
+    # Assert
+    assert description.generator_parameters == GeneratorParameters(1000, True, [preset])
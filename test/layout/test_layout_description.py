@@ -1,3 +1,4 @@
+import gzip
 import json
 import pickle
 from pathlib import Path
@@ -30,3 +31,18 @@ def test_load_multiworld(test_files_dir):
     del as_json["info"]
 
     assert as_json == input_data
+
+
+def test_from_file_gzip(test_files_dir, tmp_path):
+    file_path = Path(test_files_dir).joinpath("log_files", "seed_a.rdvgame")
+    compressed_path = tmp_path.joinpath("seed_a.rdvgame.gz")
+    with gzip.open(compressed_path, "wb") as open_file:
+        open_file.write(file_path.read_bytes())
+
+    # Run
+    result = LayoutDescription.from_file(compressed_path)
+
+    # Assert
+    expected = LayoutDescription.from_file(file_path)
+    assert result.generator_parameters.seed_number == expected.generator_parameters.seed_number
+    assert result.as_json()["game_modifications"] == expected.as_json()["game_modifications"]
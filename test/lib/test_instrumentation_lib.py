@@ -0,0 +1,78 @@
+import json
+from unittest.mock import MagicMock
+
+from randovania.cli import cli_lib
+from randovania.lib import instrumentation_lib
+from randovania.lib.instrumentation_lib import InstrumentationCollector
+
+
+def _fake_clock():
+    times = iter(range(100))
+    return lambda: float(next(times))
+
+
+def test_collector_nested_phases():
+    # Setup
+    collector = InstrumentationCollector(clock=_fake_clock())
+
+    # Run
+    with instrumentation_lib.collecting(collector):
+        with instrumentation_lib.phase("outer"):
+            for _ in range(2):
+                with instrumentation_lib.phase("inner"):
+                    instrumentation_lib.count("things", 3)
+
+    # Assert
+    assert instrumentation_lib.current_collector() is None
+    assert collector.as_json() == {
+        "duration": 7.0,
+        "phases": {
+            "outer": {"count": 1, "total": 5.0, "max": 5.0},
+            "inner": {"count": 2, "total": 2.0, "max": 1.0},
+        },
+        "counters": {"things": 6},
+    }
+    profile = collector.as_speedscope("Test")
+    assert profile["shared"]["frames"] == [{"name": "outer"}, {"name": "inner"}]
+    assert profile["profiles"][0]["events"] == [
+        {"type": "O", "frame": 0, "at": 1.0},
+        {"type": "O", "frame": 1, "at": 2.0},
+        {"type": "C", "frame": 1, "at": 3.0},
+        {"type": "O", "frame": 1, "at": 4.0},
+        {"type": "C", "frame": 1, "at": 5.0},
+        {"type": "C", "frame": 0, "at": 6.0},
+    ]
+
+
+def test_timed_without_collector():
+    # Setup
+    func = MagicMock(return_value=5)
+    timed = instrumentation_lib.timed("func")(func)
+
+    # Run
+    with instrumentation_lib.phase("nothing"):
+        instrumentation_lib.count("nothing")
+        result = timed(1, b=2)
+
+    # Assert
+    assert result == 5
+    func.assert_called_once_with(1, b=2)
+    assert instrumentation_lib.current_collector() is None
+
+
+def test_instrumentation_from_args(tmp_path):
+    # Setup
+    args = MagicMock()
+    args.instrumentation_output = tmp_path.joinpath("profile.json")
+    args.instrumentation_format = "speedscope"
+    timed = instrumentation_lib.timed("func")(lambda: None)
+
+    # Run
+    with cli_lib.instrumentation_from_args(args, "Profile"):
+        timed()
+
+    # Assert
+    data = json.loads(args.instrumentation_output.read_text())
+    assert data["name"] == "Profile"
+    assert data["shared"]["frames"] == [{"name": "func"}]
+    assert [event["type"] for event in data["profiles"][0]["events"]] == ["O", "C"]
@@ -0,0 +1,17 @@
+from randovania.lib import linked_list_lib
+
+
+def test_append_shares_elements():
+    # Setup
+    base = linked_list_lib.from_iterable([1, 2])
+
+    # Run
+    first = linked_list_lib.append(base, 3)
+    second = linked_list_lib.append(base, 4)
+
+    # Assert
+    assert linked_list_lib.to_tuple(None) == ()
+    assert linked_list_lib.to_tuple(base) == (1, 2)
+    assert linked_list_lib.to_tuple(first) == (1, 2, 3)
+    assert linked_list_lib.to_tuple(second) == (1, 2, 4)
+    assert first[1] is second[1]
@@ -1,3 +1,4 @@
+import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, call
 
@@ -9,10 +10,12 @@ from randovania.game_connection.memory_executor_choice import MemoryExecutorChoi
 from randovania.game_description.resources.item_resource_info import ItemResourceInfo
 from randovania.game_description.resources.pickup_entry import PickupEntry, PickupModel
 from randovania.games.game import RandovaniaGame
-from randovania.network_client.game_session import GameSessionPickups
+from randovania.network_client.game_session import (GameSessionPickups, GameSessionAuditEntry, GameSessionAuditLog,
+                                                    GameSessionAction, GameSessionActions)
 from randovania.network_client.network_client import NetworkClient, ConnectionState, _decode_pickup
 from randovania.network_common import connection_headers
 from randovania.network_common.admin_actions import SessionAdminGlobalAction, SessionAdminUserAction
+from randovania.network_common.binary_formats import BinaryGameSessionActions, BinaryGameSessionAuditLog
 from randovania.network_common.error import InvalidSession, RequestTimeout, ServerError
 
 
@@ -208,6 +211,104 @@ async def test_refresh_received_pickups(client: NetworkClient, corruption_game_d
     mock_decode.assert_has_calls([call('VtI6Bb3p', db), call('VtI6Bb3y', db), call('VtI6Bb3*', db)])
 
 
+@pytest.mark.parametrize("start", [1, 2, 3])
+async def test_received_pickups_delta(client: NetworkClient, mocker, start):
+    game = RandovaniaGame.METROID_PRIME_CORRUPTION
+    previous = [MagicMock(), MagicMock()]
+    client._current_game_session_pickups = GameSessionPickups(game=game, pickups=(
+        ("Message A", previous[0]),
+        ("Message B", previous[1]),
+    ))
+    client.game_session_request_update = AsyncMock()
+    data = {
+        "game": game.value,
+        "start": start,
+        "pickups": [
+            {"provider_name": "Message C", "pickup": 'VtI6Bb3*'},
+        ]
+    }
+    new_pickup = MagicMock()
+    mocker.patch("randovania.network_client.network_client._decode_pickup", return_value=new_pickup)
+
+    # Run
+    await client._on_game_session_pickups_update_raw(data)
+
+    # Assert
+    if start > 2:
+        client.game_session_request_update.assert_awaited_once_with()
+        assert len(client._current_game_session_pickups.pickups) == 2
+    else:
+        client.game_session_request_update.assert_not_awaited()
+        assert client._current_game_session_pickups == GameSessionPickups(
+            game=game,
+            pickups=(
+                ("Message A", previous[0]),
+                ("Message B", previous[1]),
+            )[:start] + (("Message C", new_pickup),)
+        )
+
+
+@pytest.mark.parametrize("start", [0, 1, 2, 3])
+async def test_received_audit_delta(client: NetworkClient, start):
+    previous = (
+        GameSessionAuditEntry("A", "First", datetime.datetime(2020, 5, 2, 10, 20, tzinfo=datetime.timezone.utc)),
+        GameSessionAuditEntry("B", "Second", datetime.datetime(2020, 5, 3, 10, 20, tzinfo=datetime.timezone.utc)),
+    )
+    client._current_game_session_audit_log = GameSessionAuditLog(previous)
+    client.game_session_request_update = AsyncMock()
+    data = {
+        "start": start,
+        "entries": BinaryGameSessionAuditLog.build([
+            {"user": "C", "message": "Third", "time": "2020-05-04T10:20:00+00:00"},
+        ]),
+    }
+
+    # Run
+    await client._on_game_session_audit_update_raw(data)
+
+    # Assert
+    if start > 2:
+        client.game_session_request_update.assert_awaited_once_with()
+        assert client._current_game_session_audit_log.entries == previous
+    else:
+        client.game_session_request_update.assert_not_awaited()
+        assert client._current_game_session_audit_log.entries == previous[:start] + (
+            GameSessionAuditEntry("C", "Third", datetime.datetime(2020, 5, 4, 10, 20, tzinfo=datetime.timezone.utc)),
+        )
+
+
+@pytest.mark.parametrize("has_previous", [False, True])
+async def test_received_actions_delta(client: NetworkClient, has_previous):
+    action = {
+        "location": 5,
+        "pickup": "The Pickup",
+        "provider": "Other",
+        "provider_row": 1,
+        "receiver": "The Name",
+        "time": "2020-05-02T10:20:00+00:00",
+    }
+    previous = GameSessionAction.from_json(dict(action, location=2))
+    if has_previous:
+        client._current_game_session_actions = GameSessionActions((previous,))
+    client.game_session_request_update = AsyncMock()
+
+    # Run
+    await client._on_game_session_actions_update_raw({
+        "start": 1,
+        "actions": BinaryGameSessionActions.build([action]),
+    })
+
+    # Assert
+    if has_previous:
+        client.game_session_request_update.assert_not_awaited()
+        assert client._current_game_session_actions == GameSessionActions((
+            previous, GameSessionAction.from_json(action),
+        ))
+    else:
+        client.game_session_request_update.assert_awaited_once_with()
+        assert client._current_game_session_actions is None
+
+
 def test_decode_pickup(client: NetworkClient, echoes_resource_database, generic_item_category):
     data = (
         "h^WxYK%Bzb%4P&bZe?<3c~o*?ZgXa3a!qe!b!=sZ&dS`%<kH75DmyE4E0aqZ0!yPSX#yJyqboamlgnXlAeaHwx"
@@ -249,3 +350,17 @@ async def test_session_self_update(client: NetworkClient):
         "game_session_self_update",
         (1234, b'\x01None\x00\x01\x01', "In-game (Dolphin)")
     )
+
+
+async def test_game_session_request_update(client: NetworkClient):
+    client._emit_with_result = AsyncMock()
+    client._current_game_session_meta = MagicMock()
+    client._current_game_session_meta.id = 1234
+    client._current_game_session_pickups = GameSessionPickups(RandovaniaGame.METROID_PRIME_ECHOES,
+                                                               (("A", MagicMock()),))
+
+    # Run
+    await client.game_session_request_update()
+
+    # Assert
+    client._emit_with_result.assert_awaited_once_with("game_session_request_update", (1234, 1))
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, PropertyMock
 
 from randovania.game_description.world.event_node import EventNode
+from randovania.layout.layout_description import LayoutDescription
+from randovania.resolver import resolver
 from randovania.resolver.resolver_reach import ResolverReach
 
 
@@ -61,3 +63,21 @@ def test_possible_actions_with_event():
     logic.get_additional_requirements.assert_called_once_with(event)
     logic.get_additional_requirements.return_value.satisfied.assert_called_once_with(state.resources, 1,
                                                                                      state.resource_database)
+
+
+def test_calculate_reach_with_parent_matches_full(test_files_dir):
+    description = LayoutDescription.from_file(test_files_dir.joinpath("log_files", "prime1-vanilla.rdvgame"))
+    state, logic = resolver.setup_resolver(description.get_preset(0).configuration, description.all_patches[0])
+
+    parent_reach = ResolverReach.calculate_reach(logic, state)
+    for action, energy in list(parent_reach.possible_actions(state)):
+        new_state = state.act_on_node(action, path=parent_reach.path_to_node(action), new_energy=energy)
+
+        # Run
+        full = ResolverReach.calculate_reach(logic, new_state)
+        incremental = ResolverReach.calculate_reach(logic, new_state, parent_reach)
+
+        # Assert
+        assert incremental._energy_at_node == full._energy_at_node
+        assert incremental._path_to_node == full._path_to_node
+        assert incremental.satisfiable_requirements == full.satisfiable_requirements
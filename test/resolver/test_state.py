@@ -1,9 +1,12 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from randovania.game_description.resources.pickup_entry import PickupEntry, ResourceLock
 from randovania.game_description.resources.resource_info import ResourceCollection
 from randovania.game_description.world.node import NodeContext
 from randovania.game_description.world.pickup_node import PickupNode
+from randovania.lib import linked_list_lib
 from randovania.resolver import state
 from randovania.resolver.state import StateGameData
 
@@ -36,7 +39,7 @@ def test_collected_pickup_indices(state_game_data, empty_patches):
         pickup_nodes[0].resource(context): 1,
         pickup_nodes[1].resource(context): 1
     })
-    s = state.State(resources, (), 99, starting, empty_patches, None, state_game_data)
+    s = state.State(resources, None, 99, starting, empty_patches, None, state_game_data)
 
     # Run
     indices = list(s.collected_pickup_indices)
@@ -49,7 +52,7 @@ def test_add_pickup_to_state(state_game_data, empty_patches, generic_item_catego
     # Starting State
     db = state_game_data.resource_database
     starting_node = state_game_data.world_list.resolve_teleporter_connection(empty_patches.game.starting_location)
-    s = state.State(ResourceCollection(), (), 99, starting_node, empty_patches, None, state_game_data)
+    s = state.State(ResourceCollection(), None, 99, starting_node, empty_patches, None, state_game_data)
 
     resource_a = db.item[0]
     resource_b = db.item[1]
@@ -74,7 +77,7 @@ def test_assign_pickup_to_starting_items(empty_patches, state_game_data, generic
     # Setup
     db = state_game_data.resource_database
     starting_node = state_game_data.world_list.resolve_teleporter_connection(empty_patches.game.starting_location)
-    starting = state.State(ResourceCollection(), (), 99, starting_node, empty_patches, None, state_game_data)
+    starting = state.State(ResourceCollection(), None, 99, starting_node, empty_patches, None, state_game_data)
 
     resource_a = db.get_item("Ammo")
     resource_b = db.item[0]
@@ -99,7 +102,7 @@ def test_assign_pickup_to_starting_items(empty_patches, state_game_data, generic
 def test_state_with_pickup(state_game_data, empty_patches, generic_item_category):
     # Setup
     db = state_game_data.resource_database
-    starting = state.State(ResourceCollection(), (), 99, None, empty_patches, None, state_game_data)
+    starting = state.State(ResourceCollection(), None, 99, None, empty_patches, None, state_game_data)
 
     resource_a = db.item[0]
     p = PickupEntry("A", 2, generic_item_category, generic_item_category,
@@ -113,3 +116,37 @@ def test_state_with_pickup(state_game_data, empty_patches, generic_item_category
     # Assert
     assert final.previous_state is starting
     assert final.resources == ResourceCollection.from_dict(db, {resource_a: 1})
+
+
+def test_collected_resource_nodes_are_shared(state_game_data, empty_patches):
+    # Setup
+    starting = state.State(ResourceCollection(), None, 99, None, empty_patches, None, state_game_data)
+    node_a, node_b, node_c = [MagicMock() for _ in range(3)]
+    for node in (node_a, node_b, node_c):
+        node.resource_gain_on_collect.return_value = []
+
+    # Run
+    first = starting.act_on_node(node_a)
+    second = first.act_on_node(node_b).take_damage(10)
+    other = first.copy().act_on_node(node_c)
+
+    # Assert
+    assert starting.collected_resource_nodes == ()
+    assert first.collected_resource_nodes == (node_a,)
+    assert second.collected_resource_nodes == (node_a, node_b)
+    assert other.collected_resource_nodes == (node_a, node_c)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3])
+def test_collected_resource_nodes_from_tuple(state_game_data, empty_patches, count):
+    # Setup
+    nodes = tuple(node for node in empty_patches.game.world_list.all_nodes if isinstance(node, PickupNode))[:count]
+
+    # Run
+    from_tuple = state.State(ResourceCollection(), nodes, 99, None, empty_patches, None, state_game_data)
+    from_linked = state.State(ResourceCollection(), linked_list_lib.from_iterable(nodes), 99, None, empty_patches,
+                              None, state_game_data)
+
+    # Assert
+    assert from_tuple.collected_resource_nodes == nodes
+    assert from_linked.collected_resource_nodes == nodes
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+from randovania.game_description.resources.resource_info import ResourceCollection
+from randovania.resolver import transposition_table
+from randovania.resolver.transposition_table import TranspositionTable
+
+
+def test_state_key_ignores_collection_order(blank_resource_db):
+    # Setup
+    item_a, item_b = blank_resource_db.item[0], blank_resource_db.item[1]
+    resources_1 = ResourceCollection.with_database(blank_resource_db)
+    resources_1.add_resource_gain([(item_a, 1), (item_b, 3)])
+    resources_2 = ResourceCollection.with_database(blank_resource_db)
+    resources_2.add_resource_gain([(item_b, 2), (item_a, 1), (item_b, 1)])
+    resources_3 = ResourceCollection.with_database(blank_resource_db)
+    resources_3.add_resource_gain([(item_a, 3), (item_b, 1)])
+
+    def make_state(resources, energy=99):
+        return MagicMock(node=MagicMock(node_index=5), energy=energy, resources=resources)
+
+    # Run
+    key_1 = transposition_table.state_key(make_state(resources_1))
+    key_2 = transposition_table.state_key(make_state(resources_2))
+    key_3 = transposition_table.state_key(make_state(resources_3))
+    key_4 = transposition_table.state_key(make_state(resources_1, energy=50))
+
+    # Assert
+    assert key_1 == key_2
+    assert key_1 != key_3
+    assert key_1 != key_4
+
+
+def test_transposition_table_lru():
+    # Setup
+    table = TranspositionTable(max_entries=2)
+    table.add_dead_end("a", True)
+    table.add_dead_end("b", False)
+
+    # Run
+    first_a = table.get_dead_end("a")
+    table.add_dead_end("c", True)
+
+    # Assert
+    assert first_a is True
+    assert table.get_dead_end("b") is None
+    assert table.get_dead_end("a") is True
+    assert table.get_dead_end("c") is True
+    assert len(table) == 2
+    assert (table.hits, table.misses) == (3, 1)
+
+
+def test_transposition_table_disabled():
+    table = TranspositionTable(max_entries=0)
+    table.add_dead_end("a", True)
+
+    assert table.get_dead_end("a") is None
+    assert len(table) == 0
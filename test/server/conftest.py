@@ -3,7 +3,7 @@ import flask
 import pytest
 from peewee import SqliteDatabase
 
-from randovania.server import database
+from randovania.server import database, session_pickups
 
 
 @pytest.fixture()
@@ -18,6 +18,7 @@ def clean_database():
             yield test_db
     finally:
         database.db = old_db
+        session_pickups.clear_cache()
 
 
 @pytest.fixture()
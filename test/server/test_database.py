@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 from peewee import SqliteDatabase
 
@@ -46,3 +48,22 @@ def test_GameSession_create_session_entry(clean_database, has_description, test_
         'presets': [],
         'state': 'setup',
     }
+
+
+def test_GameSession_query_actions_same_time(clean_database):
+    # Setup
+    someone = database.User.create(name="Someone")
+    session = database.GameSession.create(name="Debug", num_teams=1, creator=someone)
+    time = datetime.datetime(2022, 5, 6, 12, 0, tzinfo=datetime.timezone.utc)
+    for provider_row, location in [(1, 5), (0, 7), (1, 2), (0, 3)]:
+        database.GameSessionTeamAction.create(session=session, provider_row=provider_row,
+                                              provider_location_index=location, receiver_row=0, time=time)
+
+    # Run
+    result = [
+        (action.provider_row, action.provider_location_index)
+        for action in session._query_actions()
+    ]
+
+    # Assert
+    assert result == [(0, 3), (0, 7), (1, 2), (1, 5)]
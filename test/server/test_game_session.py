@@ -2,12 +2,11 @@ import contextlib
 import dataclasses
 import datetime
 import json
-from unittest.mock import MagicMock, PropertyMock, patch, call
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import peewee
 import pytest
 
-from randovania.game_description.assignment import PickupTarget
 from randovania.game_description.resources.pickup_entry import PickupEntry, PickupModel
 from randovania.games.game import RandovaniaGame
 from randovania.games.prime2.layout.echoes_configuration import EchoesConfiguration
@@ -21,7 +20,9 @@ from randovania.network_common.binary_formats import BinaryGameSessionEntry, Bin
     BinaryGameSessionAuditLog
 from randovania.network_common.error import InvalidAction
 from randovania.network_common.session_state import GameSessionState
-from randovania.server import game_session, database
+from randovania.server import game_session, database, session_pickups
+from randovania.server.session_emitter import SessionEmitter
+from randovania.server.session_pickups import SessionPickupTable, SessionPickupTarget
 
 
 @pytest.fixture(name="mock_emit_session_update")
@@ -34,6 +35,18 @@ def _mock_audit(mocker) -> MagicMock:
     return mocker.patch("randovania.server.game_session._add_audit_entry", autospec=True)
 
 
+def _sio_with_emitter(user: database.User | None = None) -> MagicMock:
+    sio = MagicMock()
+    sio.get_current_user.return_value = user
+    sio.session_emitter = SessionEmitter(sio)
+    return sio
+
+
+def _run_background_tasks(sio: MagicMock):
+    for task_call in sio.sio.start_background_task.call_args_list:
+        task_call.args[0](*task_call.args[1:])
+
+
 def test_setup_app():
     game_session.setup_app(MagicMock())
 
@@ -119,7 +132,7 @@ def test_join_game_session(mock_emit_session_update: MagicMock,
     result = game_session.join_game_session(sio, 1, None)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     assert convert_to_raw_python(BinaryGameSessionEntry.parse(result)) == {
         'id': 1,
         'state': GameSessionState.SETUP.value,
@@ -181,16 +194,16 @@ def two_player_session_fixture(clean_database):
     return session
 
 
-@patch("randovania.server.game_session._get_pickup_target", autospec=True)
-@patch("randovania.server.game_session._get_resource_database", autospec=True)
-@patch("randovania.server.database.GameSession.layout_description", new_callable=PropertyMock)
-def test_game_session_request_pickups_one_action(mock_session_description: PropertyMock,
-                                                 mock_get_resource_database: MagicMock,
-                                                 mock_get_pickup_target: MagicMock,
-                                                 flask_app, two_player_session, generic_item_category,
+def _pickup_table(targets: dict[tuple[int, int], SessionPickupTarget]) -> SessionPickupTable:
+    return SessionPickupTable(games=(RandovaniaGame.METROID_PRIME_ECHOES, RandovaniaGame.METROID_PRIME_ECHOES),
+                              targets=targets)
+
+
+def test_game_session_request_pickups_one_action(flask_app, two_player_session, generic_item_category,
                                                  echoes_resource_database, mocker):
     # Setup
     mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+    mock_table_for_session = mocker.patch("randovania.server.session_pickups.table_for_session")
 
     sio = MagicMock()
     sio.get_current_user.return_value = database.User.get_by_id(1234)
@@ -199,24 +212,24 @@ def test_game_session_request_pickups_one_action(mock_session_description: Prope
     pickup = PickupEntry("A", PickupModel(echoes_resource_database.game_enum, "AmmoModel"),
                          generic_item_category, generic_item_category,
                          progression=((echoes_resource_database.item[0], 1),))
-    mock_get_pickup_target.return_value = PickupTarget(pickup=pickup, player=0)
-    mock_get_resource_database.return_value = echoes_resource_database
+    mock_table_for_session.return_value = _pickup_table({
+        (1, 0): SessionPickupTarget(0, "A", session_pickups.encode_pickup(pickup, echoes_resource_database)),
+    })
 
     # Run
     game_session._emit_game_session_pickups_update(sio, membership)
 
     # # Uncomment this to encode the data once again and get the new bytefield if it changed for some reason
-    # from randovania.server.game_session import _base64_encode_pickup
-    # new_data = _base64_encode_pickup(pickup, echoes_resource_database)
+    # new_data = session_pickups.encode_pickup(pickup, echoes_resource_database)
     # assert new_data == b""
 
     # Assert
-    mock_get_resource_database.assert_called_once_with(mock_session_description.return_value, 0)
-    mock_get_pickup_target.assert_called_once_with(mock_session_description.return_value, 1, 0)
+    mock_table_for_session.assert_called_once_with(two_player_session)
     mock_emit.assert_called_once_with(
         "game_session_pickups_update",
         {
             "game": "prime2",
+            "start": 0,
             "pickups": [{
                 'provider_name': 'Other Name',
                 'pickup': ('C?+ZkYioLIdm}4kHg;C#S0<J@fl=98nOvG!$P!%{TSyStT^U*1+@4ztaRk5)t<G)?tZgjKEUbhL'
@@ -227,24 +240,53 @@ def test_game_session_request_pickups_one_action(mock_session_description: Prope
     )
 
 
-@patch("flask_socketio.emit", autospec=True)
-@patch("randovania.server.game_session._get_pickup_target", autospec=True)
-@patch("randovania.server.game_session._get_resource_database", autospec=True)
-@patch("randovania.server.database.GameSession.layout_description", new_callable=PropertyMock)
-def test_game_session_collect_pickup_for_self(mock_session_description: PropertyMock,
-                                              mock_get_resource_database: MagicMock,
-                                              mock_get_pickup_target: MagicMock,
-                                              mock_emit: MagicMock,
-                                              flask_app, two_player_session, generic_item_category,
-                                              echoes_resource_database):
+@pytest.mark.parametrize(("start", "expected_start", "expected_locations"), [
+    (0, 0, [0, 1, 2]),
+    (2, 2, [2]),
+    (3, 3, []),
+    (4, 0, [0, 1, 2]),
+])
+def test_game_session_request_pickups_from_start(flask_app, two_player_session, mocker,
+                                                 start, expected_start, expected_locations):
+    # Setup
+    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+    mocker.patch("randovania.server.session_pickups.table_for_session", return_value=_pickup_table({
+        (1, location): SessionPickupTarget(0, "A", f"encoded {location}")
+        for location in range(3)
+    }))
+
+    for location in [1, 2]:
+        database.GameSessionTeamAction.create(session=two_player_session, provider_row=1,
+                                              provider_location_index=location, receiver_row=0)
+    membership = database.GameSessionMembership.get(user=database.User.get_by_id(1234), session=two_player_session)
+
+    # Run
+    game_session._emit_game_session_pickups_update(MagicMock(), membership, start)
+
+    # Assert
+    mock_emit.assert_called_once_with(
+        "game_session_pickups_update",
+        {
+            "game": "prime2",
+            "start": expected_start,
+            "pickups": [
+                {"provider_name": "Other Name", "pickup": f"encoded {location}"}
+                for location in expected_locations
+            ],
+        },
+        room=f"game-session-1-1234"
+    )
+
+
+def test_game_session_collect_pickup_for_self(flask_app, two_player_session, mocker):
+    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+    mock_table_for_session = mocker.patch("randovania.server.session_pickups.table_for_session",
+                                          return_value=_pickup_table({
+                                              (0, 0): SessionPickupTarget(0, "A", "encoded"),
+                                          }))
     sio = MagicMock()
     sio.get_current_user.return_value = database.User.get_by_id(1234)
 
-    pickup = PickupEntry("A", 1, generic_item_category, generic_item_category,
-                         progression=((echoes_resource_database.item[0], 1),))
-    mock_get_resource_database.return_value = echoes_resource_database
-    mock_get_pickup_target.return_value = PickupTarget(pickup, 0)
-
     # Run
     with flask_app.test_request_context():
         result = game_session.game_session_collect_locations(sio, 1, (0,))
@@ -252,24 +294,18 @@ def test_game_session_collect_pickup_for_self(mock_session_description: Property
     # Assert
     assert result is None
     mock_emit.assert_not_called()
-    mock_get_pickup_target.assert_called_once_with(mock_session_description.return_value, 0, 0)
+    mock_table_for_session.assert_called_once_with(two_player_session)
     with pytest.raises(peewee.DoesNotExist):
         database.GameSessionTeamAction.get(session=two_player_session, provider_row=0,
                                            provider_location_index=0)
 
 
-@patch("flask_socketio.emit", autospec=True)
-@patch("randovania.server.game_session._get_pickup_target", autospec=True)
-@patch("randovania.server.database.GameSession.layout_description", new_callable=PropertyMock)
-def test_game_session_collect_pickup_etm(mock_session_description: PropertyMock,
-                                         mock_get_pickup_target: MagicMock,
-                                         mock_emit: MagicMock,
-                                         flask_app, two_player_session, echoes_resource_database):
+def test_game_session_collect_pickup_etm(flask_app, two_player_session, mocker):
+    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+    mocker.patch("randovania.server.session_pickups.table_for_session", return_value=_pickup_table({}))
     sio = MagicMock()
     sio.get_current_user.return_value = database.User.get_by_id(1234)
 
-    mock_get_pickup_target.return_value = None
-
     # Run
     with flask_app.test_request_context():
         result = game_session.game_session_collect_locations(sio, 1, (0,))
@@ -277,7 +313,6 @@ def test_game_session_collect_pickup_etm(mock_session_description: PropertyMock,
     # Assert
     assert result is None
     mock_emit.assert_not_called()
-    mock_get_pickup_target.assert_called_once_with(mock_session_description.return_value, 0, 0)
     with pytest.raises(peewee.DoesNotExist):
         database.GameSessionTeamAction.get(session=two_player_session, provider_row=0,
                                            provider_location_index=0)
@@ -294,15 +329,15 @@ def test_game_session_collect_pickup_other(flask_app, two_player_session, echoes
                                            locations_to_collect, exists, mocker):
     mock_emit_pickups_update: MagicMock = mocker.patch(
         "randovania.server.game_session._emit_game_session_pickups_update", autospec=True)
-    mock_get_pickup_target: MagicMock = mocker.patch("randovania.server.game_session._get_pickup_target", autospec=True)
-    mock_session_description: PropertyMock = mocker.patch("randovania.server.database.GameSession.layout_description",
-                                                          new_callable=PropertyMock)
+    mocker.patch("randovania.server.session_pickups.table_for_session", return_value=_pickup_table({
+        (0, location): SessionPickupTarget(1, "A", "encoded")
+        for location in range(2)
+    }))
     mock_emit_session_update = mocker.patch("randovania.server.game_session._emit_session_actions_update",
                                             autospec=True)
 
     sio = MagicMock()
     sio.get_current_user.return_value = database.User.get_by_id(1234)
-    mock_get_pickup_target.return_value = PickupTarget(MagicMock(), 1)
     membership = database.GameSessionMembership.get_by_session_position(two_player_session, row=1)
 
     for existing_id in exists:
@@ -315,10 +350,6 @@ def test_game_session_collect_pickup_other(flask_app, two_player_session, echoes
 
     # Assert
     assert result is None
-    mock_get_pickup_target.assert_has_calls([
-        call(mock_session_description.return_value, 0, location)
-        for location in locations_to_collect
-    ])
     for location in locations_to_collect:
         database.GameSessionTeamAction.get(session=two_player_session, provider_row=0,
                                            provider_location_index=location)
@@ -326,8 +357,8 @@ def test_game_session_collect_pickup_other(flask_app, two_player_session, echoes
         mock_emit_pickups_update.assert_not_called()
         mock_emit_session_update.assert_not_called()
     else:
-        mock_emit_pickups_update.assert_called_once_with(sio, membership)
-        mock_emit_session_update.assert_called_once_with(database.GameSession.get(id=1))
+        mock_emit_pickups_update.assert_called_once_with(sio, membership, 0)
+        mock_emit_session_update.assert_called_once_with(sio, database.GameSession.get(id=1))
 
 
 @pytest.mark.parametrize("is_observer", [False, True])
@@ -348,7 +379,7 @@ def test_game_session_admin_player_switch_is_observer(clean_database, flask_app,
     assert membership.is_observer != is_observer
     if is_observer:
         assert membership.row == 0
-    mock_emit_session_update.assert_called_once_with(database.GameSession.get(id=1))
+    mock_emit_session_update.assert_called_once_with(sio, database.GameSession.get(id=1))
 
 
 def test_game_session_admin_player_include_in_session(clean_database, flask_app, mock_emit_session_update):
@@ -375,15 +406,12 @@ def test_game_session_admin_player_include_in_session(clean_database, flask_app,
     membership = database.GameSessionMembership.get(user=users[3], session=session)
     assert not membership.is_observer
     assert membership.row == 3
-    mock_emit_session_update.assert_called_once_with(database.GameSession.get(id=1))
+    mock_emit_session_update.assert_called_once_with(sio, database.GameSession.get(id=1))
 
 
 def test_game_session_admin_kick_last(clean_database, flask_app, mocker, mock_audit):
-    mock_emit = mocker.patch("flask_socketio.emit")
-
     user = database.User.create(id=1234, discord_id=5678, name="The Name")
-    sio = MagicMock()
-    sio.get_current_user.return_value = user
+    sio = _sio_with_emitter(user)
     game_session.create_game_session(sio, "My Room")
     session = database.GameSession.get_by_id(1)
     database.GameSessionTeamAction.create(session=session, provider_row=0, provider_location_index=0, receiver_row=0,
@@ -392,6 +420,7 @@ def test_game_session_admin_kick_last(clean_database, flask_app, mocker, mock_au
     # Run
     with flask_app.test_request_context():
         game_session.game_session_admin_player(sio, 1, 1234, SessionAdminUserAction.KICK.value, None)
+        _run_background_tasks(sio)
 
     # Assert
     for table in [database.GameSession, database.GameSessionPreset,
@@ -399,7 +428,7 @@ def test_game_session_admin_kick_last(clean_database, flask_app, mocker, mock_au
         assert list(table.select()) == []
     assert database.User.get_by_id(1234) == user
 
-    mock_emit.assert_called_once_with(
+    sio.sio.emit.assert_called_once_with(
         "game_session_meta_update",
         BinaryGameSessionEntry.build({'id': 1, 'name': 'My Room', 'state': 'setup', 'players': [], 'presets': [],
                                       'game_details': None, 'generation_in_progress': None,
@@ -428,7 +457,7 @@ def test_game_session_admin_player_move(clean_database, flask_app, mock_emit_ses
     # Assert
     membership = database.GameSessionMembership.get(user=user1, session=session)
     assert membership.row == 1 + offset
-    mock_emit_session_update.assert_called_once_with(database.GameSession.get(id=1))
+    mock_emit_session_update.assert_called_once_with(sio, database.GameSession.get(id=1))
 
 
 @patch("randovania.server.database.GameSession.layout_description", new_callable=PropertyMock)
@@ -482,7 +511,7 @@ def test_game_session_admin_session_delete_session(mock_emit_session_update: Mag
         game_session.game_session_admin_session(sio, 1, SessionAdminGlobalAction.DELETE_SESSION.value, None)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     assert list(database.GameSession.select()) == []
 
 
@@ -499,7 +528,7 @@ def test_game_session_admin_session_create_row(mock_emit_session_update: MagicMo
         game_session.game_session_admin_session(sio, 1, "create_row", preset_manager.default_preset.as_json)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     assert database.GameSession.get_by_id(1).num_rows == 1
 
 
@@ -522,7 +551,7 @@ def test_game_session_admin_session_change_row(mock_emit_session_update: MagicMo
                                                 (1, preset_manager.default_preset.as_json))
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     new_preset_row = database.GameSessionPreset.get(database.GameSessionPreset.session == session,
                                                     database.GameSessionPreset.row == 1)
     assert json.loads(new_preset_row.preset) == preset_manager.default_preset.as_json
@@ -543,7 +572,7 @@ def test_game_session_admin_session_delete_row(mock_emit_session_update: MagicMo
         game_session.game_session_admin_session(sio, 1, SessionAdminGlobalAction.DELETE_ROW.value, 1)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     assert database.GameSession.get_by_id(1).num_rows == 1
 
 
@@ -605,7 +634,7 @@ def test_game_session_admin_session_update_layout_generation(mock_emit_session_u
     if case == "to_true_busy":
         mock_emit_session_update.assert_not_called()
     else:
-        mock_emit_session_update.assert_called_once_with(session)
+        mock_emit_session_update.assert_called_once_with(sio, session)
     assert database.GameSession.get_by_id(1).generation_in_progress == expected_user
 
 
@@ -644,7 +673,7 @@ def test_game_session_admin_session_change_layout_description(clean_database, pr
                                                 "layout_description_json")
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     mock_audit.assert_called_once_with(sio, session, "Set game to Hash Words")
     mock_verify_no_layout_description.assert_called_once_with(session)
     assert database.GameSession.get_by_id(1).layout_description_json == '"some_json_string"'
@@ -671,7 +700,7 @@ def test_game_session_admin_session_remove_layout_description(mock_emit_session_
                                                 None)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     mock_audit.assert_called_once_with(sio, session, "Removed generated game")
     assert database.GameSession.get_by_id(1).layout_description_json is None
     assert database.GameSession.get_by_id(1).generation_in_progress is None
@@ -766,7 +795,7 @@ def test_game_session_admin_session_start_session(mock_session_description: Prop
         game_session.game_session_admin_session(sio, 1, SessionAdminGlobalAction.START_SESSION.value, None)
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     mock_audit.assert_called_once_with(sio, session, "Started session")
     assert database.GameSession.get_by_id(1).state == GameSessionState.IN_PROGRESS
 
@@ -795,7 +824,7 @@ def test_game_session_admin_session_finish_session(clean_database, mock_emit_ses
         mock_audit.assert_not_called()
         assert database.GameSession.get_by_id(1).state == starting_state
     else:
-        mock_emit_session_update.assert_called_once_with(session)
+        mock_emit_session_update.assert_called_once_with(sio, session)
         mock_audit.assert_called_once_with(sio, session, "Finished session")
         assert database.GameSession.get_by_id(1).state == GameSessionState.FINISHED
 
@@ -825,7 +854,7 @@ def test_game_session_admin_session_change_password(clean_database, mock_emit_se
         game_session.game_session_admin_session(sio, 1, SessionAdminGlobalAction.CHANGE_PASSWORD.value, "the_password")
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     mock_audit.assert_called_once_with(sio, session, "Changed password")
     assert database.GameSession.get_by_id(1).password == expected_password
 
@@ -842,7 +871,7 @@ def test_game_session_admin_session_change_title(clean_database, mock_emit_sessi
         game_session.game_session_admin_session(sio, 1, SessionAdminGlobalAction.CHANGE_TITLE.value, "new_name")
 
     # Assert
-    mock_emit_session_update.assert_called_once_with(session)
+    mock_emit_session_update.assert_called_once_with(sio, session)
     mock_audit.assert_called_once_with(sio, session, "Changed name from Debug to new_name")
     assert database.GameSession.get_by_id(1).name == "new_name"
 
@@ -924,12 +953,11 @@ def session_update_fixture(clean_database, mocker):
     mock_layout.permalink.as_base64_str = "<permalink>"
     mock_layout.get_preset.return_value.game = RandovaniaGame.METROID_PRIME_ECHOES
 
-    mock_layout.all_patches = MagicMock()
-    target = mock_layout.all_patches.__getitem__.return_value.pickup_assignment.__getitem__.return_value
-    target.pickup.name = "The Pickup"
-
     mocker.patch("randovania.server.database.GameSession.layout_description",
                  new_callable=PropertyMock, return_value=mock_layout)
+    mocker.patch("randovania.server.session_pickups.table_for_session", return_value=_pickup_table({
+        (1, 0): SessionPickupTarget(0, "The Pickup", "encoded"),
+    }))
 
     user1 = database.User.create(id=1234, name="The Name")
     user2 = database.User.create(id=1235, name="Other")
@@ -945,8 +973,8 @@ def session_update_fixture(clean_database, mocker):
     return session
 
 
-def test_emit_session_meta_update(session_update, flask_app, mocker):
-    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+def test_emit_session_meta_update(session_update, flask_app):
+    sio = _sio_with_emitter()
 
     session_json = {
         "id": 1,
@@ -980,10 +1008,13 @@ def test_emit_session_meta_update(session_update, flask_app, mocker):
 
     # Run
     with flask_app.test_request_context():
-        game_session._emit_session_meta_update(session_update)
+        game_session._emit_session_meta_update(sio, session_update)
+        game_session._emit_session_meta_update(sio, session_update)
+        _run_background_tasks(sio)
 
     # Assert
-    mock_emit.assert_called_once_with(
+    sio.sio.start_background_task.assert_called_once()
+    sio.sio.emit.assert_called_once_with(
         "game_session_meta_update",
         BinaryGameSessionEntry.build(session_json),
         room=f"game-session-{session_update.id}",
@@ -991,8 +1022,8 @@ def test_emit_session_meta_update(session_update, flask_app, mocker):
     )
 
 
-def test_emit_session_actions_update(session_update, flask_app, mocker):
-    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+def test_emit_session_actions_update(session_update, flask_app):
+    sio = _sio_with_emitter()
 
     actions = [
         {
@@ -1007,19 +1038,20 @@ def test_emit_session_actions_update(session_update, flask_app, mocker):
 
     # Run
     with flask_app.test_request_context():
-        game_session._emit_session_actions_update(session_update)
+        game_session._emit_session_actions_update(sio, session_update)
+        _run_background_tasks(sio)
 
     # Assert
-    mock_emit.assert_called_once_with(
+    sio.sio.emit.assert_called_once_with(
         "game_session_actions_update",
-        BinaryGameSessionActions.build(actions),
+        {"start": 0, "actions": BinaryGameSessionActions.build(actions)},
         room=f"game-session-{session_update.id}",
         namespace='/',
     )
 
 
-def test_emit_session_audit_update(session_update, flask_app, mocker):
-    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+def test_emit_session_audit_update(session_update, flask_app):
+    sio = _sio_with_emitter()
 
     database.GameSessionAudit.create(session=session_update, user=1234, message="Did something",
                                      time=datetime.datetime(2020, 5, 2, 10, 20, tzinfo=datetime.timezone.utc))
@@ -1033,26 +1065,21 @@ def test_emit_session_audit_update(session_update, flask_app, mocker):
 
     # Run
     with flask_app.test_request_context():
-        game_session._emit_session_audit_update(session_update)
+        game_session._emit_session_audit_update(sio, session_update)
+        _run_background_tasks(sio)
 
     # Assert
-    mock_emit.assert_called_once_with(
+    sio.sio.emit.assert_called_once_with(
         "game_session_audit_update",
-        BinaryGameSessionAuditLog.build(audit_log),
+        {"start": 0, "entries": BinaryGameSessionAuditLog.build(audit_log)},
         room=f"game-session-{session_update.id}",
         namespace='/',
     )
 
 
 def test_game_session_request_update(session_update, mocker, flask_app):
-    mock_meta_update: MagicMock = mocker.patch(
-        "randovania.server.game_session._emit_session_meta_update", autospec=True)
-    mock_actions_update: MagicMock = mocker.patch(
-        "randovania.server.game_session._emit_session_actions_update", autospec=True)
     mock_pickups_update: MagicMock = mocker.patch(
         "randovania.server.game_session._emit_game_session_pickups_update", autospec=True)
-    mock_audit_update: MagicMock = mocker.patch(
-        "randovania.server.game_session._emit_session_audit_update", autospec=True)
 
     user = database.User.get_by_id(1234)
     sio = MagicMock()
@@ -1061,10 +1088,45 @@ def test_game_session_request_update(session_update, mocker, flask_app):
 
     # Run
     with flask_app.test_request_context():
-        game_session.game_session_request_update(sio, 1)
+        game_session.game_session_request_update(sio, 1, 5)
+
+    # Assert
+    sio.session_emitter.emit_session_state.assert_called_once_with(session_update)
+    mock_pickups_update.assert_called_once_with(sio, membership, 5)
+
+
+@pytest.mark.parametrize("changed", [False, True])
+def test_game_session_self_update(clean_database, mock_emit_session_update, changed):
+    user1 = database.User.create(id=1234, name="The Name")
+    session = database.GameSession.create(id=1, name="Debug", state=GameSessionState.IN_PROGRESS, creator=user1)
+    sio = MagicMock()
+    sio.get_current_user.return_value = user1
+    sio.self_update_buffer.update.return_value = changed
+
+    # Run
+    game_session.game_session_self_update(sio, 1, b"inventory", "Game")
+
+    # Assert
+    sio.self_update_buffer.update.assert_called_once_with(1234, 1, b"inventory", "Online, Game")
+    if changed:
+        mock_emit_session_update.assert_called_once_with(sio, session)
+    else:
+        mock_emit_session_update.assert_not_called()
+
+
+def test_report_user_disconnected(clean_database, mock_emit_session_update):
+    user1 = database.User.create(id=1234, name="The Name")
+    session = database.GameSession.create(id=1, name="Debug", state=GameSessionState.IN_PROGRESS, creator=user1)
+    database.GameSessionMembership.create(user=user1, session=session, row=0, admin=True,
+                                          connection_state="Online, Game")
+    sio = MagicMock()
+    sio.self_update_buffer.flush_user.side_effect = lambda user_id: database.GameSessionMembership.update(
+        connection_state="Online, Other").execute()
+
+    # Run
+    game_session.report_user_disconnected(sio, 1234, MagicMock())
 
     # Assert
-    mock_meta_update.assert_called_once_with(session_update)
-    mock_actions_update.assert_called_once_with(session_update)
-    mock_pickups_update.assert_called_once_with(sio, membership)
-    mock_audit_update.assert_called_once_with(session_update)
+    sio.self_update_buffer.flush_user.assert_called_once_with(1234)
+    assert database.GameSessionMembership.get_by_ids(1234, 1).connection_state == "Offline"
+    mock_emit_session_update.assert_called_once_with(sio, session)
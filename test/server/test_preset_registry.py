@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from randovania.interface_common.preset_manager import PresetManager
+from randovania.layout.versioned_preset import InvalidPreset
+from randovania.server import preset_registry
+
+
+@pytest.fixture(autouse=True)
+def _clear_preset_cache():
+    preset_registry.clear_cache()
+    yield
+    preset_registry.clear_cache()
+
+
+def test_included_presets():
+    preset_manager = PresetManager(None)
+    default_json = json.dumps(preset_manager.default_preset.as_json)
+
+    assert preset_registry.default_preset_json() == default_json
+    assert list(preset_registry.included_presets().values()) == list(preset_manager.included_presets.values())
+
+
+def test_validated_preset_cached(preset_manager, mocker):
+    # Setup
+    preset_json = preset_manager.default_preset.as_json
+    reordered_json = dict(reversed(preset_json.items()))
+    mock_key = mocker.spy(preset_registry, "_preset_key")
+
+    # Run
+    first = preset_registry.validated_preset(preset_json)
+    second = preset_registry.validated_preset(reordered_json)
+
+    # Assert
+    assert first is second
+    assert first.get_preset() == preset_manager.default_preset.get_preset()
+    assert mock_key.call_count == 2
+
+
+def test_validated_preset_invalid():
+    # Run
+    with pytest.raises(InvalidPreset):
+        preset_registry.validated_preset({"schema_version": 1})
+
+    # Assert
+    assert len(preset_registry._validated_presets) == 0
+
+
+def test_validated_preset_bounded(preset_manager, mocker):
+    # Setup
+    mocker.patch("randovania.server.preset_registry.MAX_CACHED_PRESETS", 2)
+    presets = [preset.as_json for preset in list(preset_manager.included_presets.values())[:3]]
+
+    # Run
+    results = [preset_registry.validated_preset(preset) for preset in presets]
+
+    # Assert
+    assert list(preset_registry._validated_presets.values()) == results[1:]
+    assert preset_registry.validated_preset(presets[2]) is results[2]
+    assert preset_registry.validated_preset(presets[0]) is not results[0]
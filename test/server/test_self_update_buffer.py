@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+import prometheus_client
+import pytest
+
+from randovania.server import database
+from randovania.server.self_update_buffer import SelfUpdateBuffer
+
+
+@pytest.fixture(name="buffer_session")
+def _buffer_session(clean_database):
+    user1 = database.User.create(id=1234, name="The Name")
+    user2 = database.User.create(id=1235, name="Other")
+    session = database.GameSession.create(id=1, name="Debug", creator=user1)
+    database.GameSessionMembership.create(user=user1, session=session, row=0, admin=True,
+                                          connection_state="Online, Game")
+    database.GameSessionMembership.create(user=user2, session=session, row=1, admin=False,
+                                          connection_state="Offline")
+    return session
+
+
+def _inventory(user_id: int) -> bytes:
+    return database.GameSessionMembership.get_by_ids(user_id, 1).inventory
+
+
+def _state(user_id: int) -> str:
+    return database.GameSessionMembership.get_by_ids(user_id, 1).connection_state
+
+
+def _sio_with_registry() -> MagicMock:
+    sio = MagicMock()
+    sio.metrics.registry = prometheus_client.CollectorRegistry()
+    return sio
+
+
+def _queue_depth(sio: MagicMock) -> float:
+    return sio.metrics.registry.get_sample_value("self_update_queue_depth")
+
+
+def test_update_same_state_is_buffered(buffer_session, mocker):
+    sio = _sio_with_registry()
+    buffer = SelfUpdateBuffer(sio)
+    mock_get_by_ids = mocker.spy(database.GameSessionMembership, "get_by_ids")
+
+    # Run
+    first = buffer.update(1234, 1, b"first", "Online, Game")
+    second = buffer.update(1234, 1, b"second", "Online, Game")
+    before_flush = _inventory(1234)
+
+    sio.sio.start_background_task.call_args.args[0]()
+
+    # Assert
+    assert not first
+    assert not second
+    assert mock_get_by_ids.call_count == 2
+    assert before_flush is None
+    assert _inventory(1234) == b"second"
+    sio.sio.start_background_task.assert_called_once()
+    sio.sio.sleep.assert_called_once()
+    assert _queue_depth(sio) == 0
+
+
+def test_update_new_state_is_written(buffer_session):
+    sio = MagicMock()
+    buffer = SelfUpdateBuffer(sio)
+
+    # Run
+    buffer.update(1235, 1, b"first", "Offline")
+    changed = buffer.update(1235, 1, b"second", "Online, Game")
+
+    # Assert
+    assert changed
+    assert _state(1235) == "Online, Game"
+    assert _inventory(1235) == b"second"
+    buffer.flush()
+    assert _inventory(1235) == b"second"
+
+
+def test_flush_user(buffer_session):
+    sio = _sio_with_registry()
+    buffer = SelfUpdateBuffer(sio)
+    buffer.update(1234, 1, b"mine", "Online, Game")
+    buffer.update(1235, 1, b"other", "Offline")
+
+    # Run
+    buffer.flush_user(1234)
+    database.GameSessionMembership.update(connection_state="Offline").where(
+        database.GameSessionMembership.user == 1234).execute()
+    changed = buffer.update(1234, 1, b"mine again", "Online, Game")
+
+    # Assert
+    assert _inventory(1235) is None
+    assert changed
+    assert _inventory(1234) == b"mine again"
+    assert _queue_depth(sio) == 1
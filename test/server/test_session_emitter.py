@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from randovania.server import database
+from randovania.server.session_emitter import SessionEmitter, SessionUpdate
+
+
+@pytest.fixture(name="emitter_session")
+def _emitter_session(clean_database, mocker):
+    mocker.patch("randovania.server.database.GameSession.create_session_entry", autospec=True,
+                 side_effect=lambda session: f"meta {session.name}".encode())
+    mocker.patch("randovania.server.database.GameSession.describe_actions", autospec=True,
+                 side_effect=lambda session, start=0: (f"actions from {start}".encode(), 2))
+    mocker.patch("randovania.server.database.GameSession.get_audit_log", autospec=True,
+                 side_effect=lambda session, start=0: (f"audit from {start}".encode(), 1))
+
+    user = database.User.create(id=1234, name="The Name")
+    return database.GameSession.create(id=1, name="Debug", creator=user, layout_description_json="{}")
+
+
+def _run_background_tasks(sio: MagicMock):
+    calls = list(sio.sio.start_background_task.call_args_list)
+    sio.sio.start_background_task.reset_mock()
+    for task_call in calls:
+        task_call.args[0](*task_call.args[1:])
+
+
+def test_schedule_coalesces(emitter_session, flask_app):
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+
+    # Run
+    with flask_app.app_context():
+        for update in [SessionUpdate.META, SessionUpdate.AUDIT, SessionUpdate.META, SessionUpdate.AUDIT]:
+            emitter.schedule(emitter_session, update)
+        _run_background_tasks(sio)
+
+    # Assert
+    sio.sio.sleep.assert_called_once()
+    sio.sio.emit.assert_has_calls([
+        call("game_session_meta_update", b"meta Debug", room="game-session-1", namespace="/"),
+        call("game_session_audit_update", {"start": 0, "entries": b"audit from 0"},
+             room="game-session-1", namespace="/"),
+    ])
+    assert sio.sio.emit.call_count == 2
+
+
+def test_flush_sends_only_new_entries(emitter_session, flask_app):
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+
+    # Run
+    with flask_app.app_context():
+        emitter.schedule(emitter_session, SessionUpdate.ACTIONS)
+        _run_background_tasks(sio)
+        emitter.schedule(emitter_session, SessionUpdate.ACTIONS)
+        _run_background_tasks(sio)
+
+    # Assert
+    sio.sio.emit.assert_has_calls([
+        call("game_session_actions_update", {"start": 0, "actions": b"actions from 0"},
+             room="game-session-1", namespace="/"),
+        call("game_session_actions_update", {"start": 2, "actions": b"actions from 2"},
+             room="game-session-1", namespace="/"),
+    ])
+
+
+def test_emit_session_state_cached(emitter_session, flask_app, mocker):
+    mock_emit: MagicMock = mocker.patch("flask_socketio.emit")
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+
+    # Run
+    with flask_app.test_request_context():
+        emitter.emit_session_state(emitter_session)
+        emitter.emit_session_state(emitter_session)
+        emitter_session.name = "New Name"
+        emitter.schedule(emitter_session, SessionUpdate.META)
+        emitter.emit_session_state(emitter_session)
+
+    # Assert
+    expected_calls = [
+        call("game_session_meta_update", b"meta Debug"),
+        call("game_session_actions_update", {"start": 0, "actions": b"actions from 0"}),
+        call("game_session_audit_update", {"start": 0, "entries": b"audit from 0"}),
+    ]
+    mock_emit.assert_has_calls(expected_calls + expected_calls + [
+        call("game_session_meta_update", b"meta New Name"),
+        expected_calls[1],
+        expected_calls[2],
+    ])
+    assert database.GameSession.create_session_entry.call_count == 3
+    assert database.GameSession.describe_actions.call_count == 1
+    assert database.GameSession.get_audit_log.call_count == 1
+
+
+def test_emit_session_state_user_renamed(emitter_session, flask_app, mocker):
+    mocker.patch("flask_socketio.emit")
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+
+    # Run
+    with flask_app.test_request_context():
+        emitter.emit_session_state(emitter_session)
+        emitter.user_renamed()
+        emitter.emit_session_state(emitter_session)
+
+    # Assert
+    assert database.GameSession.describe_actions.call_count == 2
+    assert database.GameSession.get_audit_log.call_count == 2
+
+
+def test_flush_deleted_session(emitter_session, flask_app):
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+
+    # Run
+    with flask_app.app_context():
+        emitter.schedule(emitter_session, SessionUpdate.META)
+        emitter.schedule(emitter_session, SessionUpdate.AUDIT)
+        emitter_session.delete_instance(recursive=True)
+        _run_background_tasks(sio)
+        emitter.flush(emitter_session.id)
+
+    # Assert
+    sio.sio.emit.assert_called_once_with("game_session_meta_update", b"meta Debug",
+                                         room="game-session-1", namespace="/")
+
+
+def test_state_for_evicts_old_sessions(emitter_session, flask_app, mocker):
+    mocker.patch("randovania.server.session_emitter.MAX_CACHED_SESSIONS", 2)
+    sio = MagicMock()
+    emitter = SessionEmitter(sio)
+    sessions = [
+        database.GameSession.create(id=i, name=f"Session {i}", creator=emitter_session.creator)
+        for i in range(2, 5)
+    ]
+
+    # Run
+    with flask_app.app_context():
+        emitter.schedule(emitter_session, SessionUpdate.META)
+        for session in sessions:
+            emitter._state_for(session)
+
+    # Assert
+    assert list(emitter._sessions) == [1, 4]
@@ -0,0 +1,90 @@
+from unittest.mock import PropertyMock
+
+from randovania.game_description import default_database
+from randovania.game_description.resources.pickup_index import PickupIndex
+from randovania.layout.layout_description import LayoutDescription
+from randovania.server import database, session_pickups
+from randovania.server.session_pickups import SessionPickupTable
+
+
+def test_table_from_layout(test_files_dir):
+    # Setup
+    description = LayoutDescription.from_file(test_files_dir.joinpath("log_files", "prime1_and_2_multi.rdvgame"))
+
+    # Run
+    table = SessionPickupTable.from_layout(description)
+
+    # Assert
+    assert table.games == tuple(preset.game for preset in description.all_presets)
+    for provider, patches in description.all_patches.items():
+        for index, target in patches.pickup_assignment.items():
+            resource_database = default_database.resource_database_for(table.games[target.player])
+            pickup_target = table.get_target(provider, index.index)
+            assert pickup_target.receiver == target.player
+            assert pickup_target.pickup_name == target.pickup.name
+            assert pickup_target.encoded_pickup == session_pickups.encode_pickup(target.pickup, resource_database)
+
+    assert table.get_target(0, 5000) is None
+    assert len(table.targets) == sum(len(patches.pickup_assignment) for patches in description.all_patches.values())
+
+
+def test_table_for_session_cached(clean_database, test_files_dir, mocker):
+    # Setup
+    description = LayoutDescription.from_file(test_files_dir.joinpath("log_files", "seed_a.rdvgame"))
+    someone = database.User.create(name="Someone")
+    session = database.GameSession.create(name="Debug", creator=someone)
+    mock_description = mocker.patch("randovania.server.database.GameSession.layout_description",
+                                    new_callable=PropertyMock, return_value=description)
+
+    # Run
+    first = session_pickups.table_for_session(session)
+    second = session_pickups.table_for_session(database.GameSession.get_by_id(session.id))
+    session_pickups.evict_session(session.id)
+    third = session_pickups.table_for_session(session)
+
+    # Assert
+    assert first is second
+    assert third is not first
+    assert third == first
+    assert mock_description.call_count == 2
+    expected_pickup = description.all_patches[0].pickup_assignment[PickupIndex(0)].pickup
+    assert first.get_target(0, 0).pickup_name == expected_pickup.name
+
+
+def test_table_for_session_changing_layout(clean_database, test_files_dir):
+    # Setup
+    description = LayoutDescription.from_file(test_files_dir.joinpath("log_files", "seed_a.rdvgame"))
+    someone = database.User.create(name="Someone")
+    session = database.GameSession.create(name="Debug", creator=someone)
+
+    # Run
+    without_layout = session_pickups.table_for_session(session)
+    session.layout_description = description
+    session.save()
+    with_layout = session_pickups.table_for_session(session)
+    session.reset_layout_description()
+    after_reset = session_pickups.table_for_session(session)
+
+    # Assert
+    assert without_layout is None
+    assert with_layout is not None
+    assert after_reset is None
+
+
+def test_table_for_session_bounded(clean_database, mocker):
+    # Setup
+    mocker.patch("randovania.server.session_pickups.MAX_CACHED_SESSIONS", 2)
+    mocker.patch("randovania.server.database.GameSession.layout_description", new_callable=PropertyMock)
+    mock_from_layout = mocker.patch("randovania.server.session_pickups.SessionPickupTable.from_layout",
+                                    side_effect=lambda d: object())
+    someone = database.User.create(name="Someone")
+    sessions = [database.GameSession.create(name=f"Session {i}", creator=someone) for i in range(3)]
+
+    # Run
+    tables = [session_pickups.table_for_session(session) for session in sessions]
+    session_pickups.table_for_session(sessions[2])
+    session_pickups.table_for_session(sessions[0])
+
+    # Assert
+    assert mock_from_layout.call_count == 4
+    assert session_pickups.table_for_session(sessions[2]) is tables[2]
@@ -45,6 +45,10 @@ def test_login_with_discord(mock_fetch_token: MagicMock, clean_database, flask_a
     )
     user = User.get(User.discord_id == 1234)
     assert user.name == "A Name"
+    if existing:
+        sio.session_emitter.user_renamed.assert_called_once_with()
+    else:
+        sio.session_emitter.user_renamed.assert_not_called()
 
     assert session == {
         "user-id": user.id,
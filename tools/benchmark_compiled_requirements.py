@@ -0,0 +1,88 @@
+"""
+Compares checking the connection requirements of each game with CompiledRequirement against the original
+requirements, making sure both give the same results.
+"""
+import argparse
+import random
+import time
+
+from randovania.game_description import default_database
+from randovania.game_description.requirements.compiled_requirement import CompiledRequirement
+from randovania.game_description.resources.resource_info import ResourceCollection
+from randovania.games.game import RandovaniaGame
+
+
+def _random_resources(rng: random.Random, game) -> ResourceCollection:
+    db = game.resource_database
+    resources = ResourceCollection.with_database(db)
+    for resource in db.resource_by_index:
+        if resource is not None and rng.random() < 0.5:
+            resources.set_resource(resource, rng.randint(0, 5))
+    return resources
+
+
+def benchmark_game(game_enum: RandovaniaGame, samples: int, seed: int):
+    game = default_database.game_description_for(game_enum).get_mutable()
+    db = game.resource_database
+    game.patch_requirements(ResourceCollection.with_database(db), 1.0)
+
+    world_list = game.world_list
+    requirements = [
+        requirement
+        for node in world_list.iterate_nodes()
+        for _, requirement in world_list.area_connections_from(node)
+        if isinstance(requirement, CompiledRequirement)
+    ]
+    requirements.extend(
+        requirement
+        for weakness in game.dock_weakness_database.all_weaknesses
+        for requirement in [world_list.open_requirement_for(weakness),
+                            world_list.lock_requirement_for(weakness) if weakness.lock is not None else None]
+        if isinstance(requirement, CompiledRequirement)
+    )
+
+    rng = random.Random(seed)
+    all_resources = [(_random_resources(rng, game), rng.randint(1, 500)) for _ in range(samples)]
+
+    def run(items) -> tuple[float, list[bool]]:
+        start = time.perf_counter()
+        results = [
+            item.satisfied(resources, energy, db)
+            for resources, energy in all_resources
+            for item in items
+        ]
+        return time.perf_counter() - start, results
+
+    # Compile everything before timing
+    run(requirements)
+
+    original_time, original_results = run([requirement.original for requirement in requirements])
+    compiled_time, compiled_results = run(requirements)
+
+    if original_results != compiled_results:
+        raise ValueError(f"{game_enum.long_name}: compiled requirements gave different results")
+
+    for resources, _ in all_resources:
+        for requirement in requirements:
+            if requirement.damage(resources, db) != requirement.original.damage(resources, db):
+                raise ValueError(f"{game_enum.long_name}: compiled requirement {requirement} gave different damage")
+
+    num_compiled = sum(1 for requirement in requirements if requirement.is_compiled(db))
+    print(f"{game_enum.long_name}: {num_compiled}/{len(requirements)} requirements compiled. "
+          f"Original: {original_time:.3f}s, compiled: {compiled_time:.3f}s, "
+          f"speedup: {original_time / compiled_time:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=200, help="How many random resource collections to check.")
+    parser.add_argument("--seed", type=int, default=1000)
+    parser.add_argument("--game", type=RandovaniaGame, choices=list(RandovaniaGame), nargs="*")
+    args = parser.parse_args()
+
+    for game in args.game or RandovaniaGame:
+        benchmark_game(game, args.samples, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares generating games with each of the graph backends used by the generator's reach, making sure all of them
+generate the same games.
+"""
+import argparse
+import asyncio
+import time
+
+from randovania.generator import generator, graph
+from randovania.games.game import RandovaniaGame
+from randovania.interface_common.preset_manager import PresetManager
+from randovania.layout.generator_parameters import GeneratorParameters
+
+
+def _generate(parameters: GeneratorParameters, backend: str) -> tuple[float, str]:
+    graph.set_graph_backend(backend)
+    start = time.perf_counter()
+    description = asyncio.run(generator.generate_and_validate_description(
+        generator_params=parameters,
+        status_update=None,
+        validate_after_generation=False,
+        timeout=None,
+    ))
+    return time.perf_counter() - start, description.shareable_hash
+
+
+def benchmark_game(game_enum: RandovaniaGame, seeds: list[int]):
+    preset = PresetManager(None).default_preset_for_game(game_enum).get_preset()
+    backends = list(graph.GRAPH_BACKENDS)
+    total_times = {backend: 0.0 for backend in backends}
+
+    for i, seed in enumerate(seeds):
+        parameters = GeneratorParameters(seed, False, [preset])
+        hashes = {}
+
+        # Alternate which backend goes first, so neither always benefits from a warmer process
+        order = backends if i % 2 == 0 else list(reversed(backends))
+        for backend in order:
+            seed_time, hashes[backend] = _generate(parameters, backend)
+            total_times[backend] += seed_time
+
+        if len(set(hashes.values())) != 1:
+            raise ValueError(f"{game_enum.long_name}: seed {seed} generated different games: {hashes}")
+
+    baseline = total_times[backends[0]]
+    print(f"{game_enum.long_name}: " + ", ".join(
+        f"{backend}: {total:.2f}s ({baseline / total:.2f}x)"
+        for backend, total in total_times.items()
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=3, help="How many seeds to generate with each backend.")
+    parser.add_argument("--seed", type=int, default=1000, help="The first seed number.")
+    parser.add_argument("--game", type=RandovaniaGame, choices=list(RandovaniaGame), nargs="*")
+    args = parser.parse_args()
+
+    previous_backend = graph.get_graph_backend()
+    try:
+        for game in args.game or RandovaniaGame:
+            benchmark_game(game, list(range(args.seed, args.seed + args.seeds)))
+    finally:
+        graph.set_graph_backend(previous_backend)
+
+
+if __name__ == '__main__':
+    main()
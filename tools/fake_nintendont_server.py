@@ -3,6 +3,16 @@ import struct
 
 next_client_id = 0
 
+_MEMORY_START = 0x80000000
+_MEMORY_SIZE = 0x01800000
+
+_hard_coded_memory = {
+    # Is this Prime 2 NTSC? Yes.
+    0x803AC3B0: b"!#$MetroidBuildInfo!#$Build v1.028 10/18/2004 10:44:32",
+    0x80418EB8: struct.pack(">I", 0x81000000),
+    0x81000004: b"\x3B\xFA\x3E\xFF",
+}
+
 
 def create_client_id():
     global next_client_id
@@ -10,36 +20,81 @@ def create_client_id():
     return next_client_id
 
 
-_hard_coded_reads = {
-    # Is this Prime 2 NTSC? Yes.
-    b'\x00\x01\x01\x01\x80:\xc3\xb0\x806': b"\x01!#$MetroidBuildInfo!#$Build v1.028 10/18/2004 10:44:32",
-    b'\x00\x01\x01\x01\x80A\x8e\xb8\xb0\x00\x04': b"\x01\x3B\xFA\x3E\xFF",
-}
+def create_memory() -> bytearray:
+    memory = bytearray(_MEMORY_SIZE)
+    for address, data in _hard_coded_memory.items():
+        start = address - _MEMORY_START
+        memory[start:start + len(data)] = data
+    return memory
+
+
+def _address_range(address: int, size: int) -> slice | None:
+    start = address - _MEMORY_START
+    if 0 <= start and start + size <= _MEMORY_SIZE:
+        return slice(start, start + size)
+    return None
+
+
+async def perform_request(client_id: int, memory: bytearray, reader: asyncio.StreamReader,
+                          num_ops: int, num_addresses: int) -> bytes:
+    addresses = struct.unpack(f">{num_addresses}I", await reader.readexactly(4 * num_addresses))
+    validator = bytearray(1 + (num_ops - 1) // 8)
+    read_data = b""
+
+    for i in range(num_ops):
+        op_byte = (await reader.readexactly(1))[0]
+        byte_count = 4 if op_byte & 0x20 else (await reader.readexactly(1))[0]
+        address = addresses[op_byte & 0xF]
+        if op_byte & 0x10:
+            offset = struct.unpack(">h", await reader.readexactly(2))[0]
+            pointer = _address_range(address, 4)
+            address = None if pointer is None else struct.unpack(">I", memory[pointer])[0] + offset
+
+        region = _address_range(address, byte_count) if address is not None else None
+        write_bytes = await reader.readexactly(byte_count) if op_byte & 0x40 else None
+        if region is None:
+            print(f"[{client_id: 3}] Operation {i} has an invalid address")
+            # The response always has space for all reads
+            if op_byte & 0x80:
+                read_data += b"\x00" * byte_count
+            continue
+
+        validator[i // 8] |= 1 << (i % 8)
+        if op_byte & 0x80:
+            read_data += memory[region]
+        if write_bytes is not None:
+            print(f"[{client_id: 3}] Writing {write_bytes} to {address:#x}")
+            memory[region] = write_bytes
+
+    return bytes(validator) + read_data
 
 
 async def client_handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
     client_id = create_client_id()
+    memory = create_memory()
 
     print(f"[{client_id: 3}] Client connected")
-    while True:
-        command = await reader.read(1024)
-        command_id, num_ops, num_addresses, keep_alive = struct.unpack_from(">BBBB", command)
-        print(f"[{client_id: 3}] Received request", command_id, num_ops, num_addresses, keep_alive)
-
-        await asyncio.sleep(1)
-        if command_id == 1:
-            writer.write(struct.pack(">IIII", 2, 100, 100, 4))
-        elif command_id == 0:
-            if command in _hard_coded_reads:
-                writer.write(_hard_coded_reads[command])
+    try:
+        while True:
+            # Requests may be pipelined, so read exactly one request at a time
+            command_id, num_ops, num_addresses, keep_alive = struct.unpack(">BBBB", await reader.readexactly(4))
+            print(f"[{client_id: 3}] Received request", command_id, num_ops, num_addresses, keep_alive)
+
+            if command_id == 1:
+                response = struct.pack(">IIII", 2, 100, 100, 4)
             else:
-                print(f"[{client_id: 3}] Received command: {command}")
-                writer.write(b"\x00\x00")
+                response = await perform_request(client_id, memory, reader, num_ops, num_addresses)
+
+            await asyncio.sleep(1)
+            writer.write(response)
+            await writer.drain()
+            if not bool(keep_alive):
+                break
+
+    except asyncio.IncompleteReadError:
+        print(f"[{client_id: 3}] Client disconnected")
 
-        await writer.drain()
-        if not bool(keep_alive):
-            writer.close()
-            break
+    writer.close()
 
 
 async def main():